@@ -0,0 +1,90 @@
+"""Benchmark AsyncQueue and AsyncStack against asyncio.Queue.
+
+Measures two things per structure:
+
+* handoff latency -- a consumer task is already waiting when each item is
+  pushed; the time from the push to the consumer resuming with the item is
+  averaged over all items;
+* throughput -- producer and consumer tasks move a fixed number of items
+  through a bounded structure.
+
+Usage
+-----
+    python benchmarks/bench_asyncqueue.py [--items N] [--maxsize M]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from pythondatastructures.asyncqueue import AsyncQueue, AsyncStack
+
+IMPLEMENTATIONS = (
+    ("asyncio.Queue", asyncio.Queue, "put", "get", False),
+    ("AsyncQueue", AsyncQueue, "push", "pop", True),
+    ("AsyncStack", AsyncStack, "push", "pop", True),
+)
+
+
+async def _latency(make, put_name, get_name, is_node, items: int) -> float:
+    q = make()
+    put, get = getattr(q, put_name), getattr(q, get_name)
+    ready = asyncio.Event()
+    total = 0.0
+
+    async def consume():
+        nonlocal total
+        for _ in range(items):
+            ready.set()
+            item = await get()
+            stamp = item.value if is_node else item
+            total += time.perf_counter() - stamp
+
+    consumer = asyncio.create_task(consume())
+    for _ in range(items):
+        await ready.wait()
+        ready.clear()
+        await asyncio.sleep(0)  # let the consumer park on its waiter
+        await put(time.perf_counter())
+    await consumer
+    return total / items
+
+
+async def _throughput(make, put_name, get_name, maxsize: int,
+                      items: int) -> float:
+    q = make(maxsize)
+    put, get = getattr(q, put_name), getattr(q, get_name)
+
+    async def produce():
+        for i in range(items):
+            await put(i)
+
+    async def consume():
+        for _ in range(items):
+            await get()
+
+    start = time.perf_counter()
+    await asyncio.gather(produce(), consume())
+    return items / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--maxsize", type=int, default=64)
+    args = parser.parse_args()
+
+    print(f"items = {args.items}, bounded maxsize = {args.maxsize}")
+    print(f"{'implementation':<16}{'latency (us)':>14}{'items/s':>14}")
+    for name, make, put_name, get_name, is_node in IMPLEMENTATIONS:
+        latency = asyncio.run(
+            _latency(make, put_name, get_name, is_node, args.items))
+        rate = asyncio.run(
+            _throughput(make, put_name, get_name, args.maxsize, args.items))
+        print(f"{name:<16}{latency * 1e6:>14.2f}{rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Bulk construction versus one-by-one insertion for every list type.
+
+Times ``push``/``append``/``insert_at`` in a loop against ``push_many``,
+``extend`` and ``from_iterable`` for ``stack``, ``queue``, ``advLinkedList``
+and ``LL``. One-by-one appends to ``advLinkedList`` and ``LL`` walk the
+whole list on every call, so those lists use a smaller size.
+
+Usage
+-----
+    python benchmarks/bench_bulk.py [--size N] [--walking-size N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from pythondatastructures.old import advLinkedList, queue, stack
+from pythondatastructures.old.Actual import LL
+
+
+def _one_by_one_stack(values):
+    s = stack()
+    for value in values:
+        s.push(value)
+
+
+def _one_by_one_queue(values):
+    q = queue()
+    for value in values:
+        q.push(value)
+
+
+def _one_by_one_adv(values):
+    ll = advLinkedList()
+    for value in values:
+        ll.append(value)
+
+
+def _one_by_one_ll(values):
+    ll = LL(values[0])
+    for value in values[1:]:
+        ll.append(value)
+
+
+def _timed(func, values, repeat: int = 3) -> float:
+    return min(timeit.repeat(lambda: func(values), number=1, repeat=repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--walking-size", type=int, default=3_000)
+    args = parser.parse_args()
+
+    big = list(range(args.size))
+    small = list(range(args.walking_size))
+    cases = [
+        ("stack", big, _one_by_one_stack, stack.from_iterable),
+        ("queue", big, _one_by_one_queue, queue.from_iterable),
+        ("advLinkedList", small, _one_by_one_adv,
+         advLinkedList.from_iterable),
+        ("LL", small, _one_by_one_ll, LL.from_iterable),
+    ]
+
+    print(f"{'structure':<16}{'n':>9}{'one-by-one':>13}{'bulk':>10}"
+          f"{'speedup':>9}")
+    for name, values, single, bulk in cases:
+        single_s = _timed(single, values)
+        bulk_s = _timed(bulk, values)
+        print(f"{name:<16}{len(values):>9}{single_s:>13.4f}{bulk_s:>10.4f}"
+              f"{single_s / bulk_s:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
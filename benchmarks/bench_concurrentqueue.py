@@ -0,0 +1,70 @@
+"""Benchmark ConcurrentQueue throughput under thread contention.
+
+Runs equal numbers of producer and consumer threads that move a fixed
+number of items through :class:`~pythondatastructures.concurrentqueue.
+ConcurrentQueue` and through :class:`queue.Queue`, for 1 to 16 threads on
+each side, and reports items per second. Both queues are measured
+unbounded and with a small capacity so that backpressure is exercised.
+
+Usage
+-----
+    python benchmarks/bench_concurrentqueue.py [--items N] [--maxsize M]
+"""
+
+from __future__ import annotations
+
+import argparse
+import queue
+import threading
+import time
+
+from pythondatastructures.concurrentqueue import ConcurrentQueue
+
+THREADS = (1, 2, 4, 8, 16)
+
+
+def _throughput(make, put_name: str, get_name: str, threads: int,
+                items: int) -> float:
+    q = make()
+    put, get = getattr(q, put_name), getattr(q, get_name)
+    per_thread = items // threads
+
+    def produce():
+        for i in range(per_thread):
+            put(i)
+
+    def consume():
+        for _ in range(per_thread):
+            get()
+
+    workers = [threading.Thread(target=produce) for _ in range(threads)]
+    workers += [threading.Thread(target=consume) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return per_thread * threads / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--maxsize", type=int, default=64)
+    args = parser.parse_args()
+
+    print(f"items = {args.items}, bounded maxsize = {args.maxsize}")
+    print(f"{'threads':>8}{'queue.Queue':>14}{'Concurrent':>14}"
+          f"{'Queue[max]':>14}{'Conc.[max]':>14}   (items/s)")
+    for threads in THREADS:
+        rates = []
+        for maxsize in (0, args.maxsize):
+            rates.append(_throughput(lambda: queue.Queue(maxsize), "put",
+                                     "get", threads, args.items))
+            rates.append(_throughput(lambda: ConcurrentQueue(maxsize), "push",
+                                     "pop", threads, args.items))
+        print(f"{threads:>8}" + "".join(f"{rate:>14,.0f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark cycle detection against a visited set and Floyd's method.
+
+Measures a chain of ``--tail`` nodes leading into a loop of ``--cycle``
+nodes with :func:`~pythondatastructures.traversal.detect_cycle` (Brent),
+with Floyd's method reading links the same way and with the usual set of visited
+node ids. An acyclic chain of the same size is also timed against the
+unchecked ``last``, to show what the ``safe`` modes cost on trusted input.
+Peak traced memory is taken in a separate run from the time.
+
+Usage
+-----
+    python benchmarks/bench_cycles.py [--tail N] [--cycle N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+from operator import attrgetter
+
+from pythondatastructures.nodes import SinglyLinkedNode
+from pythondatastructures.traversal import detect_cycle, last, length, nth
+
+
+def _chain(size):
+    head = tail = SinglyLinkedNode(0)
+    for value in range(1, size):
+        tail.next = SinglyLinkedNode(value)
+        tail = tail.next
+    return head, tail
+
+
+def _floyd(node, step=attrgetter("next")):
+    # Reads links through attrgetter like detect_cycle, so only the
+    # algorithms differ
+    slow = fast = node
+    while fast is not None and step(fast) is not None:
+        slow, fast = step(slow), step(step(fast))
+        if slow is fast:
+            break
+    else:
+        return None
+    slow = node
+    while slow is not fast:
+        slow, fast = step(slow), step(fast)
+    return slow
+
+
+def _visited(node):
+    seen = set()
+    while node is not None:
+        if id(node) in seen:
+            return node
+        seen.add(id(node))
+        node = node.next
+    return None
+
+
+def _measure(run):
+    """Return (seconds, peak MB) of ``run``, timed and traced separately."""
+    gc.collect()
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tail", type=int, default=300_000)
+    parser.add_argument("--cycle", type=int, default=700_000)
+    args = parser.parse_args()
+
+    head, tail = _chain(args.tail + args.cycle)
+    straight, _ = _chain(args.tail + args.cycle)
+    tail.next = nth(head, args.tail)
+
+    cases = [
+        ("cyclic: detect_cycle", lambda: detect_cycle(head)),
+        ("cyclic: Floyd", lambda: _floyd(head)),
+        ("cyclic: visited set", lambda: _visited(head)),
+        ("acyclic: last", lambda: last(straight)),
+        ("acyclic: length", lambda: length(straight)),
+        ("acyclic: visited set", lambda: _visited(straight)),
+    ]
+    print(f"tail = {args.tail}, cycle = {args.cycle}")
+    print(f"{'case':<24}{'s':>10}{'peak MB':>10}")
+    for name, run in cases:
+        seconds, peak = _measure(run)
+        print(f"{name:<24}{seconds:>10.3f}{peak:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
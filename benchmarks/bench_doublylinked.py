@@ -0,0 +1,109 @@
+"""Benchmark DoublyLinkedList against collections.deque.
+
+Times appends at both ends, removals at both ends, removing a middle
+element the caller already holds (a node for DoublyLinkedList, a value for
+deque, which has to search) and an LRU-style workload of random touches
+that move an element to the back.
+
+Usage
+-----
+    python benchmarks/bench_doublylinked.py [--size N] [--touches K]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections import deque
+
+from pythondatastructures.doublylinked import DoublyLinkedList
+
+
+def _timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _ends(size: int):
+    def dl_run():
+        dl = DoublyLinkedList()
+        append, insert, dequeue = dl.append, dl.insert, dl.dequeue
+        for value in range(size):
+            append(value)
+            insert(value)
+        for _ in range(size):
+            dequeue()
+            dequeue(True)
+
+    def deque_run():
+        d = deque()
+        for value in range(size):
+            d.append(value)
+            d.appendleft(value)
+        for _ in range(size):
+            d.pop()
+            d.popleft()
+
+    return dl_run, deque_run
+
+
+def _middle(size: int, removals: int):
+    dl = DoublyLinkedList()
+    nodes = [dl.append(value) for value in range(size)]
+    d = deque(range(size))
+    targets = random.Random(1).sample(range(size), removals)
+
+    def dl_run():
+        remove = dl.remove
+        for value in targets:
+            remove(nodes[value])
+
+    def deque_run():
+        remove = d.remove
+        for value in targets:
+            remove(value)
+
+    return dl_run, deque_run
+
+
+def _lru(size: int, touches: int):
+    rng = random.Random(2)
+    keys = [rng.randrange(size) for _ in range(touches)]
+    dl = DoublyLinkedList()
+    nodes = [dl.append(value) for value in range(size)]
+    d = deque(range(size))
+
+    def dl_run():
+        move = dl.move_to_end
+        for key in keys:
+            move(nodes[key])
+
+    def deque_run():
+        remove, append = d.remove, d.append
+        for key in keys:
+            remove(key)
+            append(key)
+
+    return dl_run, deque_run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--touches", type=int, default=2_000)
+    args = parser.parse_args()
+
+    print(f"n = {args.size}, middle removals / LRU touches = {args.touches}")
+    print(f"{'workload':<22}{'DoublyLinkedList':>18}{'deque':>12}   (s)")
+    for label, (dl_run, deque_run) in (
+        ("both ends", _ends(args.size)),
+        ("remove held element", _middle(args.size, args.touches)),
+        ("LRU move_to_end", _lru(args.size, args.touches)),
+    ):
+        print(f"{label:<22}{_timed(dl_run):>18.4f}{_timed(deque_run):>12.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark the cost of the instrumentation probe on old.Actual.LL.
+
+Runs the same workload (building a list through ``Edge`` writes, iterating
+it and truncating it) with the probe disabled, enabled inside
+``collect()``, and enabled with a callback subscribed to every event.
+
+Usage
+-----
+    python benchmarks/bench_instrumentation.py [--size N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from pythondatastructures.instrumentation import EVENTS, collect, probe
+from pythondatastructures.old.Actual import LL, Node
+
+
+def _workload(size: int) -> None:
+    ll = LL(0)
+    tail = ll.root
+    for value in range(1, size):
+        tail.nxt = Node(value)
+        tail = tail.nxt
+    for _ in ll:
+        pass
+    ll.root.nxt = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    def timed() -> float:
+        return min(timeit.repeat(lambda: _workload(args.size), number=1,
+                                 repeat=args.repeat))
+
+    disabled = timed()
+    with collect() as stats:
+        collected = timed()
+    calls = []
+
+    def callback(event, subject, count):
+        calls.append(event)
+
+    for event in EVENTS:
+        probe.subscribe(event, callback)
+    with collect():
+        with_callbacks = timed()
+    for event in EVENTS:
+        probe.unsubscribe(event, callback)
+
+    print(f"n = {args.size}, best of {args.repeat}")
+    print(f"{'probe':<18}{'seconds':>10}{'x disabled':>12}")
+    for label, seconds in (("disabled", disabled), ("collect()", collected),
+                           ("callbacks", with_callbacks)):
+        print(f"{label:<18}{seconds:>10.4f}{seconds / disabled:>12.2f}")
+    per_run = {event: count // args.repeat for event, count in stats.items()}
+    print(f"events per run: {per_run}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark iteration over every list implementation against ``list``.
+
+Times a full ``for`` loop over each structure's iterator and reports the
+cost per element and its ratio to iterating a built-in list of the same
+values. Each measurement is the best of a few repeats.
+
+Usage
+-----
+    python benchmarks/bench_iteration.py [--size N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from pythondatastructures.linkedlist import LinkedList
+from pythondatastructures.nodes import SinglyLinkedNode
+from pythondatastructures.old.Actual import LL
+from pythondatastructures.traversal import walk
+from pythondatastructures.unrolled import UnrolledLinkedList
+
+
+def _chain(size: int) -> SinglyLinkedNode:
+    head = tail = SinglyLinkedNode(0)
+    for value in range(1, size):
+        tail.next = SinglyLinkedNode(value)
+        tail = tail.next
+    return head
+
+
+def _consume(iterable) -> None:
+    for _ in iterable:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    size = args.size
+
+    values = list(range(size))
+    head = _chain(size)
+    ll = LL.from_iterable(values)
+    array = LinkedList(values)
+    unrolled = UnrolledLinkedList(values)
+
+    cases = (
+        ("list", lambda: values),
+        ("SinglyLinkedNode iter", lambda: head),
+        ("SinglyLinkedNode values", head.values),
+        ("traversal.walk", lambda: walk(head)),
+        ("LL iter", lambda: ll),
+        ("LL values", ll.values),
+        ("LL reversed", lambda: reversed(ll)),
+        ("LinkedList", lambda: array),
+        ("UnrolledLinkedList", lambda: unrolled),
+    )
+    rows = []
+    for name, make in cases:
+        best = min(timeit.repeat(lambda: _consume(make()), number=1,
+                                 repeat=args.repeat))
+        rows.append((name, best / size))
+
+    baseline = rows[0][1]
+    print(f"n = {size}, best of {args.repeat}")
+    print(f"{'iterator':<26}{'ns/elem':>10}{'x list':>10}")
+    for name, per_elem in rows:
+        print(f"{name:<26}{per_elem * 1e9:>10.1f}{per_elem / baseline:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
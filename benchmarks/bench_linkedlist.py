@@ -0,0 +1,112 @@
+"""Benchmark the array-backed LinkedList against pointer-based nodes.
+
+Compares :class:`~pythondatastructures.linkedlist.LinkedList` with a chain of
+:class:`~pythondatastructures.nodes.SinglyLinkedNode` objects for appending,
+full traversal, popping from the front and traced memory per element.
+
+Usage
+-----
+    python benchmarks/bench_linkedlist.py [--size N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from pythondatastructures.linkedlist import LinkedList
+from pythondatastructures.nodes import SinglyLinkedNode
+
+
+def _build_nodes(size: int) -> SinglyLinkedNode:
+    head = tail = SinglyLinkedNode(0)
+    for value in range(1, size):
+        node = SinglyLinkedNode(value)
+        tail.next = node
+        tail = node
+    return head
+
+
+def _build_array(size: int) -> LinkedList:
+    ll = LinkedList()
+    append = ll.append
+    for value in range(size):
+        append(value)
+    return ll
+
+
+def _walk_nodes(head: SinglyLinkedNode) -> int:
+    count = 0
+    while head is not None:
+        count += 1
+        head = head.next
+    return count
+
+
+def _walk_array(ll: LinkedList) -> int:
+    count = 0
+    for _ in ll:
+        count += 1
+    return count
+
+
+def _drain_nodes(head: SinglyLinkedNode) -> None:
+    while head.next is not None:
+        head.pop()
+
+
+def _drain_array(ll: LinkedList) -> None:
+    pop = ll.pop
+    while len(ll):
+        pop()
+
+
+def _timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def _traced_bytes(build, size: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        structure = build(size)
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del structure
+    return current / size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=200_000)
+    args = parser.parse_args()
+    size = args.size
+
+    rows = []
+    for name, build, walk, drain in (
+        ("SinglyLinkedNode", _build_nodes, _walk_nodes, _drain_nodes),
+        ("LinkedList", _build_array, _walk_array, _drain_array),
+    ):
+        start = time.perf_counter()
+        structure = build(size)
+        build_s = time.perf_counter() - start
+        walk_s = _timed(walk, structure)
+        drain_s = _timed(drain, structure)
+        rows.append((name, build_s, walk_s, drain_s,
+                     _traced_bytes(build, size)))
+
+    print(f"n = {size}")
+    print(f"{'implementation':<20}{'append':>10}{'iterate':>10}"
+          f"{'pop':>10}{'bytes/elem':>12}")
+    for name, build_s, walk_s, drain_s, per_elem in rows:
+        print(f"{name:<20}{build_s:>10.4f}{walk_s:>10.4f}"
+              f"{drain_s:>10.4f}{per_elem:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Per-node memory benchmark for the linked node implementations.
+
+Allocates a chain of nodes for each implementation under ``tracemalloc`` and
+reports the number of bytes attributed to each node. Values are created
+before tracing starts so that only the node objects themselves are counted.
+
+Usage
+-----
+    python benchmarks/bench_memory.py [--size N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from typing import Callable, Dict, List
+
+from pythondatastructures.nodes import SinglyLinkedNode
+from pythondatastructures.old import llnode
+
+
+def _chain_llnode(values: List[int]) -> object:
+    head = prev = llnode(values[0])
+    for value in values[1:]:
+        node = llnode(value)
+        prev.right = node
+        node.left = prev
+        prev = node
+    return head
+
+
+def _chain_actual_node(values: List[int]) -> object:
+    from pythondatastructures.old.Actual import Node
+
+    head = prev = Node(values[0])
+    for value in values[1:]:
+        node = Node(value)
+        prev.nxt = node
+        prev = node
+    return head
+
+
+def _chain_slotted_node(values: List[int]) -> object:
+    head = prev = SinglyLinkedNode(values[0])
+    for value in values[1:]:
+        node = SinglyLinkedNode(value)
+        prev.next = node
+        prev = node
+    return head
+
+
+IMPLEMENTATIONS: Dict[str, Callable[[List[int]], object]] = {
+    "old.linkedlist.llnode": _chain_llnode,
+    "old.Actual.Node": _chain_actual_node,
+    "nodes.SinglyLinkedNode": _chain_slotted_node,
+}
+
+
+def bytes_per_node(build: Callable[[List[int]], object], size: int) -> float:
+    """Measure the traced allocation per node for one implementation.
+
+    Parameters
+    ----------
+    build : callable
+        Function that links ``values`` into a chain and returns its head.
+    size : int
+        Number of nodes to allocate.
+
+    Returns
+    -------
+    float
+        Bytes allocated per node while building the chain.
+    """
+    values = list(range(size))
+    gc.collect()
+    tracemalloc.start()
+    try:
+        head = build(values)
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del head
+    return current / size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'implementation':<28}{'bytes/node':>12}")
+    for name, build in IMPLEMENTATIONS.items():
+        try:
+            per_node = bytes_per_node(build, args.size)
+        except ImportError as exc:
+            print(f"{name:<28}{'skipped':>12}  ({exc})")
+            continue
+        print(f"{name:<28}{per_node:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
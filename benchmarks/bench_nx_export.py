@@ -0,0 +1,43 @@
+"""Benchmark exporting old.Actual chains to a networkx DiGraph.
+
+Builds chains of growing length with ``LL.from_iterable`` and times
+``Node.nx_node`` (keyed by nodes) and ``LL.nx_graph`` (keyed by values).
+
+Usage
+-----
+    python benchmarks/bench_nx_export.py [--sizes N ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import networkx as nx
+
+from pythondatastructures.old.Actual import LL
+
+
+def _timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[10**4, 10**5, 10**6])
+    args = parser.parse_args()
+
+    print(f"{'nodes':>10}{'nx_node':>12}{'nx_graph':>12}{'us/node':>10}")
+    for size in args.sizes:
+        ll = LL.from_iterable(range(size))
+        node_s = _timed(lambda: ll.root.nx_node(nx.DiGraph()))
+        graph_s = _timed(ll.nx_graph)
+        print(f"{size:>10}{node_s:>12.3f}{graph_s:>12.3f}"
+              f"{graph_s / size * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
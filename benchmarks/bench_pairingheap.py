@@ -0,0 +1,134 @@
+"""Benchmark PairingHeap against heapq on scheduling traces.
+
+Three traces, each over ``--ops`` operations with ``--pending`` tasks kept
+queued. "hold" is the classic event-scheduler loop: pop the next task and
+schedule it again at a later time. "drain" bulk-loads every task and then
+pops them all. "reschedule" mixes the hold loop with moving random queued
+tasks earlier. heapq has no decrease-key, so its reschedule pushes a new
+entry and skips the stale one when it is popped; the pairing heap lowers
+the priority of the held handle in place.
+
+heapq entries are ``(time, serial, task)`` tuples so that ties never
+compare tasks.
+
+Usage
+-----
+    python benchmarks/bench_pairingheap.py [--ops N] [--pending P]
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import random
+import time
+
+from pythondatastructures.pairingheap import PairingHeap
+
+
+def _timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _hold_heapq(delays, pending):
+    def run():
+        heap = [(delays[i], i, i) for i in range(pending)]
+        heapq.heapify(heap)
+        for serial in range(pending, len(delays)):
+            now, _, task = heapq.heappop(heap)
+            heapq.heappush(heap, (now + delays[serial], serial, task))
+    return run
+
+
+def _hold_pairing(delays, pending):
+    def run():
+        heap = PairingHeap()
+        for i in range(pending):
+            heap.push(i, delays[i])
+        for serial in range(pending, len(delays)):
+            now = heap.peek_node().priority
+            heap.push(heap.pop(), now + delays[serial])
+    return run
+
+
+def _drain_heapq(delays):
+    def run():
+        heap = [(delay, serial, serial) for serial, delay in enumerate(delays)]
+        heapq.heapify(heap)
+        while heap:
+            heapq.heappop(heap)
+    return run
+
+
+def _drain_pairing(delays):
+    def run():
+        heap = PairingHeap(range(len(delays)), key=delays.__getitem__)
+        while heap.pop() is not None:
+            pass
+    return run
+
+
+def _reschedule_heapq(delays, picks, pending):
+    def run():
+        heap = [(delays[i], i, i) for i in range(pending)]
+        heapq.heapify(heap)
+        current = {i: (delays[i], i) for i in range(pending)}
+        for serial in range(pending, len(delays)):
+            if serial % 2:
+                task = picks[serial] % pending
+                when, _ = current[task]
+                current[task] = (when / 2, serial)
+                heapq.heappush(heap, (when / 2, serial, task))
+                continue
+            while True:
+                now, stamp, task = heapq.heappop(heap)
+                if current[task] == (now, stamp):
+                    break
+            current[task] = (now + delays[serial], serial)
+            heapq.heappush(heap, (now + delays[serial], serial, task))
+    return run
+
+
+def _reschedule_pairing(delays, picks, pending):
+    def run():
+        heap = PairingHeap()
+        handles = [heap.push(i, delays[i]) for i in range(pending)]
+        for serial in range(pending, len(delays)):
+            if serial % 2:
+                node = handles[picks[serial] % pending]
+                heap.decrease_key(node, node.priority / 2)
+                continue
+            now = heap.peek_node().priority
+            task = heap.pop()
+            handles[task] = heap.push(task, now + delays[serial])
+    return run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=500_000)
+    parser.add_argument("--pending", type=int, default=10_000)
+    args = parser.parse_args()
+    rng = random.Random(0)
+    delays = [rng.expovariate(1.0) for _ in range(args.ops)]
+    picks = [rng.randrange(args.ops) for _ in range(args.ops)]
+    pending = args.pending
+
+    rows = [
+        ("hold", _timed(_hold_heapq(delays, pending)),
+         _timed(_hold_pairing(delays, pending))),
+        ("drain", _timed(_drain_heapq(delays)),
+         _timed(_drain_pairing(delays))),
+        ("reschedule", _timed(_reschedule_heapq(delays, picks, pending)),
+         _timed(_reschedule_pairing(delays, picks, pending))),
+    ]
+    print(f"ops = {args.ops}, pending = {pending}")
+    print(f"{'trace':<12}{'heapq s':>10}{'pairing s':>11}{'ratio':>8}")
+    for name, base, pairing in rows:
+        print(f"{name:<12}{base:>10.3f}{pairing:>11.3f}{pairing / base:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Benchmark opening and reading MappedLinkedList files of growing size.
+
+For each size a list file is built once, then the benchmark times
+reopening it (which only reads the header), reading the first value,
+reading the last value, and iterating over every value.
+
+Usage
+-----
+    python benchmarks/bench_persistent.py [--sizes N ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+from pythondatastructures.persistent import MappedLinkedList
+
+
+def _timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[10**4, 10**5, 10**6])
+    args = parser.parse_args()
+
+    print(f"{'records':>10}{'build':>10}{'open':>12}{'first':>12}"
+          f"{'last':>12}{'iterate':>10}{'file MB':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            path = os.path.join(directory, f"{size}.pds")
+            with MappedLinkedList(path, capacity=size) as ml:
+                append = ml.append
+                build_s = _timed(lambda: [append(v) for v in range(size)])
+
+            start = time.perf_counter()
+            ml = MappedLinkedList(path)
+            open_s = time.perf_counter() - start
+            first_s = _timed(lambda: ml.valAtIndex(0))
+            last_s = _timed(lambda: ml.valAtIndex(size - 1))
+            iterate_s = _timed(lambda: sum(1 for _ in ml))
+            ml.close()
+            megabytes = os.path.getsize(path) / 2**20
+            print(f"{size:>10}{build_s:>10.3f}{open_s:>12.2e}"
+                  f"{first_s:>12.2e}{last_s:>12.2e}{iterate_s:>10.3f}"
+                  f"{megabytes:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
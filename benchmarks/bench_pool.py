@@ -0,0 +1,86 @@
+"""Benchmark node recycling with NodePool under steady-state churn.
+
+``old.linkedlist.stack`` and ``queue`` hold ``--resident`` items while
+``--rounds`` bursts push and then pop ``--burst`` items each. Every
+variant pops with ``popval``. Without a pool each push creates an
+``llnode`` and each pop drops one. With a pool whose cap covers the
+burst, only the first burst allocates. The table reports the nodes
+created, the garbage collections that ran during the churn and the time.
+
+``llnode`` instances are tracked by the cyclic collector, which runs
+when allocations outnumber deallocations by the generation-0 threshold
+(700 by default). The default burst is above it. Bursts shorter than it
+trigger no collections with or without a pool; they still allocate.
+
+Usage
+-----
+    python benchmarks/bench_pool.py [--resident N] [--burst B] [--rounds R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+
+from pythondatastructures.old import llnode, queue, stack
+from pythondatastructures.pool import NodePool
+
+
+class _Collections:
+    """Count the garbage collections that start while active."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, phase, info) -> None:
+        if phase == "start":
+            self.count += 1
+
+    def __enter__(self):
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        gc.callbacks.remove(self)
+
+
+def _churn(structure, bursts, burst):
+    push, popval = structure.push, structure.popval
+    for _ in range(bursts):
+        for value in range(burst):
+            push(value)
+        for _ in range(burst):
+            popval()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resident", type=int, default=10_000)
+    parser.add_argument("--burst", type=int, default=4096)
+    parser.add_argument("--rounds", type=int, default=250)
+    args = parser.parse_args()
+    pushes = args.rounds * args.burst
+
+    print(f"resident = {args.resident}, {args.rounds} bursts of "
+          f"{args.burst} ({pushes} pushes)")
+    print(f"{'structure':<16}{'nodes created':>15}{'gc runs':>9}{'s':>9}")
+    for kind in (stack, queue):
+        for pooled in (False, True):
+            pool = NodePool(llnode, cap=args.burst) if pooled else None
+            structure = kind.from_iterable(range(args.resident), pool=pool)
+            if pool is not None:
+                pool.reset_stats()
+            gc.collect()
+            with _Collections() as collections:
+                start = time.perf_counter()
+                _churn(structure, args.rounds, args.burst)
+                elapsed = time.perf_counter() - start
+            created = pushes if pool is None else pool.misses
+            name = f"{kind.__name__}{' + pool' if pooled else ''}"
+            print(f"{name:<16}{created:>15}{collections.count:>9}"
+                  f"{elapsed:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
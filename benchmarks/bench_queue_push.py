@@ -0,0 +1,43 @@
+"""Per-push cost of old.linkedlist.queue as the queue grows.
+
+Fills queues of increasing size one ``push`` at a time and reports the
+time per push. ``push`` links after the tail pointer, so the cost per
+push stays flat; a push that walked to the end of the list would grow
+linearly with the size.
+
+Usage
+-----
+    python benchmarks/bench_queue_push.py [--sizes N [N ...]]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from pythondatastructures.old import queue
+
+
+def _fill(size: int) -> float:
+    q = queue()
+    push = q.push
+    start = time.perf_counter()
+    for value in range(size):
+        push(value)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[10**4, 10**5, 10**6])
+    args = parser.parse_args()
+
+    print(f"{'size':>10}{'s':>10}{'ns/push':>10}")
+    for size in args.sizes:
+        elapsed = _fill(size)
+        print(f"{size:>10}{elapsed:>10.3f}{elapsed / size * 1e9:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
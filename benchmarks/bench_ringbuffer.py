@@ -0,0 +1,98 @@
+"""Benchmark RingBuffer against deque(maxlen=...) and old.linkedlist.queue.
+
+Three workloads over ``--items`` pushes into a buffer of ``--capacity``
+slots: steady push/pop, pushing into a full buffer that evicts its oldest
+item, and pushing batches that are removed with one bulk drain. The
+unbounded ``old.linkedlist.queue`` is included for the push/pop case.
+
+Usage
+-----
+    python benchmarks/bench_ringbuffer.py [--items N] [--capacity C]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections import deque
+
+from pythondatastructures.old import queue as llqueue
+from pythondatastructures.ringbuffer import RingBuffer
+
+
+def _timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _push_pop(push, pop, items):
+    def run():
+        for value in range(items):
+            push(value)
+            pop()
+    return run
+
+
+def _overflow(push, items):
+    def run():
+        for value in range(items):
+            push(value)
+    return run
+
+
+def _batches(push, drain, items, batch):
+    def run():
+        for start in range(0, items, batch):
+            for value in range(start, start + batch):
+                push(value)
+            drain()
+    return run
+
+
+def _deque_drain(d):
+    def drain():
+        items = list(d)
+        d.clear()
+        return items
+    return drain
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--capacity", type=int, default=1024)
+    args = parser.parse_args()
+    items, capacity = args.items, args.capacity
+
+    rb = RingBuffer(capacity, overflow="drop_oldest")
+    d = deque(maxlen=capacity)
+    q = llqueue()
+    rows = [
+        ("push/pop",
+         _timed(_push_pop(rb.push, rb.pop, items)),
+         _timed(_push_pop(d.append, d.popleft, items)),
+         _timed(_push_pop(q.push, q.pop, items))),
+    ]
+    rb.extend(range(capacity))
+    d.extend(range(capacity))
+    rows.append(("push when full",
+                 _timed(_overflow(rb.push, items)),
+                 _timed(_overflow(d.append, items)), None))
+    rb.clear()
+    d.clear()
+    rows.append(("push + drain",
+                 _timed(_batches(rb.push, rb.drain, items, capacity)),
+                 _timed(_batches(d.append, _deque_drain(d), items, capacity)),
+                 None))
+
+    print(f"items = {items}, capacity = {capacity}")
+    print(f"{'workload':<16}{'RingBuffer':>12}{'deque':>10}"
+          f"{'old.queue':>12}   (s)")
+    for label, ring_s, deque_s, queue_s in rows:
+        queue_col = f"{queue_s:>12.3f}" if queue_s is not None else f"{'-':>12}"
+        print(f"{label:<16}{ring_s:>12.3f}{deque_s:>10.3f}{queue_col}")
+
+
+if __name__ == "__main__":
+    main()
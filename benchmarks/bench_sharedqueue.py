@@ -0,0 +1,83 @@
+"""Benchmark SharedRingQueue against multiprocessing.Queue.
+
+A producer process sends a fixed number of items to the parent, which
+consumes them. Items are either raw payloads of ``--payload`` bytes or
+``(int, float)`` records. The shared ring is polled without a lock (one
+producer, one consumer); ``multiprocessing.Queue`` pickles each item
+through a pipe.
+
+Usage
+-----
+    python benchmarks/bench_sharedqueue.py [--items N] [--payload B]
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import queue
+import time
+
+from pythondatastructures.sharedqueue import SharedRingQueue
+
+
+def _ring_producer(ring, items, item):
+    push = ring.push
+    for _ in range(items):
+        while True:
+            try:
+                push(item)
+                break
+            except queue.Full:
+                pass
+    ring.close()
+
+
+def _mp_producer(q, items, item):
+    put = q.put
+    for _ in range(items):
+        put(item)
+
+
+def _run(ctx, producer, channel, items, item, pop) -> float:
+    process = ctx.Process(target=producer, args=(channel, items, item))
+    start = time.perf_counter()
+    process.start()
+    received = 0
+    while received < items:
+        if pop() is not None:
+            received += 1
+    elapsed = time.perf_counter() - start
+    process.join()
+    return items / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--payload", type=int, default=64)
+    parser.add_argument("--slots", type=int, default=4096)
+    args = parser.parse_args()
+    ctx = multiprocessing.get_context()
+
+    print(f"items = {args.items}, payload = {args.payload} bytes, "
+          f"slots = {args.slots}")
+    print(f"{'record':<10}{'multiprocessing.Queue':>24}"
+          f"{'SharedRingQueue':>18}   (items/s)")
+    for label, item, ring_args in (
+        ("bytes", b"x" * args.payload,
+         {"slot_size": args.payload + 4}),
+        ("struct", (42, 0.5), {"fmt": "<qd"}),
+    ):
+        mp_queue = ctx.Queue()
+        mp_rate = _run(ctx, _mp_producer, mp_queue, args.items, item,
+                       mp_queue.get)
+        with SharedRingQueue(slots=args.slots, **ring_args) as ring:
+            ring_rate = _run(ctx, _ring_producer, ring, args.items, item,
+                             ring.pop)
+            ring.unlink()
+        print(f"{label:<10}{mp_rate:>24,.0f}{ring_rate:>18,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Random positional reads on advLinkedList with and without a SkipIndex.
+
+Builds the same list twice, once plain and once with ``skipindex=True``,
+then times ``valAtIndex`` at uniformly random positions and ``append``.
+
+Usage
+-----
+    python benchmarks/bench_skipindex.py [--size N] [--reads R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from pythondatastructures.old import advLinkedList, llnode
+
+
+def _build(size: int, skipindex: bool) -> advLinkedList:
+    ll = advLinkedList(skipindex=skipindex)
+    if skipindex:
+        for value in range(size):
+            ll.append(value)
+        return ll
+    # Plain append walks the whole list, so link the chain directly.
+    ll.root = tail = llnode(0)
+    for value in range(1, size):
+        node = llnode(value)
+        tail.right = node
+        node.left = tail
+        tail = node
+    return ll
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--reads", type=int, default=2_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    positions = [rng.randrange(args.size) for _ in range(args.reads)]
+
+    print(f"n = {args.size}, {args.reads} random reads, 100 appends")
+    print(f"{'variant':<12}{'us/read':>12}{'us/append':>12}")
+    for name, skipindex in (("plain", False), ("skipindex", True)):
+        ll = _build(args.size, skipindex)
+        start = time.perf_counter()
+        for index in positions:
+            ll.valAtIndex(index)
+        read_us = (time.perf_counter() - start) / args.reads * 1e6
+        start = time.perf_counter()
+        for value in range(100):
+            ll.append(value)
+        append_us = (time.perf_counter() - start) / 100 * 1e6
+        print(f"{name:<12}{read_us:>12.1f}{append_us:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark in-place linked-list sorting against copy-and-sorted.
+
+For each structure, times sorting random values in place with ``sort`` and
+the current workaround of copying the values out, calling ``sorted`` and
+rebuilding the structure. Peak traced memory of each approach is reported
+next to the time.
+
+Usage
+-----
+    python benchmarks/bench_sorting.py [--size N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from pythondatastructures.doublylinked import DoublyLinkedList
+from pythondatastructures.linkedlist import LinkedList
+from pythondatastructures.old import advLinkedList
+from pythondatastructures.old.Actual import LL
+
+
+def _measure(build, run):
+    """Return (seconds, peak MB) of ``run``, each on a fresh structure.
+
+    Time and memory are taken in separate runs, since tracing slows down
+    every allocation.
+    """
+    structure = build()
+    gc.collect()
+    start = time.perf_counter()
+    run(structure)
+    elapsed = time.perf_counter() - start
+    structure = build()
+    gc.collect()
+    tracemalloc.start()
+    run(structure)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def _adv(values):
+    adv = advLinkedList()
+    adv.extend(values)
+    return adv
+
+
+def _adv_copy(adv):
+    values = []
+    node = adv.root
+    while node is not None:
+        values.append(node.value)
+        node = node.right
+    adv.root = None
+    adv.extend(sorted(values))
+
+
+def _ll_copy(ll):
+    values = sorted(ll.values())
+    ll.__init__(values[0])
+    ll.extend(values[1:])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=200_000)
+    args = parser.parse_args()
+    values = [random.random() for _ in range(args.size)]
+
+    cases = (
+        ("LinkedList", lambda: LinkedList(values), lambda s: s.sort(),
+         lambda s: s.__init__(sorted(s))),
+        ("DoublyLinkedList", lambda: DoublyLinkedList(values),
+         lambda s: s.sort(), lambda s: s.__init__(sorted(s))),
+        ("old.advLinkedList", lambda: _adv(values), lambda s: s.sort(),
+         _adv_copy),
+        ("old.Actual.LL", lambda: LL.from_iterable(values),
+         lambda s: s.sort(), _ll_copy),
+    )
+    print(f"n = {args.size} random floats")
+    print(f"{'structure':<20}{'sort s':>10}{'peak MB':>10}"
+          f"{'copy s':>10}{'peak MB':>10}")
+    for name, build, in_place, copy in cases:
+        sort_s, sort_mb = _measure(build, in_place)
+        copy_s, copy_mb = _measure(build, copy)
+        print(f"{name:<20}{sort_s:>10.3f}{sort_mb:>10.1f}"
+              f"{copy_s:>10.3f}{copy_mb:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Per-hop cost of recursive versus iterative chain traversal.
+
+Times the recursive traversal that ``llnode.print``, ``indexOfVal_`` and
+``Node.idx``/``Node.get`` used to perform against the shared iterative
+primitives in :mod:`pythondatastructures.traversal`. Recursive variants are
+only measured below the interpreter recursion limit; the iterative
+primitives are also timed on a long chain.
+
+Usage
+-----
+    python benchmarks/bench_traversal.py [--short N] [--long N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from pythondatastructures.old import llnode
+from pythondatastructures.old.Actual import Node
+from pythondatastructures.traversal import find, last
+
+
+def _llnode_chain(size: int) -> llnode:
+    head = tail = llnode(0)
+    for value in range(1, size):
+        tail.right = llnode(value)
+        tail = tail.right
+    return head
+
+
+def _actual_chain(size: int):
+    head = tail = Node(0)
+    for value in range(1, size):
+        node = Node(value)
+        tail.nxt = node
+        tail = node
+    return head, tail
+
+
+def _recursive_index(node, value, count=0):
+    # Former advLinkedList.indexOfVal_
+    if node.value == value:
+        return count
+    if node.right:
+        return _recursive_index(node.right, value, count + 1)
+    return -1
+
+
+def _recursive_idx(node):
+    # Former Node.idx
+    if node.prev is None:
+        return 0
+    return _recursive_idx(node.prev) + 1
+
+
+def _recursive_get(node, value):
+    # Former Node.get
+    if value == node.value:
+        return node
+    if node.nxt is None:
+        return None
+    return _recursive_get(node.nxt, value)
+
+
+def _per_hop_ns(stmt, hops: int, repeat: int) -> float:
+    best = min(timeit.repeat(stmt, number=1, repeat=repeat))
+    return best / hops * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--short", type=int, default=900)
+    parser.add_argument("--long", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    short = args.short
+    head = _llnode_chain(short)
+    root, tail = _actual_chain(short)
+    target = short - 1
+
+    cases = [
+        ("llnode find (recursive)",
+         lambda: _recursive_index(head, target), short),
+        ("llnode find (iterative)",
+         lambda: find(head, target, "right"), short),
+        ("Node.idx (recursive)", lambda: _recursive_idx(tail), short),
+        ("Node.idx (iterative)", lambda: tail.idx, short),
+        ("Node.get (recursive)",
+         lambda: _recursive_get(root, target), short),
+        ("Node.get (iterative)", lambda: root.get(target), short),
+    ]
+
+    long_head = _llnode_chain(args.long)
+    _, long_tail = _actual_chain(args.long)
+    cases += [
+        (f"llnode last n={args.long}",
+         lambda: last(long_head, "right"), args.long),
+        (f"Node.idx n={args.long}", lambda: long_tail.idx, args.long),
+    ]
+
+    print(f"{'case':<32}{'ns/hop':>10}")
+    for name, stmt, hops in cases:
+        repeat = args.repeat if hops == short else 3
+        print(f"{name:<32}{_per_hop_ns(stmt, hops, repeat):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
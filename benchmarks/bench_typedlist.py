@@ -0,0 +1,67 @@
+"""Benchmark TypedList aggregates and NumPy conversion against node lists.
+
+Compares summing, taking the maximum, finding a value near the end and
+converting to a NumPy array for a ``TypedList`` and an ``advLinkedList``
+of the same integers. The node list is walked in Python; the typed list
+runs each operation over its buffer in C.
+
+Usage
+-----
+    python benchmarks/bench_typedlist.py [--size N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from pythondatastructures.old import advLinkedList
+from pythondatastructures.traversal import walk
+from pythondatastructures.typedlist import TypedList
+
+
+def _timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _node_values(adv):
+    return (node.value for node in walk(adv.root, "right"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+    size = args.size
+
+    adv = advLinkedList()
+    adv.extend(range(size))
+    tl = TypedList("q", range(size))
+    target = size - 10
+
+    cases = (
+        ("sum", lambda: sum(_node_values(adv)), tl.sum),
+        ("max", lambda: max(_node_values(adv)), tl.max),
+        ("index", lambda: adv.indexOfVal(target), lambda: tl.index(target)),
+        ("to_numpy",
+         lambda: np.fromiter(_node_values(adv), dtype=np.int64, count=size),
+         tl.to_numpy),
+        ("from_numpy", lambda: advLinkedList().extend(np.arange(size)),
+         lambda: TypedList.from_numpy(np.arange(size))),
+    )
+    print(f"n = {size}")
+    print(f"{'operation':<12}{'advLinkedList':>16}{'TypedList':>12}"
+          f"{'speedup':>10}")
+    for name, nodes, typed in cases:
+        node_s = _timed(nodes)
+        typed_s = _timed(typed)
+        print(f"{name:<12}{node_s:>16.4f}{typed_s:>12.4f}"
+              f"{node_s / typed_s:>10.0f}x")
+
+
+if __name__ == "__main__":
+    main()
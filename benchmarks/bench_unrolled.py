@@ -0,0 +1,131 @@
+"""Benchmark the unrolled linked list against one-node-per-element lists.
+
+Compares :class:`~pythondatastructures.unrolled.UnrolledLinkedList` at a few
+block sizes with :class:`~pythondatastructures.linkedlist.LinkedList`, a
+chain of :class:`~pythondatastructures.nodes.SinglyLinkedNode` objects and
+the built-in list for appending, full iteration, positional access and
+traced memory per element.
+
+Usage
+-----
+    python benchmarks/bench_unrolled.py [--size N] [--lookups K]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from pythondatastructures.linkedlist import LinkedList
+from pythondatastructures.nodes import SinglyLinkedNode
+from pythondatastructures.traversal import nth, walk
+from pythondatastructures.unrolled import UnrolledLinkedList
+
+
+def _build_nodes(size: int) -> SinglyLinkedNode:
+    head = tail = SinglyLinkedNode(0)
+    for value in range(1, size):
+        node = SinglyLinkedNode(value)
+        tail.next = node
+        tail = node
+    return head
+
+
+def _build_array(size: int) -> LinkedList:
+    ll = LinkedList()
+    append = ll.append
+    for value in range(size):
+        append(value)
+    return ll
+
+
+def _unrolled(block_size: int):
+    def build(size: int) -> UnrolledLinkedList:
+        ul = UnrolledLinkedList(block_size=block_size)
+        append = ul.append
+        for value in range(size):
+            append(value)
+        return ul
+    return build
+
+
+def _iterate(structure) -> int:
+    iterable = walk(structure) if isinstance(structure, SinglyLinkedNode) \
+        else structure
+    count = 0
+    for _ in iterable:
+        count += 1
+    return count
+
+
+def _lookup(structure, positions) -> None:
+    if isinstance(structure, SinglyLinkedNode):
+        for position in positions:
+            nth(structure, position)
+    elif isinstance(structure, LinkedList):
+        for position in positions:
+            for i, _ in enumerate(structure):
+                if i == position:
+                    break
+    else:
+        for position in positions:
+            structure[position]
+
+
+def _timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def _traced_bytes(build, size: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        structure = build(size)
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del structure
+    return current / size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--lookups", type=int, default=200)
+    args = parser.parse_args()
+    size = args.size
+    rng = random.Random(0)
+    positions = [rng.randrange(size) for _ in range(args.lookups)]
+
+    rows = []
+    for name, build in (
+        ("list", lambda n: list(range(n))),
+        ("SinglyLinkedNode", _build_nodes),
+        ("LinkedList", _build_array),
+        ("Unrolled[16]", _unrolled(16)),
+        ("Unrolled[64]", _unrolled(64)),
+        ("Unrolled[256]", _unrolled(256)),
+    ):
+        start = time.perf_counter()
+        structure = build(size)
+        build_s = time.perf_counter() - start
+        iterate_s = _timed(_iterate, structure)
+        lookup_s = _timed(_lookup, structure, positions) / len(positions)
+        rows.append((name, build_s, iterate_s, lookup_s,
+                     _traced_bytes(build, size)))
+
+    print(f"n = {size}, lookups = {len(positions)}")
+    print(f"{'implementation':<20}{'append':>10}{'iterate':>10}"
+          f"{'index':>12}{'bytes/elem':>12}")
+    for name, build_s, iterate_s, lookup_s, per_elem in rows:
+        print(f"{name:<20}{build_s:>10.4f}{iterate_s:>10.4f}"
+              f"{lookup_s:>12.2e}{per_elem:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,468 @@
+"""Benchmark suite comparing every list implementation with list and deque.
+
+Each structure is wrapped in a small adapter that maps the common
+operations (construction, push, pop, append, index, removal and iteration)
+onto its own API. Operations a structure does not offer are skipped. Every
+measurement is reported as seconds per operation, and the whole run is
+written as JSON with sorted keys so that two runs can be diffed or compared
+with the ``compare`` subcommand.
+
+Operations that walk the list cost O(n) each, so every measurement runs in
+doubling batches until it has done ``--ops`` operations or used up
+``--budget`` seconds, whichever comes first.
+
+Usage
+-----
+    python benchmarks/suite.py run [--sizes 100 1000 ...] [--output FILE]
+    python benchmarks/suite.py compare BASELINE.json CURRENT.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from pythondatastructures.doublylinked import DoublyLinkedList
+from pythondatastructures.linkedlist import LinkedList
+from pythondatastructures.nodes import SinglyLinkedNode
+from pythondatastructures.old import advLinkedList, queue, stack
+from pythondatastructures.old.Actual import LL
+from pythondatastructures.traversal import walk
+from pythondatastructures.unrolled import UnrolledLinkedList
+
+OPERATIONS = (
+    "construction", "push", "pop", "append", "index", "removal", "iteration",
+)
+DEFAULT_SIZES = (10**2, 10**3, 10**4, 10**5, 10**6)
+
+
+class Adapter:
+    """Map the suite operations onto one structure.
+
+    Subclasses implement ``build`` and any of the single-operation methods;
+    an operation left as None is not measured for that structure.
+    """
+
+    name = ""
+    push: Optional[Callable[[Any, Any], None]] = None
+    pop: Optional[Callable[[Any], Any]] = None
+    append: Optional[Callable[[Any, Any], None]] = None
+    index: Optional[Callable[[Any, int], Any]] = None
+    removal: Optional[Callable[[Any, Any], Any]] = None
+
+    def build(self, values: List[int]) -> Any:
+        raise NotImplementedError
+
+    def iteration(self, structure: Any) -> Iterable[Any]:
+        return iter(structure)
+
+
+class ListAdapter(Adapter):
+    name = "list"
+    build = staticmethod(list)
+    push = staticmethod(list.append)
+    pop = staticmethod(list.pop)
+    append = staticmethod(list.append)
+    index = staticmethod(list.__getitem__)
+    removal = staticmethod(list.remove)
+
+
+class DequeAdapter(Adapter):
+    name = "collections.deque"
+    build = staticmethod(deque)
+    push = staticmethod(deque.append)
+    pop = staticmethod(deque.popleft)
+    append = staticmethod(deque.append)
+    index = staticmethod(deque.__getitem__)
+    removal = staticmethod(deque.remove)
+
+
+class StackAdapter(Adapter):
+    name = "old.stack"
+    build = staticmethod(stack.from_iterable)
+    push = staticmethod(stack.push)
+    pop = staticmethod(stack.pop)
+
+    def iteration(self, structure):
+        return walk(structure.root, "right")
+
+
+class QueueAdapter(StackAdapter):
+    name = "old.queue"
+    build = staticmethod(queue.from_iterable)
+    push = staticmethod(queue.push)
+    pop = staticmethod(queue.pop)
+
+
+class AdvLinkedListAdapter(Adapter):
+    name = "old.advLinkedList"
+    options: Dict[str, bool] = {}
+    append = staticmethod(advLinkedList.append)
+    index = staticmethod(advLinkedList.valAtIndex)
+    removal = staticmethod(advLinkedList.removeVal)
+
+    def build(self, values):
+        return advLinkedList.from_iterable(values, **self.options)
+
+    def iteration(self, structure):
+        return walk(structure.root, "right")
+
+
+class IndexedAdvLinkedListAdapter(AdvLinkedListAdapter):
+    name = "old.advLinkedList[indexed]"
+    options = {"skipindex": True, "valueindex": True}
+
+
+class ActualLLAdapter(Adapter):
+    name = "old.Actual.LL"
+    append = staticmethod(LL.append)
+
+    def build(self, values):
+        return LL.from_iterable(values)
+
+    def removal(self, structure, value):
+        # Unlink the node holding `value` through its predecessor; the
+        # root has none and stays in place.
+        node = structure.get(value)
+        if node.prev is not None:
+            del node.prev.nxt
+
+    def iteration(self, structure):
+        return walk(structure.root, "_nxt")
+
+
+class SinglyLinkedNodeAdapter(Adapter):
+    name = "nodes.SinglyLinkedNode"
+
+    def build(self, values):
+        # A sentinel head, so that every element can be popped.
+        head = tail = SinglyLinkedNode("head")
+        for value in values:
+            node = SinglyLinkedNode(value)
+            tail.next = node
+            tail = node
+        return head
+
+    def push(self, head, value):
+        head.insert(SinglyLinkedNode(value))
+
+    def pop(self, head):
+        return head.pop()
+
+    def append(self, head, value):
+        head.append(SinglyLinkedNode(value))
+
+    def removal(self, head, value):
+        return head.pop_value(value)
+
+    def iteration(self, head):
+        return walk(head.next)
+
+
+class LinkedListAdapter(Adapter):
+    name = "linkedlist.LinkedList"
+    build = staticmethod(LinkedList)
+    push = staticmethod(LinkedList.insert)
+    pop = staticmethod(LinkedList.pop)
+    append = staticmethod(LinkedList.append)
+    removal = staticmethod(LinkedList.pop_value)
+
+
+class DoublyLinkedAdapter(Adapter):
+    name = "doublylinked.DoublyLinkedList"
+    build = staticmethod(DoublyLinkedList)
+    push = staticmethod(DoublyLinkedList.insert)
+    pop = staticmethod(DoublyLinkedList.pop)
+    append = staticmethod(DoublyLinkedList.append)
+    removal = staticmethod(DoublyLinkedList.pop_value)
+
+
+class UnrolledAdapter(Adapter):
+    name = "unrolled.UnrolledLinkedList"
+    build = staticmethod(UnrolledLinkedList)
+    push = staticmethod(UnrolledLinkedList.insert)
+    pop = staticmethod(UnrolledLinkedList.pop)
+    append = staticmethod(UnrolledLinkedList.append)
+    index = staticmethod(UnrolledLinkedList.__getitem__)
+    removal = staticmethod(UnrolledLinkedList.pop_value)
+
+
+ADAPTERS: List[Adapter] = [
+    ListAdapter(),
+    DequeAdapter(),
+    StackAdapter(),
+    QueueAdapter(),
+    AdvLinkedListAdapter(),
+    IndexedAdvLinkedListAdapter(),
+    ActualLLAdapter(),
+    SinglyLinkedNodeAdapter(),
+    LinkedListAdapter(),
+    DoublyLinkedAdapter(),
+    UnrolledAdapter(),
+]
+# Table column for structure names: the longest name plus a gap.
+NAME_WIDTH = max(len(adapter.name) for adapter in ADAPTERS) + 2
+
+
+def _batched(run: Callable[[int], None], limit: int, budget: float):
+    """Run ``run`` in doubling batches until ``limit`` ops or ``budget`` s."""
+    done = 0
+    elapsed = 0.0
+    batch = 1
+    perf_counter = time.perf_counter
+    while done < limit and elapsed < budget:
+        batch = min(batch, limit - done)
+        start = perf_counter()
+        run(batch)
+        elapsed += perf_counter() - start
+        done += batch
+        batch *= 2
+    return elapsed, done
+
+
+def measure(
+    adapter: Adapter, operation: str, size: int, ops: int, budget: float,
+    seed: int = 0,
+) -> Optional[Dict[str, Any]]:
+    """Measure one operation of one structure at one size.
+
+    Parameters
+    ----------
+    adapter : Adapter
+        The structure under test.
+    operation : str
+        One of :data:`OPERATIONS`.
+    size : int
+        Number of elements in the structure before the operation runs.
+    ops : int
+        Maximum number of operations to time.
+    budget : float
+        Time budget in seconds for the measurement.
+    seed : int, optional
+        Seed for the positions and values picked by index and removal.
+
+    Returns
+    -------
+    dict or None
+        The result record, or None if the structure lacks the operation.
+    """
+    values = list(range(size))
+    if operation == "construction":
+        start = time.perf_counter()
+        adapter.build(values)
+        elapsed = time.perf_counter() - start
+        return _record(adapter, operation, size, elapsed, size)
+    if operation == "iteration":
+        structure = adapter.build(values)
+        start = time.perf_counter()
+        for _ in adapter.iteration(structure):
+            pass
+        elapsed = time.perf_counter() - start
+        return _record(adapter, operation, size, elapsed, size)
+
+    method = getattr(adapter, operation)
+    if method is None:
+        return None
+    structure = adapter.build(values)
+    rng = random.Random(seed)
+    limit = min(ops, size) if operation in ("pop", "removal") else ops
+    if operation == "index":
+        args = iter([rng.randrange(size) for _ in range(limit)])
+    elif operation == "removal":
+        args = iter(rng.sample(values, limit))
+    else:
+        args = iter(range(size, size + limit))
+
+    if operation == "pop":
+        def run(batch):
+            for _ in range(batch):
+                method(structure)
+    else:
+        def run(batch):
+            for _ in range(batch):
+                method(structure, next(args))
+
+    elapsed, done = _batched(run, limit, budget)
+    return _record(adapter, operation, size, elapsed, done)
+
+
+def _record(adapter, operation, size, elapsed, done):
+    return {
+        "structure": adapter.name,
+        "operation": operation,
+        "size": size,
+        "ops": done,
+        "seconds_per_op": elapsed / done if done else None,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(
+    sizes: Iterable[int],
+    structures: Optional[Iterable[str]] = None,
+    operations: Iterable[str] = OPERATIONS,
+    ops: int = 1000,
+    budget: float = 0.25,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """Run the suite and return the JSON-serialisable report.
+
+    Parameters
+    ----------
+    sizes : iterable of int
+        Structure sizes to measure.
+    structures : iterable of str, optional
+        Adapter names to include (default is every adapter).
+    operations : iterable of str, optional
+        Operations to measure (default is :data:`OPERATIONS`).
+    ops : int, optional
+        Maximum operations per measurement (default is 1000).
+    budget : float, optional
+        Time budget in seconds per measurement (default is 0.25).
+    progress : callable, optional
+        Called with each result record as soon as it is measured.
+
+    Returns
+    -------
+    dict
+        ``{"meta": {...}, "results": [...]}``.
+    """
+    wanted = set(structures) if structures is not None else None
+    results = []
+    for adapter in ADAPTERS:
+        if wanted is not None and adapter.name not in wanted:
+            continue
+        for size in sizes:
+            for operation in operations:
+                record = measure(adapter, operation, size, ops, budget)
+                if record is None:
+                    continue
+                results.append(record)
+                if progress is not None:
+                    progress(record)
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "ops": ops,
+            "budget": budget,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> List[Dict[str, Any]]:
+    """Return the measurements that got slower by more than ``threshold``.
+
+    Parameters
+    ----------
+    baseline, current : dict
+        Reports produced by :func:`run_suite`.
+    threshold : float
+        Ratio of current to baseline time above which a result counts as
+        a regression, e.g. 1.25 for 25% slower.
+
+    Returns
+    -------
+    list of dict
+        One entry per regression with both timings and their ratio.
+    """
+    def key(record):
+        return record["structure"], record["operation"], record["size"]
+
+    before = {key(r): r for r in baseline["results"]}
+    regressions = []
+    for record in current["results"]:
+        old = before.get(key(record))
+        if old is None or not old["seconds_per_op"]:
+            continue
+        ratio = record["seconds_per_op"] / old["seconds_per_op"]
+        if ratio > threshold:
+            regressions.append({
+                "structure": record["structure"],
+                "operation": record["operation"],
+                "size": record["size"],
+                "baseline": old["seconds_per_op"],
+                "current": record["seconds_per_op"],
+                "ratio": ratio,
+            })
+    return regressions
+
+
+def _print_record(record: Dict[str, Any]) -> None:
+    print(
+        f"{record['structure']:<{NAME_WIDTH}}{record['operation']:<14}"
+        f"{record['size']:>9}{record['seconds_per_op'] * 1e9:>14.1f} ns/op",
+        file=sys.stderr,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run the suite and write JSON")
+    run.add_argument("--sizes", type=int, nargs="+",
+                     default=list(DEFAULT_SIZES))
+    run.add_argument("--structures", nargs="+",
+                     choices=[a.name for a in ADAPTERS])
+    run.add_argument("--operations", nargs="+", choices=OPERATIONS,
+                     default=list(OPERATIONS))
+    run.add_argument("--ops", type=int, default=1000)
+    run.add_argument("--budget", type=float, default=0.25)
+    run.add_argument("--output", "-o", help="file to write (default stdout)")
+    run.add_argument("--quiet", "-q", action="store_true")
+
+    cmp_ = sub.add_parser("compare", help="report regressions between runs")
+    cmp_.add_argument("baseline")
+    cmp_.add_argument("current")
+    cmp_.add_argument("--threshold", type=float, default=1.25)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        report = run_suite(
+            args.sizes, args.structures, args.operations, args.ops,
+            args.budget, progress=None if args.quiet else _print_record,
+        )
+        text = json.dumps(report, indent=2, sort_keys=True) + "\n"
+        if args.output:
+            with open(args.output, "w") as handle:
+                handle.write(text)
+        else:
+            sys.stdout.write(text)
+        return 0
+
+    with open(args.baseline) as handle:
+        baseline = json.load(handle)
+    with open(args.current) as handle:
+        current = json.load(handle)
+    regressions = compare(baseline, current, args.threshold)
+    width = max([NAME_WIDTH] + [len(r["structure"]) + 2 for r in regressions])
+    for r in regressions:
+        print(f"{r['structure']:<{width}}{r['operation']:<14}{r['size']:>9}"
+              f"  {r['ratio']:.2f}x slower")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
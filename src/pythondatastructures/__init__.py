@@ -3,14 +3,65 @@ Python Data Structures Library.
 
 A collection of data structure implementations including linked lists,
 stacks, queues, and more.
+
+Submodules and the names exported here are imported on first use, so
+importing the package (or one of its subpackages) only loads what is
+actually touched.
 """
 
+from typing import TYPE_CHECKING
+
+from ._lazy import attach
+
 __version__ = "0.1.0"
 
 # Old implementations are available in the 'old' subpackage
 # from pythondatastructures.old import linkedlist, stack, queue, advLinkedList
 
 # New implementations will be added here as they are developed
-# from .linkedlist import LinkedList  # TODO: implement
+__getattr__, __dir__ = attach(
+    __name__,
+    [
+        "asyncqueue",
+        "concurrentqueue",
+        "doublylinked",
+        "instrumentation",
+        "linkedlist",
+        "nodes",
+        "old",
+        "pairingheap",
+        "persistent",
+        "pool",
+        "ringbuffer",
+        "sharedqueue",
+        "skipindex",
+        "traversal",
+        "typedlist",
+        "unrolled",
+        "valueindex",
+    ],
+    {
+        "DirectedNode": "nodes",
+        "SinglyLinkedNode": "nodes",
+        "DoublyLinkedNode": "nodes",
+        "DoublyLinkedList": "doublylinked",
+        "LinkedList": "linkedlist",
+        "UnrolledLinkedList": "unrolled",
+        "TypedList": "typedlist",
+        "RingBuffer": "ringbuffer",
+        "PairingHeap": "pairingheap",
+    },
+)
+
+if TYPE_CHECKING:
+    from .doublylinked import DoublyLinkedList
+    from .linkedlist import LinkedList
+    from .nodes import DirectedNode, DoublyLinkedNode, SinglyLinkedNode
+    from .pairingheap import PairingHeap
+    from .ringbuffer import RingBuffer
+    from .typedlist import TypedList
+    from .unrolled import UnrolledLinkedList
 
-__all__ = ["__version__"]
+__all__ = ["__version__", "DirectedNode", "SinglyLinkedNode",
+           "DoublyLinkedNode", "LinkedList", "DoublyLinkedList",
+           "UnrolledLinkedList", "TypedList", "RingBuffer", "PairingHeap"]
@@ -0,0 +1,51 @@
+"""PEP 562 lazy loading for the package ``__init__`` modules.
+
+Importing a package only runs its ``__init__``; the submodules and the
+names re-exported from them are imported on first attribute access. This
+keeps ``import pythondatastructures.old.Actual`` from loading every other
+implementation in the tree.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+
+def attach(
+    package: str, submodules: Iterable[str], names: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Return ``__getattr__`` and ``__dir__`` functions for a package.
+
+    Parameters
+    ----------
+    package : str
+        The package's ``__name__``.
+    submodules : iterable of str
+        Submodules that become attributes when first accessed.
+    names : dict
+        Maps each re-exported name to the submodule defining it.
+
+    Returns
+    -------
+    tuple
+        ``(__getattr__, __dir__)`` to assign in the package namespace.
+    """
+    submodules = frozenset(submodules)
+
+    def __getattr__(name: str) -> Any:
+        if name in submodules:
+            # The import binds the submodule on the package, so this runs once.
+            return importlib.import_module(f"{package}.{name}")
+        if name in names:
+            module = importlib.import_module(f"{package}.{names[name]}")
+            value = getattr(module, name)
+            setattr(sys.modules[package], name, value)
+            return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | submodules | set(names))
+
+    return __getattr__, __dir__
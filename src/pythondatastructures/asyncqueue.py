@@ -0,0 +1,283 @@
+"""asyncio-native queue and stack built from ``old.linkedlist.llnode`` links.
+
+:class:`AsyncQueue` and :class:`AsyncStack` are coroutine-friendly variants
+of ``old.linkedlist.queue`` and ``old.linkedlist.stack``. Waiting consumers
+and producers park on futures. A push that finds a consumer already waiting
+hands its node straight to that consumer's future instead of linking it, so
+the consumer resumes with its result and never re-checks the list. A
+bounded structure makes producers wait for a free slot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Iterable, List, Optional
+
+from .old.linkedlist import linkedlist, llnode
+
+
+class _AsyncLinked(linkedlist):
+    """Waiter bookkeeping shared by :class:`AsyncQueue` and :class:`AsyncStack`.
+
+    Subclasses provide ``_link`` to add a node, ``_unlink`` to remove the
+    node that comes out next and ``_link_front`` to put such a node back.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        super().__init__()
+        self.maxsize = maxsize if maxsize > 0 else 0
+        self.size = 0
+        self._getters: Deque[asyncio.Future] = deque()
+        self._putters: Deque[asyncio.Future] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of stored items."""
+        return self.size
+
+    def __aiter__(self) -> AsyncIterator[llnode]:
+        """Drain the structure, yielding nodes until it is empty."""
+        return self._drain()
+
+    async def _drain(self) -> AsyncIterator[llnode]:
+        """Pop nodes without waiting until the structure is empty."""
+        while self.size:
+            yield self.pop_nowait()
+
+    def full(self) -> bool:
+        """Return True if a bounded structure has no free slot."""
+        return bool(self.maxsize) and self.size >= self.maxsize
+
+    @staticmethod
+    def _wake(waiters: Deque[asyncio.Future], result: Any) -> bool:
+        """Resolve the oldest live future in ``waiters`` with ``result``."""
+        while waiters:
+            future = waiters.popleft()
+            if not future.done():
+                future.set_result(result)
+                return True
+        return False
+
+    def _offer(self, node: llnode) -> None:
+        """Hand ``node`` to a waiting consumer, or store it if none waits."""
+        if not (self._getters and self._wake(self._getters, node)):
+            self._link(node)
+            self.size += 1
+
+    def push_nowait(self, value: Any) -> None:
+        """Add a value without waiting.
+
+        Raises
+        ------
+        asyncio.QueueFull
+            If the structure is bounded and full.
+        """
+        if self.full():
+            raise asyncio.QueueFull
+        self._offer(llnode(value))
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Add every value in order without waiting.
+
+        Each value goes through the same path as :meth:`push_nowait`, so
+        waiting consumers are served first and the size stays current.
+        This also makes ``from_iterable`` fill the structure correctly.
+
+        Parameters
+        ----------
+        values : iterable
+            The values to add.
+
+        Raises
+        ------
+        asyncio.QueueFull
+            If the structure is bounded and fills up. The values before the
+            one that did not fit stay added.
+        """
+        for value in values:
+            self.push_nowait(value)
+
+    async def push(self, value: Any) -> None:
+        """Add a value, waiting for a free slot if the structure is full.
+
+        Parameters
+        ----------
+        value : Any
+            The value to add.
+        """
+        while self.maxsize and self.size >= self.maxsize:
+            future = asyncio.get_running_loop().create_future()
+            self._putters.append(future)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # The slot was granted to us; pass it on.
+                    if not self.full():
+                        self._wake(self._putters, None)
+                raise
+        self._offer(llnode(value))
+
+    def pop_nowait(self) -> llnode:
+        """Remove and return the next node without waiting.
+
+        Raises
+        ------
+        asyncio.QueueEmpty
+            If the structure is empty.
+        """
+        if not self.size:
+            raise asyncio.QueueEmpty
+        node = self._unlink()
+        self.size -= 1
+        if self._putters:
+            self._wake(self._putters, None)
+        return node
+
+    async def pop(self) -> llnode:
+        """Remove and return the next node, waiting for one if empty.
+
+        Returns
+        -------
+        llnode
+            A detached node holding the value.
+        """
+        if self.size:
+            return self.pop_nowait()
+        future = asyncio.get_running_loop().create_future()
+        self._getters.append(future)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # A node was handed over but never delivered; put it back
+                # in front so it is not lost.
+                self._relink(future.result())
+            raise
+
+    async def pop_many(self, n: int) -> List[llnode]:
+        """Wait for at least one node, then pop up to ``n`` without waiting.
+
+        Parameters
+        ----------
+        n : int
+            Maximum number of nodes to return. Must be positive.
+
+        Returns
+        -------
+        list of llnode
+            Between 1 and ``n`` detached nodes, in the order they came out.
+
+        Raises
+        ------
+        ValueError
+            If ``n`` is not positive.
+        """
+        if n < 1:
+            raise ValueError(f"n must be positive, got {n}")
+        nodes = [await self.pop()]
+        while len(nodes) < n and self.size:
+            nodes.append(self.pop_nowait())
+        return nodes
+
+    def _relink(self, node: llnode) -> None:
+        """Return an undelivered node so that it comes out next."""
+        if not self._wake(self._getters, node):
+            self._link_front(node)
+            self.size += 1
+
+
+class AsyncQueue(_AsyncLinked):
+    """FIFO queue with awaitable push and pop.
+
+    Like ``old.linkedlist.queue``, :meth:`pop` returns the detached
+    :class:`llnode` holding the oldest value.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of stored items. Zero or a negative value means
+        unbounded (default is 0).
+
+    Examples
+    --------
+    >>> async def demo():
+    ...     q = AsyncQueue()
+    ...     for value in "abc":
+    ...         await q.push(value)
+    ...     first = await q.pop()
+    ...     rest = [node.value async for node in q]
+    ...     return first.value, rest
+    >>> asyncio.run(demo())
+    ('a', ['b', 'c'])
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        super().__init__(maxsize)
+        self.tail: Optional[llnode] = None
+
+    def _link(self, node: llnode) -> None:
+        """Link ``node`` after the tail."""
+        if self.tail:
+            self.tail.right = node
+        else:
+            self.root = node
+        self.tail = node
+
+    def _link_front(self, node: llnode) -> None:
+        """Link ``node`` before the root, so that it comes out next."""
+        node.right = self.root
+        self.root = node
+        if self.tail is None:
+            self.tail = node
+
+    def _unlink(self) -> llnode:
+        """Detach and return the root, the oldest node."""
+        node = self.root
+        self.root = node.right
+        if self.root is None:
+            self.tail = None
+        node.right = None
+        return node
+
+
+class AsyncStack(_AsyncLinked):
+    """LIFO stack with awaitable push and pop.
+
+    Like ``old.linkedlist.stack``, nodes are linked both ways and
+    :meth:`pop` returns the detached :class:`llnode` from the top.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of stored items. Zero or a negative value means
+        unbounded (default is 0).
+
+    Examples
+    --------
+    >>> async def demo():
+    ...     s = AsyncStack()
+    ...     for value in "abc":
+    ...         await s.push(value)
+    ...     return [node.value for node in await s.pop_many(5)]
+    >>> asyncio.run(demo())
+    ['c', 'b', 'a']
+    """
+
+    def _link(self, node: llnode) -> None:
+        """Link ``node`` on top, in front of the root."""
+        if self.root:
+            node.right = self.root
+            self.root.left = node
+        self.root = node
+
+    _link_front = _link
+
+    def _unlink(self) -> llnode:
+        """Detach and return the root, the newest node."""
+        node = self.root
+        self.root = node.right
+        if self.root:
+            self.root.left = None
+        node.right = None
+        return node
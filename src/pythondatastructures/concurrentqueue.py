@@ -0,0 +1,218 @@
+"""Thread-safe blocking FIFO queue built from ``old.linkedlist.llnode`` links.
+
+:class:`ConcurrentQueue` is a multi-producer, multi-consumer variant of
+``old.linkedlist.queue`` using the two-lock design: the chain always starts
+with a dummy node, producers only touch the tail under the tail lock and
+consumers only touch the dummy under the head lock, so a push and a pop
+never wait for each other. Each lock carries a condition variable for
+blocking, timeouts and the backpressure of a bounded queue; the other side
+only takes that lock to wake a thread it knows is waiting.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from queue import Empty, Full
+from typing import Any, Iterable, Optional
+
+from .old.linkedlist import llnode
+
+
+class ConcurrentQueue:
+    """Blocking multi-producer, multi-consumer FIFO queue.
+
+    Like ``old.linkedlist.queue``, :meth:`push` takes a value and
+    :meth:`pop` returns the detached :class:`llnode` holding it. Blocking
+    calls take the ``block`` and ``timeout`` arguments of
+    :class:`queue.Queue` and raise :class:`queue.Empty` or
+    :class:`queue.Full` when they give up.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of stored items. Zero or a negative value means
+        unbounded (default is 0).
+
+    Examples
+    --------
+    >>> import queue
+    >>> q = ConcurrentQueue(maxsize=2)
+    >>> q.push("a")
+    >>> q.put_nowait("b")
+    >>> try:
+    ...     q.put_nowait("c")
+    ... except queue.Full:
+    ...     print("full")
+    full
+    >>> q.pop().value, q.get_nowait().value, len(q)
+    ('a', 'b', 0)
+    >>> try:
+    ...     q.pop(timeout=0.01)
+    ... except queue.Empty:
+    ...     print("empty")
+    empty
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize = maxsize if maxsize > 0 else 0
+        self.root = self.tail = llnode(None)  # dummy; its right is the front
+        self._not_empty = threading.Condition(threading.Lock())  # head lock
+        self._not_full = threading.Condition(threading.Lock())  # tail lock
+        # Each counter is written under one lock only, so neither side
+        # needs the other's lock to keep the length or to see waiters.
+        self._pushed = 0
+        self._popped = 0
+        self._getters = 0
+        self._putters = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored items at the time of the call."""
+        # The two counters are read without locks, so a pop landing between
+        # the reads can briefly make the difference negative.
+        return max(self._pushed - self._popped, 0)
+
+    @staticmethod
+    def _deadline(timeout: Optional[float]) -> Optional[float]:
+        """Return the monotonic time a blocking call gives up at."""
+        return None if timeout is None else time.monotonic() + timeout
+
+    @staticmethod
+    def _wait(condition: threading.Condition, deadline: Optional[float]) -> bool:
+        """Wait on ``condition`` until notified; False once past ``deadline``."""
+        if deadline is None:
+            return condition.wait()
+        remaining = deadline - time.monotonic()
+        return remaining > 0 and (condition.wait(remaining) or True)
+
+    def _link(self, first: llnode, last: llnode, count: int) -> None:
+        """Link ``first..last`` after the tail; the tail lock must be held."""
+        self.tail.right = first
+        self.tail = last
+        self._pushed += count
+
+    def _wake_getters(self, count: int) -> None:
+        """Wake up to ``count`` consumers blocked on an empty queue."""
+        # A consumer registers in _getters before its final emptiness check,
+        # so reading it after linking cannot miss a consumer about to sleep.
+        if self._getters:
+            with self._not_empty:
+                self._not_empty.notify(count)
+
+    def push(
+        self, value: Any, block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        """Append a value, waiting for a free slot if the queue is full.
+
+        Parameters
+        ----------
+        value : Any
+            The value to enqueue.
+        block : bool, optional
+            If False, fail at once instead of waiting (default is True).
+        timeout : float, optional
+            Maximum number of seconds to wait. None waits indefinitely.
+
+        Raises
+        ------
+        queue.Full
+            If no slot became free in time.
+        """
+        node = llnode(value)
+        with self._not_full:
+            if self.maxsize and self._pushed - self._popped >= self.maxsize:
+                if not block:
+                    raise Full
+                deadline = self._deadline(timeout)
+                self._putters += 1
+                try:
+                    while self._pushed - self._popped >= self.maxsize:
+                        if not self._wait(self._not_full, deadline):
+                            raise Full
+                finally:
+                    self._putters -= 1
+            self._link(node, node, 1)
+        self._wake_getters(1)
+
+    def pop(self, block: bool = True, timeout: Optional[float] = None) -> llnode:
+        """Remove and return the node at the front, waiting for one if empty.
+
+        Parameters
+        ----------
+        block : bool, optional
+            If False, fail at once instead of waiting (default is True).
+        timeout : float, optional
+            Maximum number of seconds to wait. None waits indefinitely.
+
+        Returns
+        -------
+        llnode
+            A detached node holding the oldest value.
+
+        Raises
+        ------
+        queue.Empty
+            If no item arrived in time.
+        """
+        with self._not_empty:
+            if self.root.right is None:
+                if not block:
+                    raise Empty
+                deadline = self._deadline(timeout)
+                self._getters += 1
+                try:
+                    # Another consumer may move the dummy while this one
+                    # sleeps, so re-read the root after every wake-up.
+                    while self.root.right is None:
+                        if not self._wait(self._not_empty, deadline):
+                            raise Empty
+                finally:
+                    self._getters -= 1
+            dummy = self.root
+            first = dummy.right
+            # The first node becomes the new dummy; the old dummy is
+            # handed out with the value, so a pop allocates nothing.
+            dummy.value, first.value = first.value, None
+            dummy.right = None
+            self.root = first
+            self._popped += 1
+        if self._putters:
+            with self._not_full:
+                self._not_full.notify()
+        return dummy
+
+    def put_nowait(self, value: Any) -> None:
+        """Append a value without waiting; raise queue.Full if full."""
+        self.push(value, block=False)
+
+    def get_nowait(self) -> llnode:
+        """Pop the front node without waiting; raise queue.Empty if empty."""
+        return self.pop(block=False)
+
+    def push_many(self, newvals: Iterable[Any]) -> None:
+        """Append every value in order.
+
+        An unbounded queue links the whole batch under one acquisition of
+        the tail lock; a bounded queue pushes the values one at a time so
+        that each waits for its own slot.
+
+        Parameters
+        ----------
+        newvals : iterable
+            Values to enqueue.
+        """
+        if self.maxsize:
+            for newval in newvals:
+                self.push(newval)
+            return
+        head = tail = llnode(None)
+        count = 0
+        for newval in newvals:
+            tail.right = llnode(newval)
+            tail = tail.right
+            count += 1
+        if count:
+            with self._not_full:
+                self._link(head.right, tail, count)
+            self._wake_getters(count)
+    extend = push_many
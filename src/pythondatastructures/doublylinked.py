@@ -0,0 +1,412 @@
+"""Doubly-linked list with head and tail sentinels.
+
+This module provides a list of
+:class:`~pythondatastructures.nodes.DoublyLinkedNode` objects framed by two
+sentinel nodes that are never removed. Every real node therefore has a
+predecessor and a successor, so linking and unlinking never branch on the
+ends of the list, and both ends as well as any node the caller holds can be
+reached in O(1). That makes the list usable as a deque and as the recency
+list of an LRU cache.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from .nodes import DirectedNode, DoublyLinkedNode
+from .sorting import relink_backward, sort_chain
+
+
+def _sentinel() -> DoublyLinkedNode:
+    """Return a node without a value, bypassing the None check."""
+    node = DoublyLinkedNode.__new__(DoublyLinkedNode)
+    node.value = None
+    node.next = node.prev = None
+    return node
+
+
+class DoublyLinkedList:
+    """A doubly-linked list of nodes with O(1) operations at both ends.
+
+    The list follows the :class:`~pythondatastructures.nodes.DirectedNode`
+    method contract in the same way as
+    :class:`~pythondatastructures.linkedlist.LinkedList`: the list itself
+    acts as the head node, relative indexes count the elements before the
+    position they refer to, and removals return the stored value.
+    Insertions return the node holding the new value, which can later be
+    passed to :meth:`remove` or :meth:`move_to_end`.
+
+    Parameters
+    ----------
+    iterable : iterable, optional
+        Values to append to the new list in order.
+
+    Examples
+    --------
+    >>> dl = DoublyLinkedList([1, 2, 3])
+    >>> node = dl.append(4)
+    >>> dl.move_to_end(node, last=False)
+    >>> list(dl), list(reversed(dl))
+    ([4, 1, 2, 3], [3, 2, 1, 4])
+    >>> dl.dequeue(), dl.dequeue(direct=True)
+    (3, 4)
+    >>> dl.remove(dl.first)
+    1
+    >>> list(dl)
+    [2]
+    """
+
+    __slots__ = ("_head", "_tail", "_size")
+
+    def __init__(self, iterable: Optional[Iterable[Any]] = None) -> None:
+        self._head = _sentinel()
+        self._tail = _sentinel()
+        self._head.next = self._tail
+        self._tail.prev = self._head
+        self._size = 0
+        if iterable is not None:
+            self.extend(iterable)
+
+    def __len__(self) -> int:
+        """Return the number of stored elements."""
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the stored values from head to tail."""
+        tail = self._tail
+        node = self._head.next
+        while node is not tail:
+            yield node.value
+            node = node.next
+
+    def __reversed__(self) -> Iterator[Any]:
+        """Iterate over the stored values from tail to head."""
+        head = self._head
+        node = self._tail.prev
+        while node is not head:
+            yield node.value
+            node = node.prev
+
+    def __repr__(self) -> str:
+        """Return a string representation of the list.
+
+        Returns
+        -------
+        str
+            The class name followed by the stored values.
+        """
+        return f"DoublyLinkedList({list(self)!r})"
+
+    def nodes(self) -> Iterator[DoublyLinkedNode]:
+        """Iterate over the nodes from head to tail.
+
+        Yields
+        ------
+        DoublyLinkedNode
+            Each node holding a value; the sentinels are skipped.
+        """
+        tail = self._tail
+        node = self._head.next
+        while node is not tail:
+            yield node
+            node = node.next
+
+    @property
+    def first(self) -> Optional[DoublyLinkedNode]:
+        """Return the first node, or None if the list is empty."""
+        node = self._head.next
+        return None if node is self._tail else node
+
+    @property
+    def last(self) -> Optional[DoublyLinkedNode]:
+        """Return the last node, or None if the list is empty."""
+        node = self._tail.prev
+        return None if node is self._head else node
+
+    @staticmethod
+    def _wrap(value: Any) -> DoublyLinkedNode:
+        """Return a detached node for ``value``.
+
+        A detached DoublyLinkedNode is linked in as is; any other node
+        contributes its value.
+
+        Raises
+        ------
+        TypeError
+            If the value is None.
+        ValueError
+            If the value is a DoublyLinkedNode that is still linked.
+        """
+        if isinstance(value, DoublyLinkedNode):
+            if value.prev is not None or value.next is not None:
+                raise ValueError("node is already linked into a chain")
+            return value
+        if isinstance(value, DirectedNode):
+            value = value.value
+        if value is None:
+            raise TypeError("DoublyLinkedList values cannot be None")
+        return DoublyLinkedNode(value)
+
+    def _before(self, relative_index: int) -> DoublyLinkedNode:
+        """Return the node that position ``relative_index`` follows.
+
+        Walks from whichever end is closer.
+
+        Parameters
+        ----------
+        relative_index : int
+            Number of elements before the position, where 0 refers to the
+            head sentinel.
+
+        Returns
+        -------
+        DoublyLinkedNode
+            The element at ``relative_index - 1``, or the head sentinel.
+
+        Raises
+        ------
+        ValueError
+            If the relative index is negative or larger than the list.
+        """
+        if relative_index < 0 or relative_index > self._size:
+            raise ValueError(
+                f"relative_index {relative_index} is out of bounds"
+            )
+        if relative_index <= self._size // 2:
+            node = self._head
+            for _ in range(relative_index):
+                node = node.next
+        else:
+            node = self._tail
+            for _ in range(self._size - relative_index + 1):
+                node = node.prev
+        return node
+
+    def _unlink(self, node: DoublyLinkedNode) -> Any:
+        """Unlink a real node and return its value."""
+        prev, following = node.prev, node.next
+        prev.next = following
+        following.prev = prev
+        node.prev = node.next = None
+        self._size -= 1
+        return node.value
+
+    def insert(self, value: Any, relative_index: int = 0) -> DoublyLinkedNode:
+        """Insert a value so that ``relative_index`` elements precede it.
+
+        Parameters
+        ----------
+        value : Any or DirectedNode
+            The value to insert. A detached DoublyLinkedNode is linked in
+            directly; another node contributes its ``value``.
+        relative_index : int, optional
+            Number of elements preceding the inserted value (default is 0,
+            which inserts at the front in O(1)).
+
+        Returns
+        -------
+        DoublyLinkedNode
+            The node holding the inserted value.
+
+        Raises
+        ------
+        ValueError
+            If the relative index is negative or larger than the list, or
+            the node is already linked.
+        TypeError
+            If the value is None.
+        """
+        node = self._wrap(value)
+        self._before(relative_index).link_after(node)
+        self._size += 1
+        return node
+
+    def append(self, value: Any) -> DoublyLinkedNode:
+        """Append a value after the last element in O(1).
+
+        Parameters
+        ----------
+        value : Any or DirectedNode
+            The value to append.
+
+        Returns
+        -------
+        DoublyLinkedNode
+            The node holding the appended value.
+
+        Raises
+        ------
+        TypeError
+            If the value is None.
+        ValueError
+            If the node is already linked.
+        """
+        node = self._wrap(value)
+        self._tail.prev.link_after(node)
+        self._size += 1
+        return node
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Append every value of ``iterable`` in order.
+
+        Parameters
+        ----------
+        iterable : iterable
+            The values to append.
+        """
+        tail = self._tail
+        prev = tail.prev
+        size = self._size
+        wrap = self._wrap
+        try:
+            for value in iterable:
+                node = wrap(value)
+                node.prev = prev
+                prev.next = node
+                prev = node
+                size += 1
+        finally:
+            # Close the chain over whatever was linked before an error.
+            prev.next = tail
+            tail.prev = prev
+            self._size = size
+
+    def pop(self, relative_index: int = 0) -> Optional[Any]:
+        """Remove and return the element preceded by ``relative_index`` others.
+
+        Parameters
+        ----------
+        relative_index : int, optional
+            Number of elements preceding the removed one (default is 0,
+            which removes the first element).
+
+        Returns
+        -------
+        Any or None
+            The removed value, or None if ``relative_index`` equals the
+            list length.
+
+        Raises
+        ------
+        ValueError
+            If the relative index is negative or larger than the list.
+        """
+        prev = self._before(relative_index)
+        if relative_index == self._size:
+            return None
+        return self._unlink(prev.next)
+
+    def pop_value(self, value: Any) -> Optional[Any]:
+        """Remove and return the first element equal to ``value``.
+
+        Parameters
+        ----------
+        value : Any
+            The value to remove.
+
+        Returns
+        -------
+        Any or None
+            The removed value, or None if no element equals ``value``.
+        """
+        for node in self.nodes():
+            if node.value == value:
+                return self._unlink(node)
+        return None
+
+    def dequeue(self, direct: bool = False) -> Optional[Any]:
+        """Remove and return the first or the last element in O(1).
+
+        Parameters
+        ----------
+        direct : bool, optional
+            If True, remove the first element. If False, remove the last
+            element (default is False).
+
+        Returns
+        -------
+        Any or None
+            The removed value, or None if the list is empty.
+        """
+        if self._size == 0:
+            return None
+        return self._unlink(self._head.next if direct else self._tail.prev)
+
+    def remove(self, node: DoublyLinkedNode) -> Any:
+        """Remove a node of this list in O(1) and return its value.
+
+        Parameters
+        ----------
+        node : DoublyLinkedNode
+            A node previously returned by this list and still linked in it.
+            Membership is not checked beyond the node being linked.
+
+        Returns
+        -------
+        Any
+            The value the node held.
+
+        Raises
+        ------
+        ValueError
+            If the node is not linked into a list.
+        """
+        if node.prev is None or node.next is None:
+            raise ValueError("node is not linked into a list")
+        return self._unlink(node)
+
+    def move_to_end(self, node: DoublyLinkedNode, last: bool = True) -> None:
+        """Move a node of this list to the back, or the front, in O(1).
+
+        Parameters
+        ----------
+        node : DoublyLinkedNode
+            A node still linked in this list.
+        last : bool, optional
+            If True, move the node to the back; if False, to the front
+            (default is True).
+
+        Raises
+        ------
+        ValueError
+            If the node is not linked into a list.
+        """
+        if node.prev is None or node.next is None:
+            raise ValueError("node is not linked into a list")
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = node.next = None
+        (self._tail.prev if last else self._head).link_after(node)
+
+    def sort(
+        self, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False
+    ) -> None:
+        """Sort the list in place by relinking its nodes.
+
+        Nodes held by the caller stay valid and keep their values.
+
+        Parameters
+        ----------
+        key : callable, optional
+            Applied to each value to produce its sort key, as for
+            :func:`sorted`.
+        reverse : bool, optional
+            Sort in descending order (default is False).
+        """
+        if self._size < 2:
+            return
+        head, tail = self._head, self._tail
+        tail.prev.next = None  # the sort runs on the real nodes only
+        first, last = sort_chain(head.next, "next", key, reverse)
+        head.next = first
+        last.next = tail
+        tail.prev = last
+        relink_backward(head, "next", "prev")
+
+    def clear(self) -> None:
+        """Remove every element, detaching each node."""
+        for node in list(self.nodes()):
+            node.prev = node.next = None
+        self._head.next = self._tail
+        self._tail.prev = self._head
+        self._size = 0
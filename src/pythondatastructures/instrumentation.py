@@ -0,0 +1,153 @@
+"""Opt-in instrumentation for the linked structures.
+
+The module-level :data:`probe` receives events from the hot paths of
+``old.Actual`` (the ``Edge`` descriptor, ``Node`` and ``LL``) and from the
+:mod:`~pythondatastructures.traversal` primitives. Every call site is
+guarded by ``if probe.enabled:``, so a disabled probe costs one attribute
+load per operation and nothing else.
+
+Events
+------
+``"pointer_write"``
+    A forward or backward link was stored.
+``"unlink"``
+    A node was cut out of a chain. A truncation reports the first node cut
+    off.
+``"hop"``
+    Links followed during a traversal; reported once per traversal with
+    the number of links read.
+``"alloc"``
+    A node was created.
+``"diagnostic"``
+    An operation did something surprising, such as deleting a link that
+    was already empty. The subject is a message.
+
+Callbacks are called as ``callback(event, subject, count)``.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List
+
+EVENTS = ("pointer_write", "unlink", "hop", "alloc", "diagnostic")
+
+Callback = Callable[[str, Any, int], None]
+
+
+class Probe:
+    """Counters and callbacks for instrumentation events.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether call sites report events. Subscribing a callback does not
+        enable the probe.
+    counts : collections.Counter
+        Running totals per event since creation or the last :meth:`reset`.
+
+    Examples
+    --------
+    >>> p = Probe()
+    >>> seen = []
+    >>> _ = p.subscribe("alloc", lambda event, subject, count: seen.append(subject))
+    >>> p.enabled = True
+    >>> p.emit("alloc", "node")
+    >>> seen, p.counts["alloc"]
+    (['node'], 1)
+    """
+
+    __slots__ = ("enabled", "counts", "_callbacks", "_collectors")
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.counts: Counter = Counter()
+        self._callbacks: Dict[str, List[Callback]] = {e: [] for e in EVENTS}
+        self._collectors: List[Counter] = []
+
+    def _listeners(self, event: str) -> List[Callback]:
+        try:
+            return self._callbacks[event]
+        except KeyError:
+            raise ValueError(
+                f"event must be one of {list(EVENTS)}, got {event!r}"
+            ) from None
+
+    def subscribe(self, event: str, callback: Callback) -> Callback:
+        """Call ``callback`` for every ``event`` and return it.
+
+        Raises
+        ------
+        ValueError
+            If ``event`` is not one of :data:`EVENTS`.
+        """
+        self._listeners(event).append(callback)
+        return callback
+
+    def unsubscribe(self, event: str, callback: Callback) -> None:
+        """Stop calling ``callback`` for ``event``.
+
+        Raises
+        ------
+        ValueError
+            If ``event`` is unknown or ``callback`` is not subscribed to it.
+        """
+        self._listeners(event).remove(callback)
+
+    def emit(self, event: str, subject: Any = None, count: int = 1) -> None:
+        """Record ``count`` occurrences of ``event`` and notify callbacks.
+
+        Call sites check :attr:`enabled` before calling this.
+        """
+        self.counts[event] += count
+        for collector in self._collectors:
+            collector[event] += count
+        for callback in self._callbacks[event]:
+            callback(event, subject, count)
+
+    def reset(self) -> None:
+        """Zero the running totals."""
+        self.counts.clear()
+
+
+probe = Probe()
+
+
+@contextmanager
+def collect(target: Probe = probe) -> Iterator[Counter]:
+    """Count the events raised inside a ``with`` block.
+
+    The probe is enabled for the duration of the block and restored to
+    its previous state afterwards. Blocks may be nested; each gets its own
+    counts.
+
+    Parameters
+    ----------
+    target : Probe, optional
+        The probe to listen to (default is the module-level :data:`probe`).
+
+    Yields
+    ------
+    collections.Counter
+        Event counts for the block, updated as events arrive.
+
+    Examples
+    --------
+    >>> from pythondatastructures.old.Actual import LL
+    >>> with collect() as stats:
+    ...     ll = LL.from_iterable([1, 2, 3])
+    >>> stats["alloc"], stats["pointer_write"]
+    (3, 4)
+    """
+    stats: Counter = Counter()
+    was_enabled = target.enabled
+    target._collectors.append(stats)
+    target.enabled = True
+    try:
+        yield stats
+    finally:
+        # By identity: two collectors with equal counts compare equal.
+        collectors = target._collectors
+        del collectors[next(i for i, c in enumerate(collectors) if c is stats)]
+        target.enabled = was_enabled
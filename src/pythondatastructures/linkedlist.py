@@ -1,8 +1,324 @@
-"""
-New linkedlist implementation.
+"""Array-backed singly-linked list.
 
-This module will contain the refactored linkedlist implementation.
-To be implemented.
+This module provides a linked list that stores its elements as a
+struct-of-arrays instead of one node object per element. Values live in a
+Python list, ``next`` links are slot indices in an ``array('q')``, and slots
+released by removals are chained into a free-list and reused by later
+insertions.
 """
 
-# TODO: Implement new linkedlist
\ No newline at end of file
+from __future__ import annotations
+
+from array import array
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from .nodes import DirectedNode
+from .sorting import merge_sort
+
+#: Slot index used to mark the end of the chain and of the free-list.
+NIL = -1
+
+
+class LinkedList:
+    """A singly-linked list stored as parallel arrays of values and links.
+
+    The list follows the :class:`~pythondatastructures.nodes.DirectedNode`
+    method contract with the list itself acting as the head node: a relative
+    index of 0 refers to the link before the first element. Elements are
+    plain values rather than node objects, so methods that return a node in
+    the node contract return the stored value here.
+
+    Parameters
+    ----------
+    iterable : iterable, optional
+        Values to append to the new list in order.
+
+    Examples
+    --------
+    >>> ll = LinkedList([1, 3])
+    >>> ll.insert(2, relative_index=1)
+    >>> list(ll)
+    [1, 2, 3]
+    >>> ll.dequeue()
+    3
+    >>> ll.pop()
+    1
+    >>> list(ll)
+    [2]
+    """
+
+    def __init__(self, iterable: Optional[Iterable[Any]] = None) -> None:
+        self._values: list = []
+        self._next: array = array("q")
+        self._head: int = NIL
+        self._tail: int = NIL
+        self._free: int = NIL
+        self._size: int = 0
+        if iterable is not None:
+            for value in iterable:
+                self.append(value)
+
+    def __len__(self) -> int:
+        """Return the number of stored elements."""
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the stored values from head to tail."""
+        values = self._values
+        nxt = self._next
+        slot = self._head
+        while slot != NIL:
+            yield values[slot]
+            slot = nxt[slot]
+
+    def __repr__(self) -> str:
+        """Return a string representation of the list.
+
+        Returns
+        -------
+        str
+            The class name followed by the stored values.
+        """
+        return f"LinkedList({list(self)!r})"
+
+    @staticmethod
+    def _unwrap(value: Any) -> Any:
+        """Return the value to store for ``value`` or a node holding it.
+
+        Raises
+        ------
+        TypeError
+            If the value is None.
+        """
+        if isinstance(value, DirectedNode):
+            value = value.value
+        if value is None:
+            raise TypeError("LinkedList values cannot be None")
+        return value
+
+    def _alloc(self, value: Any) -> int:
+        """Store ``value`` in a free slot and return the slot index."""
+        slot = self._free
+        if slot != NIL:
+            self._free = self._next[slot]
+            self._values[slot] = value
+            self._next[slot] = NIL
+            return slot
+        self._values.append(value)
+        self._next.append(NIL)
+        return len(self._values) - 1
+
+    def _release(self, slot: int) -> Any:
+        """Push ``slot`` onto the free-list and return the value it held."""
+        value = self._values[slot]
+        self._values[slot] = None
+        self._next[slot] = self._free
+        self._free = slot
+        return value
+
+    def _anchor(self, relative_index: int) -> int:
+        """Return the slot ``relative_index`` hops after the list head.
+
+        Parameters
+        ----------
+        relative_index : int
+            Number of hops to take, where 0 refers to the list head itself.
+
+        Returns
+        -------
+        int
+            The slot reached, or ``NIL`` for the list head.
+
+        Raises
+        ------
+        ValueError
+            If the relative index is negative or larger than the list.
+        """
+        if relative_index < 0 or relative_index > self._size:
+            raise ValueError(
+                f"relative_index {relative_index} is out of bounds"
+            )
+        if relative_index == 0:
+            return NIL
+        if relative_index == self._size:
+            return self._tail
+        nxt = self._next
+        slot = self._head
+        for _ in range(relative_index - 1):
+            slot = nxt[slot]
+        return slot
+
+    def _unlink_after(self, prev: int) -> Any:
+        """Unlink the element after slot ``prev`` and return its value."""
+        if prev == NIL:
+            slot = self._head
+            self._head = self._next[slot]
+        else:
+            slot = self._next[prev]
+            self._next[prev] = self._next[slot]
+        if slot == self._tail:
+            self._tail = prev
+        self._size -= 1
+        return self._release(slot)
+
+    def insert(self, value: Any, relative_index: int = 0) -> None:
+        """Insert a value after the element ``relative_index`` hops away.
+
+        Parameters
+        ----------
+        value : Any or DirectedNode
+            The value to insert. A node contributes its ``value``.
+        relative_index : int, optional
+            Number of elements preceding the inserted value (default is 0,
+            which inserts at the front).
+
+        Raises
+        ------
+        ValueError
+            If the relative index is negative or larger than the list.
+        TypeError
+            If the value is None.
+        """
+        value = self._unwrap(value)
+        prev = self._anchor(relative_index)
+        slot = self._alloc(value)
+        if prev == NIL:
+            self._next[slot] = self._head
+            self._head = slot
+        else:
+            self._next[slot] = self._next[prev]
+            self._next[prev] = slot
+        if prev == self._tail:
+            self._tail = slot
+        self._size += 1
+
+    def append(self, value: Any) -> None:
+        """Append a value after the last element in O(1).
+
+        Parameters
+        ----------
+        value : Any or DirectedNode
+            The value to append. A node contributes its ``value``.
+
+        Raises
+        ------
+        TypeError
+            If the value is None.
+        """
+        slot = self._alloc(self._unwrap(value))
+        if self._tail == NIL:
+            self._head = slot
+        else:
+            self._next[self._tail] = slot
+        self._tail = slot
+        self._size += 1
+
+    def pop(self, relative_index: int = 0) -> Optional[Any]:
+        """Remove and return the element after the one ``relative_index`` away.
+
+        Parameters
+        ----------
+        relative_index : int, optional
+            Number of elements preceding the removed one (default is 0,
+            which removes the first element).
+
+        Returns
+        -------
+        Any or None
+            The removed value, or None if ``relative_index`` equals the
+            list length.
+
+        Raises
+        ------
+        ValueError
+            If the relative index is negative or larger than the list.
+        """
+        prev = self._anchor(relative_index)
+        if relative_index == self._size:
+            return None
+        return self._unlink_after(prev)
+
+    def pop_value(self, value: Any) -> Optional[Any]:
+        """Remove and return the first element equal to ``value``.
+
+        Parameters
+        ----------
+        value : Any
+            The value to remove.
+
+        Returns
+        -------
+        Any or None
+            The removed value, or None if no element equals ``value``.
+        """
+        values = self._values
+        nxt = self._next
+        prev = NIL
+        slot = self._head
+        while slot != NIL:
+            if values[slot] == value:
+                return self._unlink_after(prev)
+            prev = slot
+            slot = nxt[slot]
+        return None
+
+    def dequeue(self, direct: bool = False) -> Optional[Any]:
+        """Remove and return the first or the last element.
+
+        Parameters
+        ----------
+        direct : bool, optional
+            If True, remove the first element in O(1). If False, remove the
+            last element, which walks to its predecessor (default is False).
+
+        Returns
+        -------
+        Any or None
+            The removed value, or None if the list is empty.
+        """
+        if self._size == 0:
+            return None
+        if direct:
+            return self._unlink_after(NIL)
+        return self._unlink_after(self._anchor(self._size - 1))
+
+    def sort(
+        self, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False
+    ) -> None:
+        """Sort the list in place by relinking slots.
+
+        Parameters
+        ----------
+        key : callable, optional
+            Applied to each value to produce its sort key, as for
+            :func:`sorted`.
+        reverse : bool, optional
+            Sort in descending order (default is False).
+
+        Notes
+        -----
+        Values stay in their slots; only the ``next`` array is rewritten,
+        by the stable merge sort of :mod:`~pythondatastructures.sorting`.
+        ``key`` is called once per element.
+        """
+        values = self._values
+        nxt = self._next
+        if key is None:
+            key_of = values.__getitem__
+        else:
+            # One key per slot, computed once as sorted() does, rather than
+            # on every comparison of every merge pass.
+            keys: list = [None] * len(values)
+            slot = self._head
+            while slot != NIL:
+                keys[slot] = key(values[slot])
+                slot = nxt[slot]
+            key_of = keys.__getitem__
+        self._head, self._tail = merge_sort(
+            self._head, NIL, nxt.__getitem__, nxt.__setitem__, key_of, reverse,
+            NIL.__eq__,
+        )
+
+    def clear(self) -> None:
+        """Remove every element and release the backing storage."""
+        self.__init__()
@@ -1,12 +1,16 @@
 """Implementations of linked list node structures.
 
-This module provides base classes and implementations for singly-linked node
-structures that can be used to build various linear data structures.
+This module provides base classes and implementations for singly- and
+doubly-linked node structures that can be used to build various linear data
+structures.
 """
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, Callable, Iterator, Optional
+
+from .sorting import relink_backward, sort_chain
+from .traversal import last, nth
 
 
 class DirectedNode:
@@ -31,8 +35,19 @@ class DirectedNode:
     >>> node1.next = node2
     >>> repr(node1)
     'DirectedNode(10)'
+    >>> list(node1.values())
+    [10, 20]
+
+    Notes
+    -----
+    Nodes declare ``__slots__`` so that no per-instance ``__dict__`` is
+    allocated. Subclasses should declare their own ``__slots__`` (an empty
+    tuple if they add no attributes) to keep the compact layout; subclasses
+    that omit it still work but regain a ``__dict__``.
     """
 
+    __slots__ = ("value", "next")
+
     def __init__(self, value: Any) -> None:
         """Initialize a new DirectedNode.
 
@@ -79,6 +94,37 @@ class DirectedNode:
             return NotImplemented
         return self.value == other.value
 
+    def __iter__(self) -> Iterator[DirectedNode]:
+        """Iterate over this node and every node after it.
+
+        Yields
+        ------
+        DirectedNode
+            Each node of the chain, starting with this one.
+
+        Notes
+        -----
+        The generator only rebinds a local per step, so iteration allocates
+        nothing beyond the generator itself.
+        """
+        node = self
+        while node is not None:
+            yield node
+            node = node.next
+
+    def values(self) -> Iterator[Any]:
+        """Iterate over the values of this node and every node after it.
+
+        Yields
+        ------
+        Any
+            The value of each node of the chain, starting with this one.
+        """
+        node = self
+        while node is not None:
+            yield node.value
+            node = node.next
+
     def insert(
         self, node: DirectedNode, relative_index: int = 0
     ) -> None:
@@ -239,4 +285,425 @@ class DirectedNode:
         """
         raise NotImplementedError(
             f"{self.__class__.__name__} does not implement dequeue()"
-        )
\ No newline at end of file
+        )
+
+
+class SinglyLinkedNode(DirectedNode):
+    """A concrete singly-linked node implementing the DirectedNode interface.
+
+    All positional operations are relative to this node: a relative index of
+    0 refers to the link immediately after this node, so a node can act as
+    the head of the chain that follows it.
+
+    Examples
+    --------
+    >>> head = SinglyLinkedNode(1)
+    >>> head.append(SinglyLinkedNode(3))
+    >>> head.insert(SinglyLinkedNode(2))
+    >>> head.next.value, head.next.next.value
+    (2, 3)
+    >>> head.dequeue()
+    DirectedNode(3)
+    """
+
+    __slots__ = ()
+
+    def _anchor(self, relative_index: int) -> DirectedNode:
+        """Return the node ``relative_index`` hops after this node.
+
+        Parameters
+        ----------
+        relative_index : int
+            Number of ``next`` hops to take from this node.
+
+        Returns
+        -------
+        DirectedNode
+            The node reached after ``relative_index`` hops.
+
+        Raises
+        ------
+        ValueError
+            If the relative index is negative or runs past the chain end.
+        """
+        if relative_index < 0:
+            raise ValueError(
+                f"relative_index must be non-negative, got {relative_index}"
+            )
+        node = nth(self, relative_index)
+        if node is None:
+            raise ValueError(
+                f"relative_index {relative_index} is out of bounds"
+            )
+        return node
+
+    def insert(
+        self, node: DirectedNode, relative_index: int = 0
+    ) -> None:
+        """Insert a node after the node ``relative_index`` hops away.
+
+        Parameters
+        ----------
+        node : DirectedNode
+            The node to be inserted.
+        relative_index : int, optional
+            Number of hops from this node to the node that the new node is
+            linked after (default is 0).
+
+        Raises
+        ------
+        ValueError
+            If the relative index is negative or out of bounds.
+        TypeError
+            If node is not a DirectedNode instance.
+        """
+        if not isinstance(node, DirectedNode):
+            raise TypeError(
+                f"Expected a DirectedNode, got {type(node).__name__}"
+            )
+        anchor = self._anchor(relative_index)
+        node.next = anchor.next
+        anchor.next = node
+
+    def append(self, node: DirectedNode) -> None:
+        """Append a node after the last node of the chain.
+
+        Parameters
+        ----------
+        node : DirectedNode
+            The node to be appended.
+
+        Raises
+        ------
+        TypeError
+            If node is not a DirectedNode instance.
+        """
+        if not isinstance(node, DirectedNode):
+            raise TypeError(
+                f"Expected a DirectedNode, got {type(node).__name__}"
+            )
+        tail, _ = last(self)
+        tail.next = node
+
+    def pop(self, relative_index: int = 0) -> Optional[DirectedNode]:
+        """Remove and return the node after the node ``relative_index`` away.
+
+        Parameters
+        ----------
+        relative_index : int, optional
+            Number of hops from this node to the predecessor of the node to
+            be removed (default is 0).
+
+        Returns
+        -------
+        DirectedNode or None
+            The removed node with its ``next`` cleared, or None if the
+            predecessor is the last node of the chain.
+
+        Raises
+        ------
+        ValueError
+            If the relative index is negative or out of bounds.
+        """
+        anchor = self._anchor(relative_index)
+        removed = anchor.next
+        if removed is None:
+            return None
+        anchor.next = removed.next
+        removed.next = None
+        return removed
+
+    def pop_value(self, value: Any) -> Optional[DirectedNode]:
+        """Remove and return the first following node holding ``value``.
+
+        Parameters
+        ----------
+        value : Any
+            The value of the node to be removed.
+
+        Returns
+        -------
+        DirectedNode or None
+            The removed node, or None if no following node holds ``value``.
+
+        Notes
+        -----
+        A node cannot unlink itself from its predecessor, so the search
+        starts at the node immediately after this one.
+        """
+        prev = self
+        node = self.next
+        while node is not None:
+            if node.value == value:
+                prev.next = node.next
+                node.next = None
+                return node
+            prev = node
+            node = node.next
+        return None
+
+    def dequeue(self, direct: bool = False) -> Optional[DirectedNode]:
+        """Remove and return the first or the last following node.
+
+        Parameters
+        ----------
+        direct : bool, optional
+            If True, remove the node immediately after this node. If False,
+            remove the last node of the chain (default is False).
+
+        Returns
+        -------
+        DirectedNode or None
+            The removed node, or None if this node has no successor.
+        """
+        if direct:
+            return self.pop(0)
+        prev = self
+        node = self.next
+        if node is None:
+            return None
+        while node.next is not None:
+            prev = node
+            node = node.next
+        prev.next = None
+        return node
+
+    def sort(
+        self, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False
+    ) -> None:
+        """Sort the nodes after this node in place by relinking them.
+
+        Parameters
+        ----------
+        key : callable, optional
+            Applied to each value to produce its sort key, as for
+            :func:`sorted`.
+        reverse : bool, optional
+            Sort in descending order (default is False).
+
+        Notes
+        -----
+        This node stays first. The sort is a stable bottom-up merge sort
+        (see :mod:`~pythondatastructures.sorting`) using O(1) extra memory.
+        """
+        self.next, _ = sort_chain(self.next, "next", key, reverse)
+
+
+class DoublyLinkedNode(DirectedNode):
+    """A node linked to both its successor and its predecessor.
+
+    Positional operations follow :class:`SinglyLinkedNode` and are relative
+    to this node, but every link change also maintains ``prev``, so a node
+    can be removed from its chain in O(1) with :meth:`unlink`.
+
+    Attributes
+    ----------
+    prev : DoublyLinkedNode or None
+        Reference to the previous node, or None if this is the first node.
+
+    Examples
+    --------
+    >>> head = DoublyLinkedNode(1)
+    >>> head.append(DoublyLinkedNode(3))
+    >>> head.insert(DoublyLinkedNode(2))
+    >>> middle = head.next
+    >>> middle.prev is head, middle.next.prev is middle
+    (True, True)
+    >>> middle.unlink()
+    DirectedNode(2)
+    >>> list(head.values())
+    [1, 3]
+    """
+
+    __slots__ = ("prev",)
+
+    def __init__(self, value: Any) -> None:
+        """Initialize a new DoublyLinkedNode with no neighbours.
+
+        Parameters
+        ----------
+        value : Any
+            The value to store in this node.
+
+        Raises
+        ------
+        TypeError
+            If value is None (nodes must store explicit values).
+        """
+        super().__init__(value)
+        self.prev: Optional[DoublyLinkedNode] = None
+
+    _anchor = SinglyLinkedNode._anchor
+
+    @staticmethod
+    def _check(node: DirectedNode) -> None:
+        """Raise TypeError unless ``node`` is a DoublyLinkedNode."""
+        if not isinstance(node, DoublyLinkedNode):
+            raise TypeError(
+                f"Expected a DoublyLinkedNode, got {type(node).__name__}"
+            )
+
+    def link_after(self, node: DoublyLinkedNode) -> None:
+        """Link ``node`` immediately after this node in O(1).
+
+        Parameters
+        ----------
+        node : DoublyLinkedNode
+            A detached node to link in.
+        """
+        following = self.next
+        node.prev = self
+        node.next = following
+        if following is not None:
+            following.prev = node
+        self.next = node
+
+    def unlink(self) -> DoublyLinkedNode:
+        """Remove this node from its chain in O(1) and return it.
+
+        The neighbours are joined to each other and this node's links are
+        cleared.
+
+        Returns
+        -------
+        DoublyLinkedNode
+            This node, detached.
+        """
+        prev, following = self.prev, self.next
+        if prev is not None:
+            prev.next = following
+        if following is not None:
+            following.prev = prev
+        self.prev = self.next = None
+        return self
+
+    def insert(
+        self, node: DirectedNode, relative_index: int = 0
+    ) -> None:
+        """Insert a node after the node ``relative_index`` hops away.
+
+        Parameters
+        ----------
+        node : DoublyLinkedNode
+            The node to be inserted.
+        relative_index : int, optional
+            Number of hops from this node to the node that the new node is
+            linked after (default is 0).
+
+        Raises
+        ------
+        ValueError
+            If the relative index is negative or out of bounds.
+        TypeError
+            If node is not a DoublyLinkedNode instance.
+        """
+        self._check(node)
+        self._anchor(relative_index).link_after(node)
+
+    def append(self, node: DirectedNode) -> None:
+        """Append a node after the last node of the chain.
+
+        Parameters
+        ----------
+        node : DoublyLinkedNode
+            The node to be appended.
+
+        Raises
+        ------
+        TypeError
+            If node is not a DoublyLinkedNode instance.
+        """
+        self._check(node)
+        tail, _ = last(self)
+        tail.link_after(node)
+
+    def pop(self, relative_index: int = 0) -> Optional[DirectedNode]:
+        """Remove and return the node after the node ``relative_index`` away.
+
+        Parameters
+        ----------
+        relative_index : int, optional
+            Number of hops from this node to the predecessor of the node to
+            be removed (default is 0).
+
+        Returns
+        -------
+        DoublyLinkedNode or None
+            The removed node, detached, or None if the predecessor is the
+            last node of the chain.
+
+        Raises
+        ------
+        ValueError
+            If the relative index is negative or out of bounds.
+        """
+        removed = self._anchor(relative_index).next
+        return None if removed is None else removed.unlink()
+
+    def pop_value(self, value: Any) -> Optional[DirectedNode]:
+        """Remove and return the first following node holding ``value``.
+
+        Parameters
+        ----------
+        value : Any
+            The value of the node to be removed.
+
+        Returns
+        -------
+        DoublyLinkedNode or None
+            The removed node, or None if no following node holds ``value``.
+        """
+        node = self.next
+        while node is not None:
+            if node.value == value:
+                return node.unlink()
+            node = node.next
+        return None
+
+    def dequeue(self, direct: bool = False) -> Optional[DirectedNode]:
+        """Remove and return the first or the last following node.
+
+        Parameters
+        ----------
+        direct : bool, optional
+            If True, remove the node immediately after this node. If False,
+            remove the last node of the chain (default is False).
+
+        Returns
+        -------
+        DoublyLinkedNode or None
+            The removed node, or None if this node has no successor.
+
+        Notes
+        -----
+        A bare chain has no tail pointer, so removing the last node walks
+        the chain. :class:`~pythondatastructures.doublylinked.DoublyLinkedList`
+        keeps a tail sentinel and does both ends in O(1).
+        """
+        if direct:
+            return self.pop(0)
+        if self.next is None:
+            return None
+        tail, _ = last(self)
+        return tail.unlink()
+
+    def sort(
+        self, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False
+    ) -> None:
+        """Sort the nodes after this node in place by relinking them.
+
+        Parameters
+        ----------
+        key : callable, optional
+            Applied to each value to produce its sort key, as for
+            :func:`sorted`.
+        reverse : bool, optional
+            Sort in descending order (default is False).
+
+        Notes
+        -----
+        This node stays first. The sort is a stable bottom-up merge sort
+        (see :mod:`~pythondatastructures.sorting`) using O(1) extra memory.
+        """
+        self.next, _ = sort_chain(self.next, "next", key, reverse)
+        relink_backward(self, "next", "prev")
@@ -2,9 +2,21 @@
 Alternative linked list implementation using descriptors.
 
 This module contains a more advanced implementation using Python descriptors
-and the networkx library for graph visualization.
+and the networkx library for graph visualization. networkx is optional (the
+``graph`` extra) and only imported by ``LL.nx_graph``.
 """
 
-from .linked_list import Node, LL, ChainNodeMixin
+from typing import TYPE_CHECKING
+
+from ..._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    ["linked_list"],
+    dict.fromkeys(["Node", "LL", "ChainNodeMixin"], "linked_list"),
+)
+
+if TYPE_CHECKING:
+    from .linked_list import Node, LL, ChainNodeMixin
 
 __all__ = ["Node", "LL", "ChainNodeMixin"]
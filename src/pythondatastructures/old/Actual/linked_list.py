@@ -1,3 +1,10 @@
+import sys
+from itertools import pairwise
+
+from ...instrumentation import probe
+from ...sorting import relink_backward, sort_chain
+from ...traversal import walk, find, nth, last
+from ...valueindex import ValueIndex
 
 FIELDS = {
     "forward": "nxt",
@@ -20,25 +27,44 @@ class Edge:
     def __set__(self, instance, value):
         if value is None:
             if (nxt:=instance.__dict__.get(self.private)) is not None:
-                print(f"Trying to set {instance}.{self.name} to None but the Node there has a next node {nxt}.")
+                if probe.enabled: # truncation: nxt and everything after it leave the chain
+                    probe.emit("unlink", nxt)
+                if (owner:=instance.__dict__.get("_owner")) is not None: # everything after instance is cut off from the LL
+                    for node in walk(nxt, self.private):
+                        if node.__dict__.pop("_owner", None) is owner:
+                            owner._unlinked(node)
             instance.__dict__[self.private] = None
+            if probe.enabled:
+                probe.emit("pointer_write", instance)
             return
                 
         if (old_next:=instance.__dict__.get(self.private)) is not None: # Ex. N1 -> N2 -> N3. setting N1.nxt to N4. If N2 exists
             setattr(value, self.name, old_next) # If N2, Make N4 -> N2 (and N2.prev = N4)
         instance.__dict__[self.private] = value # Make N1.nxt = N4
         value.__dict__[self.converse] = instance # Make N4.prev = N1
+        if probe.enabled: # the two writes above; relinking N2 reported its own
+            probe.emit("pointer_write", instance, 2)
+        if (owner:=instance.__dict__.get("_owner")) is not None: # Let the LL holding N1 update its indexes
+            owner._linked(instance, value)
         
     def __delete__(self, instance): # ex. N1 -> N2 -> (N3)?. `del N1.nxt`
         if (nxt:=instance.__dict__.pop(self.private)) is not None: # if there is a next node (N2). Should always be since this is when deleting instance.nxt
+            if probe.enabled:
+                probe.emit("unlink", nxt)
+            if (owner:=nxt.__dict__.pop("_owner", None)) is not None: # N2 leaves the LL that held it
+                owner._unlinked(nxt)
             if (nxtnxt:=nxt.__dict__.pop(self.private)) is not None: # If next node (N2) has a next node (N3)
 
                 self.__set__(instance, nxtnxt) # Fold over N1 to N3. N1.nxt = N3 and N3.prev = N1
                 del nxt
                 return
-            del nxt # ex for this case. N1 -> N2. `del N1.nxt`
+            instance.__dict__[self.private] = None # ex for this case. N1 -> N2. `del N1.nxt`, N1 is now the last node
+            if probe.enabled:
+                probe.emit("pointer_write", instance)
+            del nxt
             return
-        print(f"Trying to delete {instance}.{self.name} but there is no next node.")
+        if probe.enabled:
+            probe.emit("diagnostic", f"deleted {instance!r}.{self.name} but there is no next node")
         instance.__dict__[self.private] = None
 
 class ChainNodeMixin(object):
@@ -50,7 +76,6 @@ class ChainNodeMixin(object):
         self._nxt = None 
         self.prev = None
         
-import networkx as nx
             
 class Node(ChainNodeMixin):
     value = None 
@@ -58,49 +83,65 @@ class Node(ChainNodeMixin):
     def __init__(self, value):
         super().__init__()
         self.value = value
+        if probe.enabled:
+            probe.emit("alloc", self)
     
     @property
     def idx(self):
-        if self.prev is None:
-            return 0
-        return self.prev.idx + 1
+        if (owner:=self.__dict__.get("_owner")) is not None and owner.positions is not None:
+            return owner.positions.position(self) # kept current by the LL
+        _, hops = last(self, "prev") # hops back to the root
+        return hops
     
     def nx_node(self, G):
-        data = {
-            "label": f"{self.value}",
-            "index": self.idx,
-        }
-        x = G.add_node(node_for_adding=self, **data)
-        # x = nx.node(data)
-        # G.add_node(x, **data)
-        # nx.add_node(G, x)
-        if (nxt:=self.nxt) is not None:
-            data["next"] = nxt.idx
-            nodes, edges = nxt.nx_node(G)
-            
-            # G.add_edge(x, nxt.nx_node(G))
-            # nx.add_edge(G, x, nxt.nx_node(G))
-            e = G.add_edge(x, nodes[0], **edges[0]) 
-            nodes.append(x)
-            edges.append(e)
-            return nodes, edges
-        return [x], []
+        # Adds this node and every node after it, keyed by the Node objects.
+        # One pass collects the attribute tuples, then networkx gets them in two bulk calls
+        nodes = list(walk(self, "_nxt")) # not list(self): that asks __len__ for a length hint
+        start = self.idx
+        G.add_nodes_from(
+            (node, {"label": f"{node.value}", "index": i}) for i, node in enumerate(nodes, start)
+        )
+        edges = list(pairwise(nodes))
+        G.add_edges_from(edges)
+        return nodes, edges
     
     def nx_graph(self, G):
-        node = G.add_node(self.value, index=self.idx)
-        if (nxt:=self.nxt) is not None:
-            x = nxt.nx_graph(G)
-            G.add_edge(self.value, nxt.value)
-            # G.add_edge(node, G.nodes[self.idx+1])
-
-        return node
-        
-            
+        # Same export as nx_node, keyed by the node values
+        values = list(self.values())
+        G.add_nodes_from((value, {"index": i}) for i, value in enumerate(values, self.idx))
+        G.add_edges_from(pairwise(values))
     
     def __len__(self):
-        if (nxt:=self.nxt) is None:
-            return self.idx + 1
-        return len(nxt)
+        _, hops = last(self, "_nxt")
+        return self.idx + hops + 1
+    
+    def __iter__(self): # this node and every node after it. Reads _nxt directly, so no Edge call per step
+        if probe.enabled: # walk reports the hops
+            yield from walk(self, "_nxt")
+            return
+        node = self
+        while node is not None:
+            yield node
+            node = node._nxt
+    
+    def values(self): # same walk as __iter__, yielding the values
+        if probe.enabled:
+            for node in walk(self, "_nxt"):
+                yield node.value
+            return
+        node = self
+        while node is not None:
+            yield node.value
+            node = node._nxt
+    
+    def __reversed__(self): # this node and every node before it, back to the root
+        if probe.enabled:
+            yield from walk(self, "prev")
+            return
+        node = self
+        while node is not None:
+            yield node
+            node = node.prev
     
     def create(self, new_val):
         return Node(new_val)
@@ -111,23 +152,34 @@ class Node(ChainNodeMixin):
         return nn
         
     def insert_at(self, node, i: int):
-        if self.idx < i-1:
-            if (nxt:=self.nxt) is not None:
-                return nxt.insert_at(node, i)
-            return None
-        else:
-            return self.insert(node)
+        if (hops:=i - 1 - self.idx) > 0: # insert after the node at i-1
+            if (target:=nth(self, hops, "_nxt")) is None:
+                return None
+            return target.insert(node)
+        return self.insert(node)
         
     def append(self, node):
-        if (nxt:=self.nxt) is not None:
-            return nxt.append(node)
-        self.nxt = node if isinstance(node, Node) else self.create(node)
+        tail, _ = last(self, "_nxt")
+        tail.nxt = node if isinstance(node, Node) else self.create(node)
     
     def get(self, value, /, default=None):
-        if value == self.value: return self
-        if (nxt:=self.nxt) is None:
+        if (owner:=self.__dict__.get("_owner")) is not None and owner.value_index is not None:
+            found = owner.value_index.nodes(value) # no scan, but buckets are in insertion order, not chain order
+            if not found:
+                return default
+            if len(found) == 1 and self.prev is None: # from the root, the only match is the first
+                return found[0]
+            if owner.positions is not None: # idx is a cache lookup, so rank the candidates by it
+                start = self.idx
+                return min((node for node in found if node.idx >= start), key=lambda node: node.idx, default=default)
+            # without positions every idx walks back to the root; one forward walk meets the first match instead
+            ids = {id(node) for node in found}
+            for node in walk(self, "_nxt"):
+                if id(node) in ids:
+                    return node
             return default
-        return self.nxt.get(value)
+        found, _ = find(self, value, "_nxt")
+        return default if found is None else found
     
     def __repr__(self):
         indent = "  " * self.idx
@@ -141,38 +193,188 @@ class Node(ChainNodeMixin):
         return hash(self.value)
     
     
+class Positions(object):
+    # Caches Node.idx for the chain held by an LL, in node.__dict__["_pos"].
+    # Cached positions below `dirty_from` are current. From `dirty_node`, which sits at
+    # position `dirty_from`, to the end of the chain the cache is stale until `repair` runs.
+    # eager: repair right after every change, so appends cost O(1) and reads never repair.
+    # lazy: repair on the first read after a batch of changes, from the first stale node on.
+
+    def __init__(self, root, eager=False):
+        self.eager = eager
+        self.dirty_from = 0
+        self.dirty_node = root
+        self.repair()
+
+    def position(self, node):
+        if (pos:=node.__dict__.get("_pos")) is not None and pos < self.dirty_from:
+            return pos
+        self.repair()
+        return node.__dict__["_pos"]
+
+    def repair(self): # renumber from the first stale node to the end of the chain
+        node, pos = self.dirty_node, self.dirty_from
+        while node is not None:
+            node.__dict__["_pos"] = pos
+            node = node.__dict__["_nxt"]
+            pos += 1
+        self.dirty_from = sys.maxsize
+        self.dirty_node = None
+
+    def invalidate(self, node, pos): # `node` now sits at `pos`, so every node from it on may have moved
+        if pos <= self.dirty_from: # at an equal position `node` was linked in ahead of the old dirty node
+            self.dirty_from = pos
+            self.dirty_node = node
+        if self.eager:
+            self.repair()
+
+    def linked(self, node, new): # `new` was linked in right after `node`
+        self.forget(new) # a position cached elsewhere must not look current here
+        if (pos:=node.__dict__.get("_pos")) is not None and pos < self.dirty_from:
+            self.invalidate(new, pos + 1)
+        # otherwise `node` is already inside the stale range, which covers `new` too
+
+    def forget(self, node):
+        node.__dict__.pop("_pos", None)
+
+    def unlinked(self, node): # `node` is about to leave the chain; its successor takes its position
+        self.forget(node)
+        if node is self.dirty_node:
+            self.dirty_node = node.__dict__.get("_nxt")
+
+
+POSITION_MODES = {None: None, "lazy": False, "eager": True}
+
 class LL(object):
     root = None
+    positions = None
+    value_index = None
     
-    def __init__(self, root):
+    def __init__(self, root, positions=None, values=False):
         self.root = root if isinstance(root, Node) else Node(root)
+        for node in walk(self.root, "_nxt"): # nodes of a prebuilt chain report their changes to this LL
+            node.__dict__["_owner"] = self
+        self.track_positions(positions)
+        self.track_values(values)
         
-    def __iter__(self):
-        n = [self.root]
-        run = 1
-        while n:
-            print(n)
-            yield n[0]
-            old = n.pop(0)
-            if (nxt:=old.nxt) is None:
-                n = [nxt]
-
+    def track_positions(self, mode):
+        # mode is None (Node.idx walks back to the root), "lazy" or "eager"
+        if mode not in POSITION_MODES:
+            raise ValueError(f"positions must be one of {list(POSITION_MODES)}, got {mode!r}")
+        if mode is None:
+            self.positions = None
+            return
+        self.positions = Positions(self.root, eager=POSITION_MODES[mode])
+        
+    def track_values(self, enabled):
+        # enabled keeps a value -> nodes index, so get and `in` skip the scan
+        self.value_index = ValueIndex(walk(self.root, "_nxt")) if enabled else None
+        
+    def __contains__(self, value):
+        if self.value_index is not None:
+            return value in self.value_index
+        return self.root.get(value) is not None
+        
+    def _linked(self, node, new): # Edge.__set__ linked `new` in right after `node`
+        new.__dict__["_owner"] = self
+        if self.positions is not None:
+            self.positions.linked(node, new)
+        if self.value_index is not None:
+            self.value_index.add(new)
+        
+    def _unlinked(self, node): # `node` was cut out of the chain
+        if self.positions is not None:
+            self.positions.unlinked(node)
+        if self.value_index is not None:
+            self.value_index.discard(node)
+        
+    def __iter__(self): # nodes from the root to the tail
+        return iter(self.root)
+    
+    nodes = __iter__
+    
+    def values(self): # values from the root to the tail
+        return self.root.values()
+    
+    def __reversed__(self): # nodes from the tail back to the root
+        tail, _ = last(self.root, "_nxt")
+        return reversed(tail)
         
     def insert_at(self, node, i: int):
         if not isinstance(node, Node):
             node = Node(node)
         if i == 0:
+            node.__dict__["_owner"] = self
             getattr(node.__class__, "nxt").__set__(node, self.root)
             # node.nxt.__set__(node, self.root)
             # node.nxt = self.root
             self.__dict__["root"] = node
+            if self.positions is not None:
+                self.positions.invalidate(node, 0)
+            if self.value_index is not None:
+                self.value_index.add(node)
             return
         self.root.insert_at(node, i)
 
+    @classmethod
+    def from_iterable(cls, iterable, /, **kwargs):
+        values = iter(iterable)
+        try:
+            root = next(values)
+        except StopIteration:
+            raise ValueError("LL.from_iterable needs at least one value for the root") from None
+        ll = cls(root, **kwargs)
+        ll.extend(values)
+        return ll
+        
+    def extend(self, iterable):
+        # Links every value after the tail in one pass. Writes go straight to the node dicts
+        # instead of through Edge, and the indexes are updated once for the whole run.
+        # A Node from the iterable is linked as is, so it must not belong to any chain yet.
+        tail, _ = last(self.root, "_nxt")
+        start = tail
+        linked = 0
+        try:
+            for value in iterable:
+                if isinstance(value, Node):
+                    node = value
+                    d = node.__dict__
+                    if d.get("_owner") is not None or d.get("prev") is not None or d.get("_nxt") is not None:
+                        raise ValueError(f"Node({node.value!r}) is already linked into a chain")
+                else:
+                    node = Node(value)
+                    d = node.__dict__
+                d["_nxt"] = None # the new tail, whatever the node held before
+                d["prev"] = tail
+                d["_owner"] = self
+                tail.__dict__["_nxt"] = node
+                tail = node
+                linked += 1
+        finally: # on a rejected node, the ones already linked still get indexed
+            if probe.enabled and linked:
+                probe.emit("pointer_write", start, 2 * linked)
+            if (first:=start.__dict__["_nxt"]) is not None:
+                if self.positions is not None:
+                    self.positions.linked(start, first)
+                if self.value_index is not None:
+                    for node in walk(first, "_nxt"):
+                        self.value_index.add(node)
+        
+    def sort(self, key=None, reverse=False):
+        # Relinks the nodes through _nxt, so no Edge call per move, then repairs prev,
+        # the root and the positions. The value index maps values to nodes and is unaffected
+        root, _ = sort_chain(self.root, "_nxt", key, reverse)
+        root.__dict__["prev"] = None
+        relink_backward(root, "_nxt", "prev")
+        self.__dict__["root"] = root
+        if self.positions is not None:
+            self.positions.invalidate(root, 0)
+        
     append = lambda instance, node: instance.root.append(node)
     get = lambda instance, value, /, default=None: instance.root.get(value, default)
     
     def nx_graph(self):
+        import networkx as nx # optional (the "graph" extra) and slow to import, so only loaded here
         g = nx.DiGraph()
         if self.root is not None:
             # self.root.nx_node(G=g)
@@ -5,6 +5,12 @@ This package contains the original implementations that are being preserved
 for reference while the library is being refactored.
 """
 
+from typing import TYPE_CHECKING
+
+from .._lazy import attach
+
+# Imported eagerly: the ``linkedlist`` class shares its name with the
+# submodule, and a lazy lookup would let the submodule shadow the class.
 from .linkedlist import (
     llnode,
     linkedlist,
@@ -13,6 +19,11 @@ from .linkedlist import (
     advLinkedList,
 )
 
+__getattr__, __dir__ = attach(__name__, ["Actual"], {})
+
+if TYPE_CHECKING:
+    from . import Actual
+
 __all__ = [
     "llnode",
     "linkedlist",
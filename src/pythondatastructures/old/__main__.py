@@ -0,0 +1,5 @@
+#Runs the interactive demo: python -m pythondatastructures.old
+
+from .linkedlist import iface
+
+iface()
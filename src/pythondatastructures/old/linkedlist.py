@@ -1,21 +1,40 @@
 #Author FuzzLightyear, aka. Fuzzifier, aka. SudoScientist
 #Date 12/27/2020
 #Linked List with added features. Stack, Queue built off of LinkedList
+#Interactive demo (iface): python -m pythondatastructures.old
 
+from ..skipindex import SkipIndex
+from ..sorting import relink_backward, sort_chain
+from ..traversal import walk, find, nth, last
+from ..valueindex import ValueIndex
 
 class llnode():
     def __init__(self, value):
         self.value = value
         self.left = None
         self.right = None
-    def print(self, count):
-        print(count,").",self.value)
-        if self.right:
-            self.right.print(count+1)
+    def print(self, count): #prints this node and every node right of it, numbered from count
+        for count, node in enumerate(walk(self, "right"), count):
+            print(count,").",node.value)
 
 class linkedlist():
     def __init__(self):
         self.root = None
+    @classmethod
+    def from_iterable(cls, newvals, **kwargs): #build a list from any iterable in one pass, using the subclass's extend
+        l = cls(**kwargs)
+        l.extend(newvals)
+        return l
+    def extend(self, newvals): #link every value after the last node in one pass, subclasses with their own order override it
+        tail, _ = last(self.root, "right")
+        for newval in newvals:
+            newnode = llnode(newval)
+            if tail:
+                tail.right = newnode
+                newnode.left = tail
+            else:
+                self.root = newnode
+            tail = newnode
     def print(self):
         print("Current List")
         if self.root:
@@ -23,44 +42,87 @@ class linkedlist():
 
     
 class stack(linkedlist): #push to front, pop from front
-    def __init__(self):
+    def __init__(self, pool=None):
         super().__init__()
+        self.pool = pool #optional NodePool of llnodes, popval gives popped nodes back to it
+        self.newnode = pool.acquire if pool is not None else llnode
 
     def push(self, newval): #make new node for root, push every other node down stack 1
         if self.root:
-            newroot = llnode(newval)
+            newroot = self.newnode(newval)
             newroot.right = self.root
             self.root.left = newroot
             self.root = newroot
         else:
-            self.root = llnode(newval)
+            self.root = self.newnode(newval)
+
+    def push_many(self, newvals): #push every value in order in one pass, the last one ends up on top
+        root = self.root
+        newnode = self.newnode
+        for newval in newvals:
+            newroot = newnode(newval)
+            if root:
+                newroot.right = root
+                root.left = newroot
+            root = newroot
+        self.root = root
+    extend = push_many
 
     def pop(self): #move stack left by one, and remove + return root, set previous root.right as new root
         if self.root:
             tmp = self.root
             if self.root.right:
                 self.root = self.root.right
+                self.root.left = None #new top has nothing above it
+                tmp.right = None #popped node leaves detached
             else:
                 self.root = None
             return tmp
+
+    def popval(self): #pop and return just the value, the node goes back to the pool for the next push
+        tmp = self.pop()
+        if tmp is None:
+            return None
+        value = tmp.value
+        if self.pool is not None:
+            self.pool.release(tmp)
+        return value
     
         
 class queue(linkedlist): #push to end, pop from front
-    def __init__(self):
+    def __init__(self, pool=None):
         super().__init__()
-    def push(self, newval): #Go to end of list, make new node, set as right element of last element
-        run = False
-        if self.root:
-            itr = self.root
-            run = True
+        self.tail = None #last node, so push never walks the list
+        self.size = 0
+        self.pool = pool #optional NodePool of llnodes, popval gives popped nodes back to it
+        self.newnode = pool.acquire if pool is not None else llnode
+    def __len__(self):
+        return self.size
+    def push(self, newval): #make new node, set as right element of tail, new node becomes tail
+        newnode = self.newnode(newval)
+        if self.tail:
+            self.tail.right = newnode
         else:
-            self.root = llnode(newval)
-        while run:
-            if itr.right:
-                itr = itr.right
-            else:
-                run = False
-                itr.right = llnode(newval)
+            self.root = newnode
+        self.tail = newnode
+        self.size = self.size + 1
+
+    def push_many(self, newvals): #link every value after the tail in one pass
+        head = llnode(None) #stand-in root, so the loop never checks for an empty queue
+        tail = self.tail or head
+        size = self.size
+        make = self.newnode
+        for newval in newvals:
+            newnode = make(newval)
+            tail.right = newnode
+            tail = newnode
+            size = size + 1
+        if head.right:
+            self.root = head.right
+        if tail is not head:
+            self.tail = tail
+        self.size = size
+    extend = push_many
 
     def pop(self): #move queue left by one, and remove + return root, set previous root.right as new root
         if self.root:
@@ -69,50 +131,133 @@ class queue(linkedlist): #push to end, pop from front
                 self.root = self.root.right
             else:
                 self.root = None
+                self.tail = None
+            self.size = self.size - 1
             return tmp
+
+    def popval(self): #pop and return just the value, the node goes back to the pool for the next push
+        tmp = self.pop()
+        if tmp is None:
+            return None
+        value = tmp.value
+        if self.pool is not None:
+            tmp.right = None #pop leaves the link to the new root, a recycled node must come back detached
+            self.pool.release(tmp)
+        return value
         
 
 class advLinkedList(linkedlist):
-    def __init__(self):
+    def __init__(self, skipindex=False, valueindex=False):
         super().__init__()
+        self.skip = SkipIndex("right") if skipindex else None #express lanes over the nodes, O(log n) access by index
+        self.value_index = ValueIndex() if valueindex else None #value -> nodes map, O(1) lookups by value
+    def __contains__(self, value):
+        if self.value_index is not None:
+            return value in self.value_index
+        return self.indexOfVal(value) >= 0
     def indexOfVal_(self, value, node, count):
-            if node.value == value:
-                return count
-            else:
-                if node.right:
-                    return self.indexOfVal_(value, node.right, count+1)
-                else:
-                    return -1
+            found, hops = find(node, value, "right")
+            if found is None:
+                return -1
+            return count + hops
     def indexOfVal(self, value): #returns negative number if doesnt exist. If it does, returns index it is at
+            if self.value_index is not None: #missing values are answered without a scan
+                node = self.value_index.first(value)
+                if node is None:
+                    return -1
+                if self.skip is not None:
+                    return self.skip.rank(node)
             if self.root:
                 return self.indexOfVal_(value, self.root, 0)
             else:
                 return -1
 
     def valAtIndex(self, index): #Gets index, if a node exists at this index, return its value
-            if self.root:
-                itr = self.root
-            else:
+            if index < 0:
                 return
-            count = 0
-            while count != index:
-                if itr.right:
-                    itr = itr.right
-                    count = count + 1
-                else:
-                    return
-            return itr.value
+            if self.skip is not None:
+                itr = self.skip.locate(self.root, index)
+            else:
+                itr = nth(self.root, index, "right")
+            if itr:
+                return itr.value
                     
     def append(self, newval): #adds new llnode with new value to end of list
+            newnode = llnode(newval)
             if self.root:
-                itr = self.root
-                while itr.right:
-                    itr = itr.right
-                itr.right = llnode(newval)
+                if self.skip is not None: #the express lanes reach the last node without walking the list
+                    itr = self.skip.locate(self.root, len(self.skip) - 1)
+                else:
+                    itr, _ = last(self.root, "right")
+                itr.right = newnode
+                newnode.left = itr
             else:
-                self.root = llnode(newval)
+                self.root = newnode
+            if self.skip is not None:
+                self.skip.insert(len(self.skip), newnode)
+            if self.value_index is not None:
+                self.value_index.add(newnode)
             
+    def extend(self, newvals): #appends every value in one pass from the tail, then updates the indexes
+        head = llnode(None) #stand-in root, so the loop never checks for an empty list
+        if self.root:
+            if self.skip is not None:
+                itr = self.skip.locate(self.root, len(self.skip) - 1)
+            else:
+                itr, _ = last(self.root, "right")
+        else:
+            itr = head
+        start = itr
+        for newval in newvals:
+            newnode = llnode(newval)
+            itr.right = newnode
+            newnode.left = itr
+            itr = newnode
+        if start is head and head.right:
+            self.root = head.right
+            self.root.left = None
+        if start.right:
+            if self.skip is not None:
+                self.skip.extend(walk(start.right, "right"))
+            if self.value_index is not None:
+                for node in walk(start.right, "right"):
+                    self.value_index.add(node)
+
+    def sort(self, key=None, reverse=False): #relinks the nodes in order without copying values out, then rebuilds the express lanes
+        self.root, _ = sort_chain(self.root, "right", key, reverse)
+        if self.root:
+            self.root.left = None
+            relink_backward(self.root, "right", "left")
+        if self.skip is not None: #positions changed, value buckets did not
+            self.skip.clear()
+            self.skip.extend(walk(self.root, "right"))
+
+    def unlink_(self, node): #cuts node out through its left and right pointers, returns it
+        if node.left:
+            node.left.right = node.right
+        else:
+            self.root = node.right
+        if node.right:
+            node.right.left = node.left
+        node.left = None
+        node.right = None
+        return node
+
     def removeVal(self, value): #Finds node with given value, returns it and removes it from list
+        if self.skip is not None or self.value_index is not None: #indexed lists unlink through left pointers
+            if self.value_index is not None:
+                node = self.value_index.first(value)
+                if node is None:
+                    return
+                self.value_index.discard(node)
+                if self.skip is not None: #the express lanes give the position in O(log n)
+                    self.skip.remove(self.skip.rank(node))
+            else:
+                node, index = find(self.root, value, "right") #the scan already counted the position
+                if node is None:
+                    return
+                self.skip.remove(index)
+            return self.unlink_(node)
         if self.root:
             itr = self.root
             if itr.value == value:
@@ -198,8 +343,3 @@ def iface():
                 print("Input Index")
                 inp = int(input())
                 print("List[",inp,"] has Value: ", l.valAtIndex(inp))
-
-
-if __name__ == "__main__":
-    iface()
-
@@ -0,0 +1,318 @@
+"""Pairing-heap priority queue built from linked nodes.
+
+A pairing heap is a heap-ordered tree stored in the "leftmost child, next
+sibling" form. Every :class:`HeapNode` links to its first child, to its
+next sibling through the ``next`` link it inherits from
+:class:`~pythondatastructures.nodes.DirectedNode`, and back to its
+previous sibling (or, for a first child, its parent) through ``prev``.
+The back link lets a node the caller holds be cut out of the tree in
+O(1).
+
+Pushing and melding link two roots, which is O(1). Popping removes the
+root and pairs its children up in the classic two passes (left to right
+in pairs, then right to left into one tree), for amortised O(log n).
+Both passes thread through the ``next`` links, so neither needs a
+temporary list or recursion.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Optional
+
+from .nodes import DirectedNode
+
+
+class HeapNode(DirectedNode):
+    """A pairing-heap entry, returned by :meth:`PairingHeap.push` as a handle.
+
+    Attributes
+    ----------
+    priority : Any
+        The key the heap orders by; smaller comes first.
+    child : HeapNode or None
+        The first child.
+    prev : HeapNode or None
+        The previous sibling, or the parent for a first child. None for
+        the root and for nodes not in a heap.
+    """
+
+    __slots__ = ("priority", "child", "prev")
+
+    def __init__(self, value: Any, priority: Any) -> None:
+        super().__init__(value)
+        self.priority = priority
+        self.child: Optional[HeapNode] = None
+        self.prev: Optional[HeapNode] = None
+
+    def __repr__(self) -> str:
+        """Return a string representation showing the value and priority."""
+        return f"HeapNode({self.value!r}, priority={self.priority!r})"
+
+
+def _link(a: HeapNode, b: HeapNode) -> HeapNode:
+    """Join two detached roots and return the root of the result.
+
+    Ties keep ``a`` on top.
+    """
+    if b.priority < a.priority:
+        a, b = b, a
+    first = a.child
+    b.prev = a
+    b.next = first
+    if first is not None:
+        first.prev = b
+    a.child = b
+    return a
+
+
+def _merge_pairs(first: Optional[HeapNode]) -> Optional[HeapNode]:
+    """Combine a sibling list into one tree with the two-pass rule."""
+    if first is None:
+        return None
+    # Pass 1: link neighbours pairwise, left to right, stacking each pair's
+    # root onto a list threaded (in reverse) through ``next``.
+    stacked = None
+    node = first
+    while node is not None:
+        a = node
+        b = a.next
+        node = None if b is None else b.next
+        a.next = a.prev = None
+        if b is not None:
+            b.next = b.prev = None
+            a = _link(a, b)
+        a.next = stacked
+        stacked = a
+    # Pass 2: fold the pairs from right to left into one tree.
+    root = stacked
+    rest = root.next
+    root.next = None
+    while rest is not None:
+        following = rest.next
+        rest.next = None
+        root = _link(root, rest)
+        rest = following
+    return root
+
+
+class PairingHeap:
+    """Min-priority queue with handles, melding and decrease-key.
+
+    Like the library's ``stack`` and ``queue`` it offers :meth:`push` and
+    :meth:`pop`, and :meth:`pop` returns None when the heap is empty.
+    :meth:`push` returns the :class:`HeapNode` holding the value; pass it to
+    :meth:`decrease_key` or :meth:`remove` while it is in the heap.
+
+    Parameters
+    ----------
+    iterable : iterable, optional
+        Values to add, combined in O(n) as by :meth:`heapify`.
+    key : callable, optional
+        Computes a value's priority when :meth:`push` is not given one.
+        Without it a value is its own priority.
+
+    Examples
+    --------
+    >>> heap = PairingHeap([5, 1, 4])
+    >>> task = heap.push("urgent", priority=3)
+    >>> heap.decrease_key(task, 0)
+    >>> [heap.pop() for _ in range(len(heap))]
+    ['urgent', 1, 4, 5]
+    >>> heap.pop() is None
+    True
+    """
+
+    __slots__ = ("_root", "_size", "_key")
+
+    def __init__(
+        self,
+        iterable: Optional[Iterable[Any]] = None,
+        key: Optional[Callable[[Any], Any]] = None,
+    ) -> None:
+        self._root: Optional[HeapNode] = None
+        self._size = 0
+        self._key = key
+        if iterable is not None:
+            self.heapify(iterable)
+
+    def __len__(self) -> int:
+        """Return the number of values in the heap."""
+        return self._size
+
+    def __repr__(self) -> str:
+        """Return a string representation of the heap.
+
+        Returns
+        -------
+        str
+            The class name, the size and the minimum entry.
+        """
+        return f"PairingHeap(size={self._size}, min={self._root!r})"
+
+    def _node(self, value: Any, priority: Any) -> HeapNode:
+        """Create a detached entry, deriving the priority if it is None."""
+        if priority is None:
+            priority = value if self._key is None else self._key(value)
+        return HeapNode(value, priority)
+
+    def push(self, value: Any, priority: Any = None) -> HeapNode:
+        """Add a value in O(1).
+
+        Parameters
+        ----------
+        value : Any
+            The value to add. It cannot be None.
+        priority : Any, optional
+            The value's priority. Defaults to ``key(value)``, or the value
+            itself when the heap has no key.
+
+        Returns
+        -------
+        HeapNode
+            The handle of the new entry.
+
+        Raises
+        ------
+        TypeError
+            If the value is None.
+        """
+        node = self._node(value, priority)
+        root = self._root
+        self._root = node if root is None else _link(root, node)
+        self._size += 1
+        return node
+
+    def heapify(self, values: Iterable[Any]) -> None:
+        """Add many values in O(n).
+
+        The new entries are linked in balanced rounds, pairing neighbours
+        until one tree is left, so the first :meth:`pop` after a bulk load
+        does not face n children.
+
+        Parameters
+        ----------
+        values : iterable
+            The values to add. Each is its own priority, or ``key(value)``
+            when the heap has a key.
+        """
+        trees = [self._node(value, None) for value in values]
+        if not trees:
+            return
+        self._size += len(trees)
+        if self._root is not None:
+            trees.append(self._root)
+        while len(trees) > 1:
+            paired = [_link(a, b) for a, b in zip(trees[::2], trees[1::2])]
+            if len(trees) % 2:
+                paired.append(trees[-1])
+            trees = paired
+        self._root = trees[0]
+
+    def peek(self) -> Optional[Any]:
+        """Return the value with the smallest priority, or None if empty."""
+        return None if self._root is None else self._root.value
+
+    def peek_node(self) -> Optional[HeapNode]:
+        """Return the entry with the smallest priority, or None if empty."""
+        return self._root
+
+    def pop(self) -> Optional[Any]:
+        """Remove and return the value with the smallest priority.
+
+        Returns
+        -------
+        Any or None
+            The value, or None if the heap is empty.
+        """
+        root = self._root
+        if root is None:
+            return None
+        self._root = _merge_pairs(root.child)
+        root.child = None
+        self._size -= 1
+        return root.value
+
+    def meld(self, other: "PairingHeap") -> None:
+        """Move every entry of ``other`` into this heap in O(1).
+
+        ``other`` is left empty; its handles now belong to this heap.
+        """
+        if other is self or other._root is None:
+            return
+        root = self._root
+        self._root = other._root if root is None else _link(root, other._root)
+        self._size += other._size
+        other._root = None
+        other._size = 0
+
+    def _check(self, node: HeapNode) -> None:
+        """Raise ValueError unless ``node`` is the root or has a parent link."""
+        if node.prev is None and node is not self._root:
+            raise ValueError("node is not in this heap")
+
+    @staticmethod
+    def _cut(node: HeapNode) -> None:
+        """Detach a non-root node, with its subtree, from its parent."""
+        prev, following = node.prev, node.next
+        if prev.child is node:
+            prev.child = following
+        else:
+            prev.next = following
+        if following is not None:
+            following.prev = prev
+        node.prev = node.next = None
+
+    def decrease_key(self, node: HeapNode, priority: Any) -> None:
+        """Lower the priority of an entry in O(1).
+
+        Parameters
+        ----------
+        node : HeapNode
+            A handle returned by :meth:`push` that is still in the heap.
+        priority : Any
+            The new priority. It must not be greater than the current one.
+
+        Raises
+        ------
+        ValueError
+            If the priority would increase or the node is not in the heap.
+        """
+        if node.priority < priority:
+            raise ValueError(
+                f"new priority {priority!r} is greater than {node.priority!r}"
+            )
+        self._check(node)
+        node.priority = priority
+        if node is self._root:
+            return
+        self._cut(node)
+        self._root = _link(self._root, node)
+
+    def remove(self, node: HeapNode) -> Any:
+        """Remove an entry in amortised O(log n) and return its value.
+
+        Parameters
+        ----------
+        node : HeapNode
+            A handle returned by :meth:`push` that is still in the heap.
+
+        Raises
+        ------
+        ValueError
+            If the node is not in the heap.
+        """
+        self._check(node)
+        if node is self._root:
+            return self.pop()
+        self._cut(node)
+        subtree = _merge_pairs(node.child)
+        node.child = None
+        if subtree is not None:
+            self._root = _link(self._root, subtree)
+        self._size -= 1
+        return node.value
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._root = None
+        self._size = 0
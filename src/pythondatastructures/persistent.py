@@ -0,0 +1,293 @@
+"""Memory-mapped, file-backed singly-linked list.
+
+:class:`MappedLinkedList` stores the ``DirectedNode`` model on disk: every
+node is a fixed-size record holding the byte offset of the next record and
+a :mod:`struct`-packed value. The file is accessed through :mod:`mmap`, so
+opening a list only reads the header, and pages are faulted in lazily as
+records are touched; the working set follows the records actually visited
+rather than the size of the list.
+
+File layout
+-----------
+========  ======  ==================================================
+offset    size    field
+========  ======  ==================================================
+0         8       magic ``b"PDSLIST1"``
+8         4       format version (u32)
+12        4       record size in bytes (u32)
+16        8       offset of the first record, 0 if empty (u64)
+24        8       offset of the last record, 0 if empty (u64)
+32        8       number of linked records (u64)
+40        8       offset of the first free record, 0 if none (u64)
+48        8       number of records ever carved from the file (u64)
+56        8       number of records the file has room for (u64)
+64        32      struct format of the values, NUL padded
+96        32      reserved
+128       ...     records: next offset (u64) then the packed value
+========  ======  ==================================================
+
+Offset 0 is the header, so it doubles as the null link. Removed records
+are chained through their ``next`` field into a free-list and reused
+before the file grows; the file doubles in size when it runs out of room.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from typing import Any, Iterator, Optional, Tuple
+
+MAGIC = b"PDSLIST1"
+VERSION = 1
+HEADER_SIZE = 128
+NIL = 0
+
+_PREFIX = struct.Struct("<8sII")
+_STATE = struct.Struct("<QQQQQQ")  # head, tail, count, free, used, capacity
+_FORMAT = struct.Struct("<32s")
+_LINK = struct.Struct("<Q")
+
+
+class MappedLinkedList:
+    """Singly-linked list of fixed-width values kept in a mapped file.
+
+    Values are packed with ``fmt``; a one-field format stores and returns
+    scalars, a longer format tuples. The list follows the value-based
+    :class:`~pythondatastructures.linkedlist.LinkedList` contract for
+    :meth:`insert`, :meth:`append` and :meth:`pop`, and offers the
+    ``valAtIndex`` lookup of ``old.linkedlist.advLinkedList``.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The list file. It is created if it does not exist or is empty.
+    fmt : str, optional
+        Struct format of the values. Defaults to ``"<q"`` for a new file;
+        for an existing file it must match the stored format if given.
+    capacity : int, optional
+        Number of records to reserve when creating a file (default is
+        1024).
+
+    Examples
+    --------
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), "list.pds")
+    >>> with MappedLinkedList(path) as ml:
+    ...     for value in (10, 20, 30):
+    ...         ml.append(value)
+    ...     ml.pop()
+    10
+    >>> with MappedLinkedList(path) as ml:
+    ...     list(ml), ml.valAtIndex(1)
+    ([20, 30], 30)
+    """
+
+    def __init__(
+        self, path: Any, fmt: Optional[str] = None, capacity: int = 1024
+    ) -> None:
+        if fmt is not None and len(fmt.encode("ascii")) > 32:
+            raise ValueError("fmt must be at most 32 characters")
+        self.path = os.fspath(path)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._file = os.fdopen(fd, "r+b")
+        if os.fstat(fd).st_size == 0:
+            self._create(fmt or "<q", max(capacity, 1))
+        self._map = mmap.mmap(fd, 0)
+        magic, version, record_size = _PREFIX.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{self.path} is not a version {VERSION} list")
+        stored = _FORMAT.unpack_from(self._map, 64)[0].rstrip(b"\0")
+        stored = stored.decode("ascii")
+        if fmt is not None and fmt != stored:
+            self.close()
+            raise ValueError(f"file stores {stored!r} values, not {fmt!r}")
+        self.fmt = stored
+        self._value = struct.Struct(stored)
+        self._record_size = record_size
+        (self._head, self._tail, self._size, self._free, self._used,
+         self._capacity) = _STATE.unpack_from(self._map, 16)
+
+    def _create(self, fmt: str, capacity: int) -> None:
+        """Write the header of an empty list with room for ``capacity``."""
+        encoded = fmt.encode("ascii")
+        record_size = _LINK.size + struct.calcsize(fmt)
+        header = bytearray(HEADER_SIZE)
+        _PREFIX.pack_into(header, 0, MAGIC, VERSION, record_size)
+        _STATE.pack_into(header, 16, NIL, NIL, 0, NIL, 0, capacity)
+        _FORMAT.pack_into(header, 64, encoded)
+        self._file.write(header)
+        self._file.truncate(HEADER_SIZE + capacity * record_size)
+        self._file.flush()
+
+    def __enter__(self) -> "MappedLinkedList":
+        """Return the list itself."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the list on leaving the block."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of stored values."""
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the stored values from head to tail."""
+        offset = self._head
+        while offset != NIL:
+            yield self._load(offset)
+            offset = _LINK.unpack_from(self._map, offset)[0]
+
+    def __repr__(self) -> str:
+        """Return a string representation showing the path and size."""
+        return f"MappedLinkedList({self.path!r}, size={self._size})"
+
+    def _sync(self) -> None:
+        """Write the in-memory list state back to the header."""
+        _STATE.pack_into(self._map, 16, self._head, self._tail, self._size,
+                         self._free, self._used, self._capacity)
+
+    def _load(self, offset: int) -> Any:
+        """Return the value stored in the record at ``offset``."""
+        value = self._value.unpack_from(self._map, offset + _LINK.size)
+        return value[0] if len(value) == 1 else value
+
+    def _next(self, offset: int) -> int:
+        """Read the link of the record at ``offset``."""
+        return _LINK.unpack_from(self._map, offset)[0]
+
+    def _set_next(self, offset: int, following: int) -> None:
+        """Point the record at ``offset`` to the one at ``following``."""
+        _LINK.pack_into(self._map, offset, following)
+
+    def _grow(self) -> None:
+        """Double the file and remap it."""
+        self._capacity *= 2
+        self._map.close()
+        self._file.truncate(HEADER_SIZE + self._capacity * self._record_size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+    def _alloc(self, value: Any) -> int:
+        """Return the offset of a fresh record holding ``value``."""
+        # Pack first, so a value of the wrong shape leaves the file as is.
+        fields = value if isinstance(value, tuple) else (value,)
+        packed = self._value.pack(*fields)
+        if self._free != NIL:
+            offset = self._free
+            self._free = self._next(offset)
+        else:
+            if self._used == self._capacity:
+                self._grow()
+            offset = HEADER_SIZE + self._used * self._record_size
+            self._used += 1
+        start = offset + _LINK.size
+        self._map[start:start + len(packed)] = packed
+        self._set_next(offset, NIL)
+        return offset
+
+    def _release(self, offset: int) -> None:
+        """Push the record at ``offset`` onto the free-list."""
+        self._set_next(offset, self._free)
+        self._free = offset
+
+    def _anchor(self, relative_index: int) -> Tuple[int, int]:
+        """Return ``(previous, current)`` offsets for a relative index.
+
+        Raises
+        ------
+        ValueError
+            If the relative index is negative or larger than the list.
+        """
+        if relative_index < 0 or relative_index > self._size:
+            raise ValueError(
+                f"relative_index {relative_index} is out of bounds"
+            )
+        if relative_index == self._size:
+            return self._tail, NIL
+        prev, offset = NIL, self._head
+        for _ in range(relative_index):
+            prev, offset = offset, self._next(offset)
+        return prev, offset
+
+    def valAtIndex(self, index: int) -> Any:
+        """Return the value at ``index``, or None if out of range.
+
+        Only the records on the path from the head are paged in.
+        """
+        if index < 0 or index >= self._size:
+            return None
+        if index == self._size - 1:
+            return self._load(self._tail)
+        offset = self._head
+        for _ in range(index):
+            offset = self._next(offset)
+        return self._load(offset)
+
+    def insert(self, value: Any, relative_index: int = 0) -> None:
+        """Insert a value so that ``relative_index`` values precede it.
+
+        Raises
+        ------
+        ValueError
+            If the relative index is negative or larger than the list.
+        struct.error
+            If the value does not match the list's format.
+        """
+        prev, following = self._anchor(relative_index)
+        new = self._alloc(value)
+        self._set_next(new, following)
+        if prev == NIL:
+            self._head = new
+        else:
+            self._set_next(prev, new)
+        if following == NIL:
+            self._tail = new
+        self._size += 1
+        self._sync()
+
+    def append(self, value: Any) -> None:
+        """Append a value after the tail in O(1)."""
+        self.insert(value, self._size)
+
+    def pop(self, relative_index: int = 0) -> Optional[Any]:
+        """Remove and return the value preceded by ``relative_index`` others.
+
+        Returns
+        -------
+        Any or None
+            The removed value, or None if ``relative_index`` equals the
+            list length.
+
+        Raises
+        ------
+        ValueError
+            If the relative index is negative or larger than the list.
+        """
+        prev, offset = self._anchor(relative_index)
+        if offset == NIL:
+            return None
+        value = self._load(offset)
+        following = self._next(offset)
+        if prev == NIL:
+            self._head = following
+        else:
+            self._set_next(prev, following)
+        if following == NIL:
+            self._tail = prev
+        self._release(offset)
+        self._size -= 1
+        self._sync()
+        return value
+
+    def flush(self) -> None:
+        """Write dirty pages back to the file."""
+        self._map.flush()
+
+    def close(self) -> None:
+        """Flush and unmap the file."""
+        if getattr(self, "_map", None) is not None and not self._map.closed:
+            self._map.flush()
+            self._map.close()
+        self._file.close()
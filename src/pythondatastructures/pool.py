@@ -0,0 +1,160 @@
+"""Free-list pool that recycles released nodes.
+
+A structure that pushes and pops at a high rate creates and discards one
+node per item. Every discarded node is work for the allocator, and nodes
+with a ``__dict__`` are tracked by the cyclic garbage collector, so each
+allocation also counts towards the next collection. A :class:`NodePool`
+keeps released nodes on a free list and hands them out again, so under
+steady churn a structure allocates only while the number of items it
+holds grows.
+
+A pool belongs to one structure and is not thread-safe. It holds at most
+``cap`` free nodes; :meth:`NodePool.shrink` returns the surplus to the
+allocator after a burst.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, List
+
+
+class NodePool:
+    """A bounded free list of reusable nodes.
+
+    Parameters
+    ----------
+    factory : callable
+        Creates a node from a value when the free list is empty, for
+        example ``llnode``.
+    cap : int, optional
+        Maximum number of free nodes kept (default is 1024).
+
+    Attributes
+    ----------
+    hits : int
+        Number of :meth:`acquire` calls served from the free list.
+    misses : int
+        Number of :meth:`acquire` calls that created a node.
+
+    Raises
+    ------
+    ValueError
+        If ``cap`` is negative.
+
+    Examples
+    --------
+    >>> from pythondatastructures.old import llnode
+    >>> pool = NodePool(llnode, cap=2)
+    >>> node = pool.acquire("a")
+    >>> pool.release(node)
+    True
+    >>> pool.acquire("b") is node, node.value
+    (True, 'b')
+    >>> pool.hits, pool.misses
+    (1, 1)
+    """
+
+    __slots__ = ("_factory", "_free", "_cap", "hits", "misses")
+
+    def __init__(self, factory: Callable[[Any], Any], cap: int = 1024) -> None:
+        self._factory = factory
+        self._free: List[Any] = []
+        self.cap = cap
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cap(self) -> int:
+        """Return the maximum number of free nodes kept."""
+        return self._cap
+
+    @cap.setter
+    def cap(self, cap: int) -> None:
+        """Set the cap, dropping free nodes above it.
+
+        Raises
+        ------
+        ValueError
+            If ``cap`` is negative.
+        """
+        if cap < 0:
+            raise ValueError(f"cap must be non-negative, got {cap}")
+        self._cap = cap
+        del self._free[cap:]
+
+    def __len__(self) -> int:
+        """Return the number of free nodes."""
+        return len(self._free)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the pool.
+
+        Returns
+        -------
+        str
+            The class name, the free and maximum node counts and the
+            counters.
+        """
+        return (f"NodePool(free={len(self._free)}, cap={self._cap}, "
+                f"hits={self.hits}, misses={self.misses})")
+
+    def acquire(self, value: Any) -> Any:
+        """Return a node holding ``value``, reusing a free one if possible.
+
+        A reused node keeps the links it had when released, so release
+        only detached nodes.
+        """
+        free = self._free
+        if free:
+            node = free.pop()
+            node.value = value
+            self.hits += 1
+            return node
+        self.misses += 1
+        return self._factory(value)
+
+    def release(self, node: Any) -> bool:
+        """Give a detached node back to the pool.
+
+        The node's value is cleared so the pool does not keep it alive.
+
+        Returns
+        -------
+        bool
+            True if the node was kept, False if the pool was full and the
+            node was left to the allocator.
+        """
+        free = self._free
+        if len(free) >= self._cap:
+            return False
+        node.value = None
+        free.append(node)
+        return True
+
+    def shrink(self, keep: int = 0) -> int:
+        """Drop free nodes until at most ``keep`` remain.
+
+        Parameters
+        ----------
+        keep : int, optional
+            Number of free nodes to keep (default is 0).
+
+        Returns
+        -------
+        int
+            The number of nodes dropped.
+
+        Raises
+        ------
+        ValueError
+            If ``keep`` is negative.
+        """
+        if keep < 0:
+            raise ValueError(f"keep must be non-negative, got {keep}")
+        dropped = max(len(self._free) - keep, 0)
+        del self._free[keep:]
+        return dropped
+
+    def reset_stats(self) -> None:
+        """Set the hit and miss counters back to zero."""
+        self.hits = self.misses = 0
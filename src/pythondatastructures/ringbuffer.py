@@ -0,0 +1,239 @@
+"""Bounded FIFO queue in a preallocated ring of slots.
+
+:class:`RingBuffer` keeps up to ``capacity`` items in a Python list that
+is allocated once, at construction. ``head`` is the slot of the oldest
+item and ``size`` the number of items; a push writes slot
+``(head + size) % capacity`` and a pop reads slot ``head``. Pushing and
+popping only store references into existing slots, so the queue
+allocates nothing per item, unlike ``old.linkedlist.queue``, which
+creates one ``llnode`` per push.
+
+When the ring is full, the overflow policy decides what a push does:
+
+``"raise"``
+    Raise :class:`queue.Full` and leave the buffer unchanged.
+``"drop_oldest"``
+    Evict the oldest item to make room, as ``deque(maxlen=...)`` does.
+``"drop_newest"``
+    Discard the pushed item.
+"""
+
+from __future__ import annotations
+
+from queue import Full
+from typing import Any, Iterable, Iterator, List, Optional
+
+#: Accepted values for the ``overflow`` argument of :class:`RingBuffer`.
+OVERFLOW_POLICIES = ("raise", "drop_oldest", "drop_newest")
+
+
+class RingBuffer:
+    """Fixed-capacity FIFO queue with a configurable overflow policy.
+
+    Like ``old.linkedlist.queue`` it offers :meth:`push` and :meth:`pop`,
+    and :meth:`pop` returns None when the queue is empty.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximum number of items held. Must be at least 1.
+    overflow : str, optional
+        One of :data:`OVERFLOW_POLICIES` (default is ``"raise"``).
+
+    Attributes
+    ----------
+    dropped : int
+        Number of items discarded by the overflow policy so far.
+
+    Examples
+    --------
+    >>> rb = RingBuffer(3, overflow="drop_oldest")
+    >>> for value in range(5):
+    ...     _ = rb.push(value)
+    >>> list(rb), len(rb), rb.dropped
+    ([2, 3, 4], 3, 2)
+    >>> rb.pop(), rb.drain()
+    (2, [3, 4])
+    >>> rb.pop() is None
+    True
+    """
+
+    __slots__ = ("_slots", "_capacity", "_head", "_size", "_policy",
+                 "dropped")
+
+    def __init__(self, capacity: int, overflow: str = "raise") -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"overflow must be one of {list(OVERFLOW_POLICIES)}, "
+                f"got {overflow!r}"
+            )
+        self._slots: List[Any] = [None] * capacity
+        self._capacity = capacity
+        self._head = 0
+        self._size = 0
+        self._policy = overflow
+        self.dropped = 0
+
+    @property
+    def capacity(self) -> int:
+        """Return the maximum number of items."""
+        return self._capacity
+
+    @property
+    def overflow(self) -> str:
+        """Return the overflow policy."""
+        return self._policy
+
+    def __len__(self) -> int:
+        """Return the number of items in O(1)."""
+        return self._size
+
+    def full(self) -> bool:
+        """Return whether every slot is in use."""
+        return self._size == self._capacity
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the items from oldest to newest without removing them."""
+        slots, capacity = self._slots, self._capacity
+        index = self._head
+        for _ in range(self._size):
+            yield slots[index]
+            index += 1
+            if index == capacity:
+                index = 0
+
+    def __repr__(self) -> str:
+        """Return a string representation of the buffer.
+
+        Returns
+        -------
+        str
+            The class name, the items, the capacity and the policy.
+        """
+        return (f"RingBuffer({list(self)!r}, capacity={self._capacity}, "
+                f"overflow={self._policy!r})")
+
+    def push(self, value: Any) -> Optional[Any]:
+        """Append an item at the tail.
+
+        Parameters
+        ----------
+        value : Any
+            The item to append.
+
+        Returns
+        -------
+        Any or None
+            The item discarded by the overflow policy (the evicted oldest
+            item, or ``value`` itself for ``"drop_newest"``), or None if
+            nothing was discarded.
+
+        Raises
+        ------
+        queue.Full
+            If the buffer is full and the policy is ``"raise"``.
+        """
+        size, capacity = self._size, self._capacity
+        if size < capacity:
+            tail = self._head + size
+            if tail >= capacity:
+                tail -= capacity
+            self._slots[tail] = value
+            self._size = size + 1
+            return None
+        policy = self._policy
+        if policy == "drop_oldest":
+            # The oldest slot is also the next tail slot once it is freed.
+            head = self._head
+            evicted = self._slots[head]
+            self._slots[head] = value
+            head += 1
+            self._head = 0 if head == capacity else head
+            self.dropped += 1
+            return evicted
+        if policy == "drop_newest":
+            self.dropped += 1
+            return value
+        raise Full(f"RingBuffer is full ({capacity} items)")
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Push every value in order, applying the overflow policy to each.
+
+        Raises
+        ------
+        queue.Full
+            If the buffer fills up and the policy is ``"raise"``; the
+            values before the one that did not fit stay pushed.
+        """
+        push = self.push
+        for value in values:
+            push(value)
+
+    def peek(self) -> Optional[Any]:
+        """Return the oldest item without removing it, or None if empty."""
+        return self._slots[self._head] if self._size else None
+
+    def pop(self) -> Optional[Any]:
+        """Remove and return the oldest item.
+
+        Returns
+        -------
+        Any or None
+            The oldest item, or None if the buffer is empty.
+        """
+        if not self._size:
+            return None
+        head = self._head
+        value = self._slots[head]
+        self._slots[head] = None  # drop the reference, keep the slot
+        head += 1
+        self._head = 0 if head == self._capacity else head
+        self._size -= 1
+        return value
+
+    def drain(self, n: Optional[int] = None) -> List[Any]:
+        """Remove and return up to ``n`` of the oldest items.
+
+        The items are copied out with at most two slice operations, one on
+        each side of the wrap-around point.
+
+        Parameters
+        ----------
+        n : int, optional
+            Maximum number of items to remove (default is all of them).
+
+        Returns
+        -------
+        list
+            The removed items, oldest first.
+
+        Raises
+        ------
+        ValueError
+            If ``n`` is negative.
+        """
+        size = self._size
+        if n is None or n > size:
+            n = size
+        elif n < 0:
+            raise ValueError(f"n must be non-negative, got {n}")
+        slots, capacity, head = self._slots, self._capacity, self._head
+        end = head + n
+        if end <= capacity:
+            items = slots[head:end]
+            slots[head:end] = [None] * n
+        else:
+            end -= capacity
+            items = slots[head:] + slots[:end]
+            slots[head:] = [None] * (capacity - head)
+            slots[:end] = [None] * end
+        self._head = end if end < capacity else 0
+        self._size = size - n
+        return items
+
+    def clear(self) -> None:
+        """Remove every item, keeping the slots."""
+        self.drain()
+        self._head = 0
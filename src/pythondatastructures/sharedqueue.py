@@ -0,0 +1,277 @@
+"""Fixed-slot ring-buffer queue in a ``multiprocessing.shared_memory`` segment.
+
+:class:`SharedRingQueue` lets processes exchange items without pickling
+them through a pipe. The segment starts with a header holding two
+monotonically increasing counters, ``head`` (next slot to read) and
+``tail`` (next slot to write), followed by the slot geometry and the record
+format. Items are written straight into their slot with
+:func:`struct.pack_into` or a slice assignment into the shared buffer, and
+are only turned into Python objects when a consumer pops them.
+
+Layout
+------
+========  ======  ==========================================
+offset    size    field
+========  ======  ==========================================
+0         8       head counter (u64)
+8         8       tail counter (u64)
+16        4       number of slots (u32)
+20        4       slot size in bytes (u32)
+24        32      struct format, NUL padded; empty for bytes
+56        8       reserved
+64        ...     ``slots * slot_size`` bytes of records
+========  ======  ==========================================
+
+In bytes mode every record is a u32 length prefix followed by the payload.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import struct
+from multiprocessing import shared_memory
+from queue import Full
+from typing import Any, Optional
+
+_HEADER = struct.Struct("<QQII32s")
+_COUNTER = struct.Struct("<Q")
+_LENGTH = struct.Struct("<I")
+HEADER_SIZE = 64
+
+
+def _open_segment(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without letting a resource tracker
+    started for this process unlink it when we exit.
+
+    Before Python 3.13 attaching always registers the segment. A process
+    that already talks to a tracker is the creator or one of its children,
+    which share the creator's tracker, so the registration is left for the
+    creator's :meth:`SharedRingQueue.unlink` to remove. Only a process that
+    had no tracker, and so gets one of its own, unregisters again.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 has no ``track`` argument
+        from multiprocessing import resource_tracker
+        shared = resource_tracker._resource_tracker._fd is not None
+        segment = shared_memory.SharedMemory(name=name)
+        if not shared:
+            resource_tracker.unregister(segment._name, "shared_memory")
+        return segment
+
+
+class SharedRingQueue:
+    """FIFO queue of fixed-size records in shared memory.
+
+    Like ``old.linkedlist.queue`` it offers :meth:`push` and :meth:`pop`,
+    and :meth:`pop` returns None when the queue is empty. Since the segment
+    has a fixed number of slots, :meth:`push` raises :class:`queue.Full`
+    when every slot is taken.
+
+    Without a lock the queue is safe for one producer and one consumer
+    process: only the producer writes ``tail`` and only the consumer writes
+    ``head``, and each publishes its counter after touching the slot. Pass
+    ``lock=True`` (or a ``multiprocessing.Lock``) for several producers or
+    consumers.
+
+    Parameters
+    ----------
+    slots : int, optional
+        Number of records the queue holds (default is 1024).
+    slot_size : int, optional
+        Bytes per record in bytes mode (default is 256), including the
+        4-byte length prefix. Ignored when ``fmt`` is given.
+    fmt : str, optional
+        A :mod:`struct` format for fixed-width records. Values are pushed as
+        tuples (or a single scalar for one-field formats) and popped the
+        same way. If None, records are length-prefixed bytes.
+    lock : bool or lock, optional
+        A lock shared by all users, True to create one, or None for the
+        lock-free single-producer, single-consumer mode.
+    name : str, optional
+        Name for the shared memory segment. A random name is chosen if
+        None.
+
+    Examples
+    --------
+    >>> q = SharedRingQueue(slots=4, fmt="<qd")
+    >>> q.push((1, 0.5))
+    >>> q.push((2, 1.5))
+    >>> q.pop(), len(q)
+    ((1, 0.5), 1)
+    >>> other = SharedRingQueue.attach(q.name)
+    >>> other.pop(), other.pop()
+    ((2, 1.5), None)
+    >>> other.close()
+    >>> q.close(); q.unlink()
+    """
+
+    def __init__(
+        self,
+        slots: int = 1024,
+        slot_size: int = 256,
+        fmt: Optional[str] = None,
+        lock: Any = None,
+        name: Optional[str] = None,
+    ) -> None:
+        if slots < 1:
+            raise ValueError(f"slots must be positive, got {slots}")
+        if fmt is not None:
+            slot_size = struct.calcsize(fmt)
+        elif slot_size <= _LENGTH.size:
+            raise ValueError(
+                f"slot_size must exceed {_LENGTH.size}, got {slot_size}"
+            )
+        encoded = (fmt or "").encode("ascii")
+        if len(encoded) > 32:
+            raise ValueError("fmt must be at most 32 characters")
+        segment = shared_memory.SharedMemory(
+            name=name, create=True, size=HEADER_SIZE + slots * slot_size
+        )
+        _HEADER.pack_into(segment.buf, 0, 0, 0, slots, slot_size, encoded)
+        if lock is True:
+            lock = multiprocessing.Lock()
+        self._setup(segment, lock)
+
+    @classmethod
+    def attach(cls, name: str, lock: Any = None) -> "SharedRingQueue":
+        """Open an existing queue by segment name.
+
+        Parameters
+        ----------
+        name : str
+            The ``name`` of the queue that created the segment.
+        lock : lock, optional
+            The lock the creating queue uses, if any.
+
+        Returns
+        -------
+        SharedRingQueue
+            A queue sharing the creator's slots and counters.
+        """
+        queue = cls.__new__(cls)
+        queue._setup(_open_segment(name), lock)
+        return queue
+
+    def _setup(self, segment: shared_memory.SharedMemory, lock: Any) -> None:
+        """Read the geometry from the segment header."""
+        _, _, slots, slot_size, fmt = _HEADER.unpack_from(segment.buf, 0)
+        fmt = fmt.rstrip(b"\0").decode("ascii")
+        self._segment = segment
+        self._buf = segment.buf
+        self._lock = lock
+        self.slots = slots
+        self.slot_size = slot_size
+        self.fmt = fmt or None
+        self._record = struct.Struct(fmt) if fmt else None
+
+    def __reduce__(self):
+        """Pickle as a reference to the segment, so that child processes
+        attach to the same queue instead of copying it."""
+        return (type(self).attach, (self.name, self._lock))
+
+    def __enter__(self) -> "SharedRingQueue":
+        """Return the queue itself."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Detach from the segment on leaving the block."""
+        self.close()
+
+    @property
+    def name(self) -> str:
+        """Return the shared memory segment name."""
+        return self._segment.name
+
+    def __len__(self) -> int:
+        """Return the number of stored records."""
+        buf = self._buf
+        return _COUNTER.unpack_from(buf, 8)[0] - _COUNTER.unpack_from(buf, 0)[0]
+
+    def _write(self, value: Any) -> None:
+        """Store ``value`` in the tail slot and publish it."""
+        buf = self._buf
+        head = _COUNTER.unpack_from(buf, 0)[0]
+        tail = _COUNTER.unpack_from(buf, 8)[0]
+        if tail - head >= self.slots:
+            raise Full
+        offset = HEADER_SIZE + (tail % self.slots) * self.slot_size
+        record = self._record
+        if record is not None:
+            if isinstance(value, tuple):
+                record.pack_into(buf, offset, *value)
+            else:
+                record.pack_into(buf, offset, value)
+        else:
+            size = len(value)
+            if size > self.slot_size - _LENGTH.size:
+                raise ValueError(
+                    f"item of {size} bytes does not fit a "
+                    f"{self.slot_size}-byte slot"
+                )
+            _LENGTH.pack_into(buf, offset, size)
+            start = offset + _LENGTH.size
+            buf[start:start + size] = value
+        _COUNTER.pack_into(buf, 8, tail + 1)
+
+    def _read(self) -> Any:
+        """Return the head record and release its slot, or None if empty."""
+        buf = self._buf
+        head = _COUNTER.unpack_from(buf, 0)[0]
+        if head == _COUNTER.unpack_from(buf, 8)[0]:
+            return None
+        offset = HEADER_SIZE + (head % self.slots) * self.slot_size
+        record = self._record
+        if record is not None:
+            value = record.unpack_from(buf, offset)
+            if len(value) == 1:
+                value = value[0]
+        else:
+            size = _LENGTH.unpack_from(buf, offset)[0]
+            start = offset + _LENGTH.size
+            value = bytes(buf[start:start + size])
+        _COUNTER.pack_into(buf, 0, head + 1)
+        return value
+
+    def push(self, value: Any) -> None:
+        """Append a record at the tail.
+
+        Parameters
+        ----------
+        value : bytes-like or tuple or scalar
+            Bytes in bytes mode, otherwise the fields for ``fmt``.
+
+        Raises
+        ------
+        queue.Full
+            If every slot is in use.
+        ValueError
+            If a bytes item is longer than a slot can hold.
+        """
+        if self._lock is None:
+            self._write(value)
+        else:
+            with self._lock:
+                self._write(value)
+
+    def pop(self) -> Any:
+        """Remove and return the record at the head.
+
+        Returns
+        -------
+        bytes or tuple or scalar or None
+            The oldest record, or None if the queue is empty.
+        """
+        if self._lock is None:
+            return self._read()
+        with self._lock:
+            return self._read()
+
+    def close(self) -> None:
+        """Detach this process from the segment."""
+        self._buf = None
+        self._segment.close()
+
+    def unlink(self) -> None:
+        """Destroy the segment. Call once, from the creating process."""
+        self._segment.unlink()
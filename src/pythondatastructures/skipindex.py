@@ -0,0 +1,300 @@
+"""Indexable skip-list layer for positional access into a linked chain.
+
+A :class:`SkipIndex` sits on top of an existing singly-linked chain without
+changing it. A random subset of the chain's nodes is promoted into towers;
+each tower level links to the next tower of at least that height and stores
+the width of that link, i.e. how many base nodes it spans. Walking the
+express lanes from the top level down reaches any position in expected
+O(log n) steps, after which a few hops along the base chain finish the
+lookup.
+"""
+
+from __future__ import annotations
+
+import random
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class _Tower:
+    """Express lane entries for one promoted base node."""
+
+    __slots__ = ("node", "next", "prev", "width")
+
+    def __init__(self, node: Any, height: int) -> None:
+        self.node = node
+        self.next: List[Optional[_Tower]] = [None] * height
+        self.prev: List[Optional[_Tower]] = [None] * height
+        self.width: List[int] = [0] * height
+
+
+class SkipIndex:
+    """Positional skip-list index over a chain of linked nodes.
+
+    The index only stores towers for promoted nodes; the chain itself is
+    left untouched and is traversed through ``link`` for the final hops of
+    a lookup. Callers report every insertion and removal by position so
+    that tower widths stay correct.
+
+    Parameters
+    ----------
+    link : str, optional
+        Name of the attribute holding the following node (default is
+        ``"next"``).
+    p : float, optional
+        Probability of promoting a node one level higher (default is 0.25).
+        Lower values use fewer towers at the cost of more base-chain hops.
+    max_levels : int, optional
+        Maximum tower height (default is 32).
+    seed : int, optional
+        Seed for the promotion coin flips, for reproducible layouts.
+
+    Examples
+    --------
+    >>> from pythondatastructures.nodes import SinglyLinkedNode
+    >>> index = SkipIndex()
+    >>> head = tail = SinglyLinkedNode(0)
+    >>> index.insert(0, head)
+    >>> for value in range(1, 100):
+    ...     tail.next = SinglyLinkedNode(value)
+    ...     tail = tail.next
+    ...     index.insert(value, tail)
+    >>> index.locate(head, 42).value
+    42
+    >>> index.rank(tail)
+    99
+    """
+
+    def __init__(
+        self,
+        link: str = "next",
+        p: float = 0.25,
+        max_levels: int = 32,
+        seed: Optional[int] = None,
+    ) -> None:
+        if not 0.0 < p < 1.0:
+            raise ValueError(f"p must be between 0 and 1, got {p}")
+        self._step = attrgetter(link)
+        self._p = p
+        self._max_levels = max_levels
+        self._rng = random.Random(seed)
+        self.clear()
+
+    def __len__(self) -> int:
+        """Return the number of base nodes covered by the index."""
+        return self._size
+
+    def clear(self) -> None:
+        """Drop every tower, leaving an index over an empty chain."""
+        self._head = _Tower(None, self._max_levels)
+        self._levels = 0
+        self._size = 0
+        # Keyed by id() since nodes may be unhashable or hash by value; a
+        # tower keeps its node alive, so the id cannot be reused meanwhile.
+        self._towers: Dict[int, _Tower] = {}
+
+    def _height(self) -> int:
+        """Draw the number of express levels for a new node."""
+        height = 0
+        random_ = self._rng.random
+        p = self._p
+        while height < self._max_levels and random_() < p:
+            height += 1
+        return height
+
+    def _predecessors(
+        self, index: int, levels: int
+    ) -> Tuple[List[_Tower], List[int]]:
+        """Return the last tower before ``index`` on each level.
+
+        Returns
+        -------
+        tuple
+            ``(towers, positions)`` indexed by level, where the head tower
+            sits at position -1.
+        """
+        towers: List[_Tower] = [self._head] * levels
+        positions = [-1] * levels
+        tower, pos = self._head, -1
+        for level in range(levels - 1, -1, -1):
+            following = tower.next[level]
+            while following is not None and pos + tower.width[level] < index:
+                pos += tower.width[level]
+                tower = following
+                following = tower.next[level]
+            towers[level] = tower
+            positions[level] = pos
+        return towers, positions
+
+    def locate(self, root: Any, index: int) -> Optional[Any]:
+        """Return the base node at position ``index``.
+
+        Parameters
+        ----------
+        root : object
+            The first node of the indexed chain.
+        index : int
+            Zero-based position of the node to return.
+
+        Returns
+        -------
+        object or None
+            The node at ``index``, or None if the index is out of range.
+        """
+        if index < 0 or index >= self._size:
+            return None
+        tower, pos = self._head, -1
+        for level in range(self._levels - 1, -1, -1):
+            following = tower.next[level]
+            while following is not None and pos + tower.width[level] <= index:
+                pos += tower.width[level]
+                tower = following
+                following = tower.next[level]
+        if tower is self._head:
+            node, pos = root, 0
+        else:
+            node = tower.node
+        step = self._step
+        for _ in range(index - pos):
+            node = step(node)
+        return node
+
+    def rank(self, node: Any) -> int:
+        """Return the position of a node in the indexed chain.
+
+        The node's own tower, or the next tower after it, is reached along
+        the base chain; the position of that tower is then summed from the
+        widths of the express lanes leading back to the head.
+
+        Parameters
+        ----------
+        node : object
+            A node of the indexed chain.
+
+        Returns
+        -------
+        int
+            Zero-based position of ``node``.
+        """
+        towers = self._towers
+        step = self._step
+        hops = 0
+        while id(node) not in towers:
+            node = step(node)
+            if node is None:
+                return self._size - 1 - hops
+            hops += 1
+        tower = towers[id(node)]
+        pos = -1
+        head = self._head
+        while tower is not head:
+            level = len(tower.next) - 1
+            tower = tower.prev[level]
+            pos += tower.width[level]
+        return pos - hops
+
+    def insert(self, index: int, node: Any) -> None:
+        """Record that ``node`` was linked into the chain at ``index``.
+
+        Parameters
+        ----------
+        index : int
+            Position the node now occupies; later nodes moved up by one.
+        node : object
+            The newly linked base node.
+
+        Raises
+        ------
+        IndexError
+            If the index is outside ``0..len(self)``.
+        """
+        if index < 0 or index > self._size:
+            raise IndexError(f"index {index} is out of range")
+        height = self._height()
+        levels = max(self._levels, height)
+        towers, positions = self._predecessors(index, levels)
+        if height:
+            new = _Tower(node, height)
+            self._towers[id(node)] = new
+        for level in range(levels):
+            before = towers[level]
+            following = before.next[level]
+            if level < height:
+                new.prev[level] = before
+                new.next[level] = following
+                if following is not None:
+                    new.width[level] = (
+                        positions[level] + before.width[level] + 1 - index
+                    )
+                    following.prev[level] = new
+                before.next[level] = new
+                before.width[level] = index - positions[level]
+            elif following is not None:
+                before.width[level] += 1
+        self._levels = levels
+        self._size += 1
+
+    def extend(self, nodes: Iterable[Any]) -> None:
+        """Record that ``nodes`` were appended to the end of the chain.
+
+        The last tower on every level is located once, so each appended
+        node costs O(1) expected instead of a search from the top.
+
+        Parameters
+        ----------
+        nodes : iterable
+            The newly linked base nodes, in chain order.
+        """
+        towers, positions = self._predecessors(self._size, self._max_levels)
+        registry = self._towers
+        height_ = self._height
+        index = self._size
+        for node in nodes:
+            height = height_()
+            if height:
+                new = _Tower(node, height)
+                registry[id(node)] = new
+                for level in range(height):
+                    before = towers[level]
+                    new.prev[level] = before
+                    before.next[level] = new
+                    before.width[level] = index - positions[level]
+                    towers[level] = new
+                    positions[level] = index
+                if height > self._levels:
+                    self._levels = height
+            index += 1
+        self._size = index
+
+    def remove(self, index: int) -> None:
+        """Record that the node at ``index`` is being unlinked.
+
+        Parameters
+        ----------
+        index : int
+            Position of the removed node; later nodes move down by one.
+
+        Raises
+        ------
+        IndexError
+            If the index is outside ``0..len(self) - 1``.
+        """
+        if index < 0 or index >= self._size:
+            raise IndexError(f"index {index} is out of range")
+        towers, positions = self._predecessors(index, self._levels)
+        for level in range(self._levels):
+            before = towers[level]
+            following = before.next[level]
+            if following is None:
+                continue
+            if positions[level] + before.width[level] == index:
+                after = following.next[level]
+                before.next[level] = after
+                if after is not None:
+                    before.width[level] += following.width[level] - 1
+                    after.prev[level] = before
+                if level == 0:
+                    del self._towers[id(following.node)]
+            else:
+                before.width[level] -= 1
+        self._size -= 1
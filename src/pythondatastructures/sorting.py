@@ -0,0 +1,224 @@
+"""In-place merge sort for linked chains.
+
+The sort relinks the existing nodes instead of copying the values out,
+so peak memory does not grow with the length of the chain. It is a
+bottom-up natural merge sort. Each pass splits the chain into its
+already-ordered runs and merges neighbouring runs pairwise, until a single
+run is left. That gives O(n log r) time for a chain of ``r`` runs, O(1)
+extra memory and no recursion. A ``key`` function is called once per
+element, as by :func:`sorted`, and its results are kept for the sort.
+
+Ties are resolved in favour of the earlier node, so the sort is stable,
+including with ``reverse=True``, as with :func:`sorted`.
+
+The worker takes plain accessor functions, so one implementation serves
+object chains linked through an attribute (:func:`sort_chain`) and the
+array-backed :class:`~pythondatastructures.linkedlist.LinkedList`, whose
+links are slot indices.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from operator import attrgetter, gt, is_, lt
+from typing import Any, Callable, Optional, Tuple
+
+from .traversal import walk
+
+Getter = Callable[[Any], Any]
+Setter = Callable[[Any, Any], None]
+
+
+def merge_sort(
+    head: Any,
+    nil: Any,
+    get_next: Getter,
+    set_next: Setter,
+    key_of: Getter,
+    reverse: bool = False,
+    is_nil: Optional[Callable[[Any], bool]] = None,
+) -> Tuple[Any, Any]:
+    """Sort the chain starting at ``head`` by relinking it.
+
+    Parameters
+    ----------
+    head : Any
+        The first element of the chain, or ``nil`` for an empty chain.
+    nil : Any
+        The value marking the end of the chain (None for objects, an int
+        such as -1 for slot indices). It is written into the tail link.
+    get_next, set_next : callable
+        Read and write the forward link of an element.
+    key_of : callable
+        Return the sort key of an element. It is called on every
+        comparison, so it should be a cheap lookup; callers with a costly
+        key compute the keys once up front and look them up here.
+    reverse : bool, optional
+        Sort in descending order, keeping equal elements in their original
+        order (default is False).
+    is_nil : callable, optional
+        Return whether a link is the end marker. Defaults to an identity
+        test against ``nil``, which suits None; pass ``nil.__eq__`` for
+        int links, whose boxed values need not be the same object.
+
+    Returns
+    -------
+    tuple
+        ``(head, tail)`` of the sorted chain, the tail's link set to
+        ``nil``; ``(nil, nil)`` if the chain was empty.
+    """
+    if is_nil is None:
+        is_nil = partial(is_, nil)
+    if is_nil(head):
+        return nil, nil
+    # before(x, y): an element keyed x must precede one keyed y that came
+    # earlier. Only a strict comparison moves an element forward. The
+    # operator functions avoid a Python-level call per comparison.
+    before = gt if reverse else lt
+
+    def run_end(node):
+        """Return the last element of the ordered run starting at node."""
+        key = key_of(node)
+        following = get_next(node)
+        while not is_nil(following):
+            following_key = key_of(following)
+            if before(following_key, key):
+                break
+            node, key = following, following_key
+            following = get_next(node)
+        return node
+
+    def merge(a, b):
+        """Merge two nil-terminated runs and return (head, tail)."""
+        ka, kb = key_of(a), key_of(b)
+        if before(kb, ka):
+            first = tail = b
+            b = get_next(b)
+            if not is_nil(b):
+                kb = key_of(b)
+        else:
+            first = tail = a
+            a = get_next(a)
+            if not is_nil(a):
+                ka = key_of(a)
+        while not is_nil(a) and not is_nil(b):
+            if before(kb, ka):
+                set_next(tail, b)
+                tail = b
+                b = get_next(b)
+                if not is_nil(b):
+                    kb = key_of(b)
+            else:
+                set_next(tail, a)
+                tail = a
+                a = get_next(a)
+                if not is_nil(a):
+                    ka = key_of(a)
+        rest = b if is_nil(a) else a
+        set_next(tail, rest)
+        while not is_nil(rest):
+            tail = rest
+            rest = get_next(rest)
+        return first, tail
+
+    while True:
+        out_head = out_tail = nil
+        runs = 0
+        node = head
+        while not is_nil(node):
+            a = node
+            a_end = run_end(a)
+            node = get_next(a_end)
+            if is_nil(node):
+                # A lone last run is carried over unchanged.
+                run_head, run_tail = a, a_end
+            else:
+                set_next(a_end, nil)
+                b = node
+                b_end = run_end(b)
+                node = get_next(b_end)
+                set_next(b_end, nil)
+                run_head, run_tail = merge(a, b)
+            if is_nil(out_tail):
+                out_head = run_head
+            else:
+                set_next(out_tail, run_head)
+            out_tail = run_tail
+            runs += 1
+        if runs == 1:
+            return out_head, out_tail
+        head = out_head
+
+
+def sort_chain(
+    head: Any,
+    link: str = "next",
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+) -> Tuple[Optional[Any], Optional[Any]]:
+    """Sort a chain of nodes in place by their ``value`` attribute.
+
+    Parameters
+    ----------
+    head : object or None
+        The first node of the chain.
+    link : str, optional
+        Name of the attribute holding the following node (default is
+        ``"next"``). It is written directly, so it must be the raw link
+        and not a descriptor with side effects.
+    key : callable, optional
+        Applied to each value to produce its sort key, as for
+        :func:`sorted`. It is called once per node.
+    reverse : bool, optional
+        Sort in descending order (default is False).
+
+    Returns
+    -------
+    tuple
+        ``(head, tail)`` of the sorted chain, or ``(None, None)`` if
+        ``head`` is None. Only the forward links are rewritten; callers
+        keeping backward links must repair them.
+
+    Examples
+    --------
+    >>> from pythondatastructures.nodes import SinglyLinkedNode
+    >>> head = SinglyLinkedNode(3)
+    >>> head.next = SinglyLinkedNode(1)
+    >>> head.next.next = SinglyLinkedNode(2)
+    >>> head, tail = sort_chain(head)
+    >>> list(head.values()), tail.value
+    ([1, 2, 3], 3)
+    """
+    if key is None:
+        key_of = attrgetter("value")
+    else:
+        # The nodes stay alive for the whole sort, so their ids are stable.
+        keys = {id(node): key(node.value) for node in walk(head, link)}
+
+        def key_of(node: Any) -> Any:
+            return keys[id(node)]
+
+    def set_next(node: Any, following: Any) -> None:
+        setattr(node, link, following)
+
+    return merge_sort(head, None, attrgetter(link), set_next, key_of, reverse)
+
+
+def relink_backward(head: Any, link: str, back: str) -> None:
+    """Point the ``back`` link of every node after ``head`` at its predecessor.
+
+    Parameters
+    ----------
+    head : object or None
+        The first node of a sorted chain. Its own ``back`` link is left
+        unchanged.
+    link, back : str
+        Names of the forward and backward link attributes.
+    """
+    if head is None:
+        return
+    step = attrgetter(link)
+    prev, node = head, step(head)
+    while node is not None:
+        setattr(node, back, prev)
+        prev, node = node, step(node)
@@ -0,0 +1,314 @@
+"""Iterative traversal primitives shared by the linked structures.
+
+Every linked implementation in this package names its forward link
+differently (``next`` for :class:`~pythondatastructures.nodes.DirectedNode`,
+``right`` for ``old.linkedlist.llnode``, ``_nxt`` and ``prev`` for
+``old.Actual.Node``). The functions here take the link attribute name and
+walk the chain in a plain loop, so traversal cost is one attribute load per
+hop and chain length is not limited by the interpreter recursion limit.
+
+A chain whose links loop back on themselves never reaches None, so a plain
+walk over it never ends. :func:`detect_cycle` finds the loop with Brent's
+variant of Floyd's tortoise-and-hare method, using two node references and
+no visited set. :func:`length` and the ``safe`` mode of :func:`walk`,
+:func:`find` and :func:`last` build on it and always terminate: they visit
+every distinct node once and stop at the cycle entry.
+
+When :data:`~pythondatastructures.instrumentation.probe` is enabled, each
+call reports the number of links it read as one ``"hop"`` event.
+"""
+
+from __future__ import annotations
+
+from itertools import islice
+from operator import attrgetter
+from typing import Any, Iterator, NamedTuple, Optional, Tuple
+
+from .instrumentation import probe
+
+
+def walk(node: Any, link: str = "next", safe: bool = False) -> Iterator[Any]:
+    """Yield ``node`` and every node reachable from it through ``link``.
+
+    Parameters
+    ----------
+    node : object or None
+        The first node to yield. Nothing is yielded if it is None.
+    link : str, optional
+        Name of the attribute holding the following node (default is
+        ``"next"``).
+    safe : bool, optional
+        If True, measure the chain with :func:`detect_cycle` first and stop
+        before a link returns to the cycle entry, so a cyclic chain yields
+        each node once instead of looping forever (default is False).
+
+    Yields
+    ------
+    object
+        Each node of the chain in order.
+    """
+    if safe:
+        yield from islice(walk(node, link), detect_cycle(node, link).total)
+        return
+    step = attrgetter(link)
+    if not probe.enabled:
+        while node is not None:
+            yield node
+            node = step(node)
+        return
+    hops = 0
+    try:
+        while node is not None:
+            yield node
+            node = step(node)
+            hops += 1
+    finally:
+        probe.emit("hop", link, hops)
+
+
+def find(
+    node: Any, value: Any, link: str = "next", safe: bool = False
+) -> Tuple[Optional[Any], int]:
+    """Return the first node holding ``value`` and its distance from ``node``.
+
+    Parameters
+    ----------
+    node : object or None
+        The node to start searching from (inclusive).
+    value : Any
+        The value to compare against each node's ``value`` attribute.
+    link : str, optional
+        Name of the attribute holding the following node (default is
+        ``"next"``).
+    safe : bool, optional
+        If True, give up with ``(None, -1)`` once every distinct node of a
+        cyclic chain has been compared, instead of looping forever
+        (default is False). The search and the cycle check share one pass.
+
+    Returns
+    -------
+    tuple
+        ``(match, hops)`` for the first matching node, or ``(None, -1)`` if
+        no node in the chain holds ``value``.
+    """
+    if safe:
+        return _find_safe(node, value, link)
+    step = attrgetter(link)
+    hops = 0
+    while node is not None:
+        if node.value == value:
+            if probe.enabled:
+                probe.emit("hop", link, hops)
+            return node, hops
+        node = step(node)
+        hops += 1
+    if probe.enabled:
+        probe.emit("hop", link, hops)
+    return None, -1
+
+
+def nth(node: Any, hops: int, link: str = "next") -> Optional[Any]:
+    """Return the node ``hops`` links after ``node``.
+
+    Parameters
+    ----------
+    node : object or None
+        The node to start from.
+    hops : int
+        Number of links to follow. Must be non-negative.
+    link : str, optional
+        Name of the attribute holding the following node (default is
+        ``"next"``).
+
+    Returns
+    -------
+    object or None
+        The node reached, or None if the chain ends first.
+
+    Raises
+    ------
+    ValueError
+        If ``hops`` is negative.
+    """
+    if hops < 0:
+        raise ValueError(f"hops must be non-negative, got {hops}")
+    step = attrgetter(link)
+    for taken in range(hops):
+        if node is None:
+            if probe.enabled:
+                probe.emit("hop", link, taken)
+            return None
+        node = step(node)
+    if probe.enabled:
+        probe.emit("hop", link, hops)
+    return node
+
+
+def last(
+    node: Any, link: str = "next", safe: bool = False
+) -> Tuple[Optional[Any], int]:
+    """Return the last node of the chain and its distance from ``node``.
+
+    Parameters
+    ----------
+    node : object or None
+        The node to start from.
+    link : str, optional
+        Name of the attribute holding the following node (default is
+        ``"next"``).
+    safe : bool, optional
+        If True, a cyclic chain's last node is the one whose link returns
+        to the cycle entry, instead of looping forever (default is False).
+
+    Returns
+    -------
+    tuple
+        ``(tail, hops)`` where ``tail`` is the last node reachable from
+        ``node``, or ``(None, -1)`` if ``node`` is None.
+    """
+    if node is None:
+        return None, -1
+    if safe:
+        hops = detect_cycle(node, link).total - 1
+        return nth(node, hops, link), hops
+    step = attrgetter(link)
+    hops = 0
+    following = step(node)
+    while following is not None:
+        node = following
+        following = step(node)
+        hops += 1
+    if probe.enabled:
+        probe.emit("hop", link, hops + 1)
+    return node, hops
+
+
+class CycleInfo(NamedTuple):
+    """Shape of a chain, as measured by :func:`detect_cycle`.
+
+    Attributes
+    ----------
+    entry : object or None
+        The first node that a later link points back to, or None if the
+        chain ends.
+    tail_length : int
+        Number of nodes before ``entry``; for a chain without a cycle, the
+        number of nodes.
+    cycle_length : int
+        Number of nodes on the cycle, or 0 if the chain ends.
+    """
+
+    entry: Optional[Any]
+    tail_length: int
+    cycle_length: int
+
+    @property
+    def total(self) -> int:
+        """Return the number of distinct nodes in the chain."""
+        return self.tail_length + self.cycle_length
+
+
+def detect_cycle(node: Any, link: str = "next") -> CycleInfo:
+    """Measure the chain starting at ``node`` in O(1) memory.
+
+    Uses Brent's algorithm: the hare moves one link at a time and the
+    tortoise jumps to the hare whenever the distance between them reaches
+    the next power of two. The two meet after fewer link reads than in
+    Floyd's method, and the distance at which they meet is the cycle
+    length. A second pass with the two references ``cycle_length`` apart
+    then finds the entry. An acyclic chain costs one pass.
+
+    Parameters
+    ----------
+    node : object or None
+        The node to start from.
+    link : str, optional
+        Name of the attribute holding the following node (default is
+        ``"next"``).
+
+    Returns
+    -------
+    CycleInfo
+        ``(entry, tail_length, cycle_length)``; ``(None, 0, 0)`` if
+        ``node`` is None.
+
+    Examples
+    --------
+    >>> from pythondatastructures.nodes import SinglyLinkedNode
+    >>> a, b, c = SinglyLinkedNode(1), SinglyLinkedNode(2), SinglyLinkedNode(3)
+    >>> a.next, b.next, c.next = b, c, b
+    >>> info = detect_cycle(a)
+    >>> info.entry is b, info.tail_length, info.cycle_length
+    (True, 1, 2)
+    """
+    if node is None:
+        return CycleInfo(None, 0, 0)
+    step = attrgetter(link)
+    hare = node
+    power = 1
+    cycle = 0
+    while not cycle:
+        # The tortoise waits at index power - 1 while the hare runs up to
+        # ``power`` links past it.
+        tortoise = hare
+        for taken in range(1, power + 1):
+            hare = step(hare)
+            if hare is tortoise:
+                cycle = taken
+                break
+            if hare is None:
+                count = power - 1 + taken
+                if probe.enabled:
+                    probe.emit("hop", link, count)
+                return CycleInfo(None, count, 0)
+        else:
+            power *= 2
+    tortoise = hare = node
+    for _ in range(cycle):
+        hare = step(hare)
+    tail = 0
+    while tortoise is not hare:
+        tortoise = step(tortoise)
+        hare = step(hare)
+        tail += 1
+    if probe.enabled:
+        probe.emit("hop", link, power - 1 + 2 * (cycle + tail))
+    return CycleInfo(tortoise, tail, cycle)
+
+
+def length(node: Any, link: str = "next") -> int:
+    """Return the number of distinct nodes reachable from ``node``.
+
+    Always terminates, also on cyclic chains; see :func:`detect_cycle`.
+    """
+    return detect_cycle(node, link).total
+
+
+def _find_safe(node: Any, value: Any, link: str) -> Tuple[Optional[Any], int]:
+    """:func:`find` fused with the first pass of :func:`detect_cycle`.
+
+    The hare visits the nodes in chain order and only repeats a node after
+    it has visited every distinct one, so comparing values as it goes
+    finds the first match, and meeting the tortoise proves there is none.
+    """
+    step = attrgetter(link)
+    power = cycle = 1
+    tortoise = hare = node
+    hops = 0
+    while hare is not None:
+        if hare.value == value:
+            if probe.enabled:
+                probe.emit("hop", link, hops)
+            return hare, hops
+        hare = step(hare)
+        hops += 1
+        if hare is tortoise:
+            break
+        if cycle == power:
+            tortoise = hare
+            power *= 2
+            cycle = 0
+        cycle += 1
+    if probe.enabled:
+        probe.emit("hop", link, hops)
+    return None, -1
@@ -0,0 +1,371 @@
+"""List of fixed-width numbers in one contiguous buffer.
+
+:class:`TypedList` stores ints or floats unboxed in an :mod:`array`
+buffer, in list order, instead of one node object per value. It follows
+the value-based contract of
+:class:`~pythondatastructures.linkedlist.LinkedList`. Positional
+insertions and removals shift the buffer with a single C-level memmove
+rather than walking links.
+
+Because the values are contiguous, the aggregate helpers (:meth:`sum`,
+:meth:`min`, :meth:`max` and :meth:`index`) run as C loops over the buffer,
+and :meth:`to_numpy` / :meth:`from_numpy` copy the whole buffer at once.
+NumPy is optional; it is imported only by those two methods.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import Any, Iterable, Iterator, Optional
+
+from .nodes import DirectedNode
+
+#: Array typecodes of the numeric types a TypedList can hold.
+TYPECODES = "bBhHiIlLqQfd"
+
+
+def _numpy() -> Any:
+    """Import and return numpy.
+
+    Raises
+    ------
+    ImportError
+        If numpy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            "TypedList.to_numpy and TypedList.from_numpy need numpy; "
+            'install it with pip install "pythondatastructures[numpy]"'
+        ) from exc
+    return numpy
+
+
+class TypedList:
+    """A list of numbers of one C type, stored unboxed in an array.
+
+    The list follows the :class:`~pythondatastructures.nodes.DirectedNode`
+    method contract in the same way as
+    :class:`~pythondatastructures.linkedlist.LinkedList`: the list itself
+    acts as the head node, relative indexes count the elements before the
+    position they refer to, and removals return the stored value.
+
+    Parameters
+    ----------
+    typecode : str, optional
+        An :mod:`array` typecode from :data:`TYPECODES` (default is
+        ``"q"``, signed 64-bit integers).
+    iterable : iterable, optional
+        Values to append to the new list in order.
+
+    Raises
+    ------
+    ValueError
+        If the typecode is not numeric.
+
+    Examples
+    --------
+    >>> tl = TypedList("d", [3.0, 1.5])
+    >>> tl.insert(2.5, relative_index=1)
+    >>> list(tl), tl.sum(), tl.max(), tl.index(2.5)
+    ([3.0, 2.5, 1.5], 7.0, 3.0, 1)
+    >>> tl.dequeue()
+    1.5
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(
+        self, typecode: str = "q", iterable: Optional[Iterable[Any]] = None
+    ) -> None:
+        if typecode not in TYPECODES or len(typecode) != 1:
+            raise ValueError(
+                f"typecode must be one of {TYPECODES!r}, got {typecode!r}"
+            )
+        self._data = array(typecode)
+        if iterable is not None:
+            self.extend(iterable)
+
+    @property
+    def typecode(self) -> str:
+        """Return the array typecode of the stored values."""
+        return self._data.typecode
+
+    @property
+    def itemsize(self) -> int:
+        """Return the size of one stored value in bytes."""
+        return self._data.itemsize
+
+    def __len__(self) -> int:
+        """Return the number of stored elements."""
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the stored values in order."""
+        return iter(self._data)
+
+    def __contains__(self, value: Any) -> bool:
+        """Return whether a value is stored, searching in C."""
+        return value in self._data
+
+    def __getitem__(self, index: int) -> Any:
+        """Return the value at ``index``.
+
+        Raises
+        ------
+        IndexError
+            If the index is out of range.
+        """
+        try:
+            return self._data[index]
+        except IndexError:
+            raise IndexError("TypedList index out of range") from None
+
+    def __repr__(self) -> str:
+        """Return a string representation of the list.
+
+        Returns
+        -------
+        str
+            The class name, the typecode and the stored values.
+        """
+        return f"TypedList({self.typecode!r}, {self._data.tolist()!r})"
+
+    @staticmethod
+    def _unwrap(value: Any) -> Any:
+        """Return the value to store for ``value`` or a node holding it."""
+        if isinstance(value, DirectedNode):
+            return value.value
+        return value
+
+    def _check(self, relative_index: int) -> None:
+        """Raise ValueError unless ``0 <= relative_index <= len(self)``."""
+        if relative_index < 0 or relative_index > len(self._data):
+            raise ValueError(
+                f"relative_index {relative_index} is out of bounds"
+            )
+
+    def insert(self, value: Any, relative_index: int = 0) -> None:
+        """Insert a value so that ``relative_index`` values precede it.
+
+        Parameters
+        ----------
+        value : int, float or DirectedNode
+            The value to insert. A node contributes its ``value``.
+        relative_index : int, optional
+            Number of values preceding the inserted one (default is 0,
+            which inserts at the front).
+
+        Raises
+        ------
+        ValueError
+            If the relative index is negative or larger than the list.
+        TypeError
+            If the value does not fit the typecode.
+        OverflowError
+            If an integer is out of range for the typecode.
+        """
+        self._check(relative_index)
+        self._data.insert(relative_index, self._unwrap(value))
+
+    def append(self, value: Any) -> None:
+        """Append a value after the last element in amortised O(1).
+
+        Raises
+        ------
+        TypeError
+            If the value does not fit the typecode.
+        OverflowError
+            If an integer is out of range for the typecode.
+        """
+        self._data.append(self._unwrap(value))
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Append every value of ``iterable`` in order.
+
+        Another TypedList or array of the same typecode is copied as a
+        block.
+        """
+        if isinstance(iterable, TypedList):
+            iterable = iterable._data
+        if isinstance(iterable, array) and iterable.typecode == self.typecode:
+            self._data.extend(iterable)
+            return
+        unwrap = self._unwrap
+        self._data.extend(unwrap(value) for value in iterable)
+
+    def pop(self, relative_index: int = 0) -> Optional[Any]:
+        """Remove and return the value preceded by ``relative_index`` others.
+
+        Returns
+        -------
+        int, float or None
+            The removed value, or None if ``relative_index`` equals the
+            list length.
+
+        Raises
+        ------
+        ValueError
+            If the relative index is negative or larger than the list.
+        """
+        self._check(relative_index)
+        if relative_index == len(self._data):
+            return None
+        return self._data.pop(relative_index)
+
+    def pop_value(self, value: Any) -> Optional[Any]:
+        """Remove and return the first value equal to ``value``.
+
+        Returns
+        -------
+        int, float or None
+            The removed value, or None if no value is equal.
+        """
+        try:
+            index = self._data.index(value)
+        except (ValueError, TypeError):
+            return None
+        return self._data.pop(index)
+
+    def dequeue(self, direct: bool = False) -> Optional[Any]:
+        """Remove and return the first or the last value.
+
+        Parameters
+        ----------
+        direct : bool, optional
+            If True, remove the first value, shifting the rest. If False,
+            remove the last value in O(1) (default is False).
+
+        Returns
+        -------
+        int, float or None
+            The removed value, or None if the list is empty.
+        """
+        if not self._data:
+            return None
+        return self._data.pop(0 if direct else -1)
+
+    def clear(self) -> None:
+        """Remove every element and release the buffer."""
+        self._data = array(self.typecode)
+
+    def sort(self, key: Any = None, reverse: bool = False) -> None:
+        """Sort the values in place.
+
+        The buffer holds no nodes to relink, so this sorts a temporary
+        list of the values and writes them back.
+        """
+        self._data = array(
+            self.typecode, sorted(self._data, key=key, reverse=reverse)
+        )
+
+    def sum(self) -> Any:
+        """Return the sum of the values, computed in one C loop."""
+        return sum(self._data)
+
+    def min(self) -> Any:
+        """Return the smallest value.
+
+        Raises
+        ------
+        ValueError
+            If the list is empty.
+        """
+        return min(self._data)
+
+    def max(self) -> Any:
+        """Return the largest value.
+
+        Raises
+        ------
+        ValueError
+            If the list is empty.
+        """
+        return max(self._data)
+
+    def index(self, value: Any, start: int = 0, stop: int = sys.maxsize) -> int:
+        """Return the position of the first value equal to ``value``.
+
+        Parameters
+        ----------
+        value : int or float
+            The value to find.
+        start, stop : int, optional
+            Search only ``self[start:stop]``, as for :meth:`list.index`.
+
+        Returns
+        -------
+        int
+            The position of the match.
+
+        Raises
+        ------
+        ValueError
+            If no value in the range is equal.
+        """
+        return self._data.index(value, start, stop)
+
+    def to_numpy(self) -> Any:
+        """Return a NumPy copy of the values with the matching dtype.
+
+        The buffer is copied as one block, so the array does not share
+        memory with the list and the list stays resizable.
+
+        Returns
+        -------
+        numpy.ndarray
+            A one-dimensional array.
+
+        Raises
+        ------
+        ImportError
+            If numpy is not installed.
+        """
+        np = _numpy()
+        return np.frombuffer(self._data, dtype=self.typecode).copy()
+
+    @classmethod
+    def from_numpy(cls, values: Any, typecode: Optional[str] = None) -> "TypedList":
+        """Build a list from a one-dimensional NumPy array.
+
+        Parameters
+        ----------
+        values : numpy.ndarray or array_like
+            The values, in order.
+        typecode : str, optional
+            The typecode to store. Defaults to the array's own dtype, which
+            must then be one of :data:`TYPECODES`; otherwise the values are
+            converted by NumPy first.
+
+        Returns
+        -------
+        TypedList
+            A new list holding a copy of the values.
+
+        Raises
+        ------
+        ImportError
+            If numpy is not installed.
+        ValueError
+            If the array is not one-dimensional.
+        TypeError
+            If no typecode is given and the dtype has no array equivalent.
+        """
+        np = _numpy()
+        values = np.asarray(values)
+        if values.ndim != 1:
+            raise ValueError(
+                f"expected a one-dimensional array, got {values.ndim} dimensions"
+            )
+        if typecode is None:
+            typecode = values.dtype.char
+            if typecode not in TYPECODES:
+                raise TypeError(
+                    f"dtype {values.dtype} has no array typecode; pass one"
+                )
+        tl = cls(typecode)
+        values = np.ascontiguousarray(values, dtype=typecode)
+        tl._data.frombytes(memoryview(values).cast("B"))
+        return tl
@@ -0,0 +1,359 @@
+"""Unrolled singly-linked list.
+
+This module provides a linked list whose nodes each hold a block of up to
+``block_size`` values. Compared with one node per element this divides both
+the number of node objects and the number of pointer hops by roughly the
+block size, and keeps neighbouring values together in one Python list.
+Blocks are split when an insertion overflows them and merged with (or
+refilled from) their successor when a removal leaves them less than half
+full.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from .nodes import DirectedNode
+
+
+class _Block(DirectedNode):
+    """A node whose value is the Python list of elements it holds."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f"_Block({self.value!r})"
+
+
+class UnrolledLinkedList:
+    """A singly-linked list of fixed-capacity blocks of values.
+
+    The list follows the :class:`~pythondatastructures.nodes.DirectedNode`
+    method contract in the same way as
+    :class:`~pythondatastructures.linkedlist.LinkedList`: the list itself
+    acts as the head node, relative indexes count the elements before the
+    position they refer to, and removals return the stored value.
+
+    Parameters
+    ----------
+    iterable : iterable, optional
+        Values to append to the new list in order.
+    block_size : int, optional
+        Maximum number of values per block (default is 64). Must be at
+        least 2.
+
+    Examples
+    --------
+    >>> ul = UnrolledLinkedList(range(10), block_size=4)
+    >>> ul.block_count
+    3
+    >>> ul.insert("x", relative_index=5)
+    >>> ul[5], ul[-1]
+    ('x', 9)
+    >>> ul.pop_value("x")
+    'x'
+    >>> list(ul) == list(range(10))
+    True
+    """
+
+    def __init__(
+        self, iterable: Optional[Iterable[Any]] = None, block_size: int = 64
+    ) -> None:
+        if block_size < 2:
+            raise ValueError(f"block_size must be at least 2, got {block_size}")
+        self.block_size = block_size
+        self._head: Optional[_Block] = None
+        self._tail: Optional[_Block] = None
+        self._size = 0
+        if iterable is not None:
+            for value in iterable:
+                self.append(value)
+
+    def __len__(self) -> int:
+        """Return the number of stored elements."""
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the stored values from head to tail."""
+        block = self._head
+        while block is not None:
+            yield from block.value
+            block = block.next
+
+    def __repr__(self) -> str:
+        """Return a string representation of the list.
+
+        Returns
+        -------
+        str
+            The class name followed by the stored values.
+        """
+        return f"UnrolledLinkedList({list(self)!r})"
+
+    def __getitem__(self, index: int) -> Any:
+        """Return the value at ``index``, hopping one block at a time.
+
+        Parameters
+        ----------
+        index : int
+            Position of the value. Negative indexes count from the end.
+
+        Returns
+        -------
+        Any
+            The stored value.
+
+        Raises
+        ------
+        IndexError
+            If the index is out of range.
+        """
+        if index < 0:
+            index += self._size
+        if index < 0 or index >= self._size:
+            raise IndexError("UnrolledLinkedList index out of range")
+        _, block, offset = self._locate(index)
+        return block.value[offset]
+
+    @property
+    def block_count(self) -> int:
+        """Return the number of blocks in the chain."""
+        count = 0
+        block = self._head
+        while block is not None:
+            count += 1
+            block = block.next
+        return count
+
+    @staticmethod
+    def _unwrap(value: Any) -> Any:
+        """Return the value to store for ``value`` or a node holding it.
+
+        Raises
+        ------
+        TypeError
+            If the value is None.
+        """
+        if isinstance(value, DirectedNode):
+            value = value.value
+        if value is None:
+            raise TypeError("UnrolledLinkedList values cannot be None")
+        return value
+
+    def _check(self, relative_index: int) -> None:
+        """Raise ValueError unless ``0 <= relative_index <= len(self)``."""
+        if relative_index < 0 or relative_index > self._size:
+            raise ValueError(
+                f"relative_index {relative_index} is out of bounds"
+            )
+
+    def _locate(
+        self, index: int
+    ) -> Tuple[Optional[_Block], _Block, int]:
+        """Return ``(previous block, block, offset)`` for an element index.
+
+        ``index`` must be in ``0..len(self) - 1``.
+        """
+        prev = None
+        block = self._head
+        while index >= len(block.value):
+            index -= len(block.value)
+            prev = block
+            block = block.next
+        return prev, block, index
+
+    def _new_block(self, values: List[Any], after: Optional[_Block]) -> _Block:
+        """Link a new block holding ``values`` after ``after`` (or first)."""
+        block = _Block(values)
+        if after is None:
+            block.next = self._head
+            self._head = block
+        else:
+            block.next = after.next
+            after.next = block
+        if block.next is None:
+            self._tail = block
+        return block
+
+    def _rebalance(self, prev: Optional[_Block], block: _Block) -> None:
+        """Fix up ``block`` after a removal left it under half full."""
+        values = block.value
+        if not values:
+            following = block.next
+            if prev is None:
+                self._head = following
+            else:
+                prev.next = following
+            if block is self._tail:
+                self._tail = prev
+            block.next = None
+            return
+        following = block.next
+        if following is None or len(values) >= self.block_size // 2:
+            return
+        if len(values) + len(following.value) <= self.block_size:
+            values.extend(following.value)
+            block.next = following.next
+            following.next = None
+            if following is self._tail:
+                self._tail = block
+        else:
+            borrow = (len(following.value) - len(values)) // 2
+            values.extend(following.value[:borrow])
+            del following.value[:borrow]
+
+    def insert(self, value: Any, relative_index: int = 0) -> None:
+        """Insert a value so that ``relative_index`` elements precede it.
+
+        Parameters
+        ----------
+        value : Any or DirectedNode
+            The value to insert. A node contributes its ``value``.
+        relative_index : int, optional
+            Number of elements preceding the inserted value (default is 0).
+
+        Raises
+        ------
+        ValueError
+            If the relative index is negative or larger than the list.
+        TypeError
+            If the value is None.
+        """
+        value = self._unwrap(value)
+        self._check(relative_index)
+        if relative_index == self._size:
+            self.append(value)
+            return
+        _, block, offset = self._locate(relative_index)
+        values = block.value
+        values.insert(offset, value)
+        if len(values) > self.block_size:
+            half = len(values) // 2
+            self._new_block(values[half:], block)
+            del values[half:]
+        self._size += 1
+
+    def append(self, value: Any) -> None:
+        """Append a value to the tail block, starting a new block if full.
+
+        Parameters
+        ----------
+        value : Any or DirectedNode
+            The value to append. A node contributes its ``value``.
+
+        Raises
+        ------
+        TypeError
+            If the value is None.
+        """
+        value = self._unwrap(value)
+        tail = self._tail
+        if tail is None or len(tail.value) >= self.block_size:
+            self._new_block([value], tail)
+        else:
+            tail.value.append(value)
+        self._size += 1
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Append every value from ``iterable``, filling blocks in order.
+
+        Parameters
+        ----------
+        iterable : iterable
+            Values to append.
+        """
+        for value in iterable:
+            self.append(value)
+
+    def pop(self, relative_index: int = 0) -> Optional[Any]:
+        """Remove and return the value preceded by ``relative_index`` others.
+
+        Parameters
+        ----------
+        relative_index : int, optional
+            Number of elements preceding the removed one (default is 0).
+
+        Returns
+        -------
+        Any or None
+            The removed value, or None if ``relative_index`` equals the
+            list length.
+
+        Raises
+        ------
+        ValueError
+            If the relative index is negative or larger than the list.
+        """
+        self._check(relative_index)
+        if relative_index == self._size:
+            return None
+        prev, block, offset = self._locate(relative_index)
+        value = block.value.pop(offset)
+        self._size -= 1
+        self._rebalance(prev, block)
+        return value
+
+    def pop_value(self, value: Any) -> Optional[Any]:
+        """Remove and return the first element equal to ``value``.
+
+        Parameters
+        ----------
+        value : Any
+            The value to remove.
+
+        Returns
+        -------
+        Any or None
+            The removed value, or None if no element equals ``value``.
+        """
+        prev = None
+        block = self._head
+        while block is not None:
+            try:
+                offset = block.value.index(value)
+            except ValueError:
+                prev = block
+                block = block.next
+                continue
+            removed = block.value.pop(offset)
+            self._size -= 1
+            self._rebalance(prev, block)
+            return removed
+        return None
+
+    def dequeue(self, direct: bool = False) -> Optional[Any]:
+        """Remove and return the first or the last element.
+
+        Parameters
+        ----------
+        direct : bool, optional
+            If True, remove the first element. If False, remove the last
+            element (default is False).
+
+        Returns
+        -------
+        Any or None
+            The removed value, or None if the list is empty.
+        """
+        if self._size == 0:
+            return None
+        if direct:
+            return self.pop(0)
+        tail = self._tail
+        value = tail.value.pop()
+        self._size -= 1
+        if not tail.value:
+            # Only an emptied tail needs its predecessor, to unlink it.
+            prev = None
+            block = self._head
+            while block is not tail:
+                prev = block
+                block = block.next
+            self._rebalance(prev, tail)
+        return value
+
+    def clear(self) -> None:
+        """Remove every element."""
+        self._head = None
+        self._tail = None
+        self._size = 0
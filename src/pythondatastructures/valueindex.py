@@ -0,0 +1,143 @@
+"""Hash index from stored values to the nodes holding them.
+
+A :class:`ValueIndex` is an opt-in secondary index that a list keeps next to
+its chain. It maps each value to a bucket of nodes, so membership tests and
+lookups by value take O(1) on average instead of a scan. Buckets are
+insertion ordered and hold every node with an equal value, so duplicate
+values are supported.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class ValueIndex:
+    """Map values to the nodes that currently hold them.
+
+    Nodes only need a ``value`` attribute. Buckets are keyed by ``id()`` of
+    the node, so nodes themselves need not be hashable; unhashable values
+    are kept in a separate pool that is searched linearly.
+
+    Parameters
+    ----------
+    nodes : iterable, optional
+        Nodes to index initially.
+
+    Examples
+    --------
+    >>> from pythondatastructures.nodes import SinglyLinkedNode
+    >>> a, b, c = SinglyLinkedNode(1), SinglyLinkedNode(2), SinglyLinkedNode(1)
+    >>> index = ValueIndex([a, b, c])
+    >>> 2 in index, 3 in index
+    (True, False)
+    >>> index.first(1) is a
+    True
+    >>> index.discard(a)
+    >>> index.first(1) is c
+    True
+    """
+
+    def __init__(self, nodes: Iterable[Any] = ()) -> None:
+        self._buckets: Dict[Any, Dict[int, Any]] = {}
+        self._unhashable: Dict[int, Any] = {}
+        self._size = 0
+        for node in nodes:
+            self.add(node)
+
+    def __len__(self) -> int:
+        """Return the number of indexed nodes."""
+        return self._size
+
+    def __contains__(self, value: Any) -> bool:
+        """Return True if some indexed node holds ``value``."""
+        return self.first(value) is not None
+
+    def _bucket(self, value: Any) -> Optional[Dict[int, Any]]:
+        """Return the bucket for a hashable value, or None if unhashable."""
+        try:
+            return self._buckets.get(value, {})
+        except TypeError:
+            return None
+
+    def add(self, node: Any) -> None:
+        """Index ``node`` under its value. Adding a node twice is a no-op.
+
+        Parameters
+        ----------
+        node : object
+            The node to index.
+        """
+        try:
+            bucket = self._buckets.setdefault(node.value, {})
+        except TypeError:
+            bucket = self._unhashable
+        if id(node) not in bucket:
+            bucket[id(node)] = node
+            self._size += 1
+
+    def discard(self, node: Any) -> None:
+        """Remove ``node`` from the index if it is present.
+
+        Parameters
+        ----------
+        node : object
+            The node to drop. Its value must not have changed since it was
+            added.
+        """
+        try:
+            bucket = self._buckets.get(node.value)
+        except TypeError:
+            bucket = self._unhashable
+        if bucket is None or bucket.pop(id(node), None) is None:
+            return
+        self._size -= 1
+        if not bucket and bucket is not self._unhashable:
+            del self._buckets[node.value]
+
+    def nodes(self, value: Any) -> List[Any]:
+        """Return every indexed node holding ``value``, oldest first.
+
+        Parameters
+        ----------
+        value : Any
+            The value to look up.
+
+        Returns
+        -------
+        list
+            The matching nodes in the order they were added.
+        """
+        bucket = self._bucket(value)
+        if bucket is None:
+            return [n for n in self._unhashable.values() if n.value == value]
+        return list(bucket.values())
+
+    def first(self, value: Any) -> Optional[Any]:
+        """Return the oldest indexed node holding ``value``.
+
+        Parameters
+        ----------
+        value : Any
+            The value to look up.
+
+        Returns
+        -------
+        object or None
+            The matching node, or None if no node holds ``value``.
+        """
+        bucket = self._bucket(value)
+        if bucket is None:
+            for node in self._unhashable.values():
+                if node.value == value:
+                    return node
+            return None
+        for node in bucket.values():
+            return node
+        return None
+
+    def clear(self) -> None:
+        """Remove every node from the index."""
+        self._buckets.clear()
+        self._unhashable.clear()
+        self._size = 0
@@ -0,0 +1,587 @@
+"""
+Test suite for the descriptor-based linked list in old.Actual.
+
+This module contains tests for Node and LL from old/Actual/linked_list.py,
+including chains longer than the interpreter recursion limit.
+"""
+
+import random
+
+import pytest
+from pythondatastructures.instrumentation import collect
+from pythondatastructures.old.Actual import LL, Node
+from pythondatastructures.traversal import nth, walk
+
+
+def _values(ll):
+    values = []
+    node = ll.root
+    while node is not None:
+        values.append(node.value)
+        node = node.nxt
+    return values
+
+
+def _long_chain(size):
+    root = tail = Node(0)
+    for i in range(1, size):
+        node = Node(i)
+        tail.nxt = node
+        tail = node
+    return root, tail
+
+
+class TestNode:
+    """Test cases for Node positional helpers."""
+
+    def test_idx_and_len(self):
+        """
+        Test node positions and chain length.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that idx counts the nodes before a node and that len
+        reports the whole chain from any node.
+        """
+        ll = LL(0)
+        for i in range(1, 4):
+            ll.append(i)
+        assert [ll.get(i).idx for i in range(4)] == [0, 1, 2, 3]
+        assert len(ll.root) == 4
+        assert len(ll.get(2)) == 4
+
+    def test_get(self):
+        """
+        Test looking up nodes by value.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the found node and the default for a missing value.
+        """
+        ll = LL("a")
+        ll.append("b")
+        assert ll.get("b").value == "b"
+        assert ll.get("z") is None
+        assert ll.get("z", "missing") == "missing"
+
+    def test_insert_at(self):
+        """
+        Test inserting at a position.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies insertion at the front, in the middle and past the end.
+        """
+        ll = LL(1)
+        ll.append(3)
+        ll.insert_at(2, 1)
+        ll.insert_at(0, 0)
+        assert _values(ll) == [0, 1, 2, 3]
+        assert ll.root.insert_at(Node(9), 10) is None
+        assert _values(ll) == [0, 1, 2, 3]
+
+    def test_nx_export_from_middle(self):
+        """
+        Test exporting the part of a chain after a given node.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies node attributes, edge order and the LL graph settings.
+        """
+        nx = pytest.importorskip("networkx")
+        ll = LL.from_iterable("abcd")
+        middle = ll.get("b")
+        g = nx.DiGraph()
+        nodes, edges = middle.nx_node(g)
+        assert [node.value for node in nodes] == ["b", "c", "d"]
+        assert edges == [(nodes[0], nodes[1]), (nodes[1], nodes[2])]
+        assert [g.nodes[node]["index"] for node in nodes] == [1, 2, 3]
+        assert g.nodes[nodes[2]]["label"] == "d"
+        g = ll.nx_graph()
+        assert list(g.edges) == [("a", "b"), ("b", "c"), ("c", "d")]
+        assert g.nodes["a"]["index"] == 0
+        assert g.graph["rankdir"] == "LR"
+
+
+class TestLongChains:
+    """Test cases for chains longer than the recursion limit."""
+
+    SIZE = 20_000
+
+    def test_positions_and_lookup(self):
+        """
+        Test positional helpers on a long chain.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies idx, len, get, insert_at and append without
+        RecursionError.
+        """
+        root, tail = _long_chain(self.SIZE)
+        assert tail.idx == self.SIZE - 1
+        assert len(root) == self.SIZE
+        assert root.get(self.SIZE - 1) is tail
+        root.insert_at(Node("x"), self.SIZE - 1)
+        assert tail.idx == self.SIZE
+        root.append("end")
+        assert tail.nxt.value == "end"
+        assert len(root) == self.SIZE + 2
+
+    def test_nx_export(self):
+        """
+        Test exporting a long chain to networkx.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies node and edge counts of both export methods.
+        """
+        nx = pytest.importorskip("networkx")
+        root, _ = _long_chain(self.SIZE)
+        nodes, edges = root.nx_node(nx.DiGraph())
+        assert len(nodes) == self.SIZE
+        assert len(edges) == self.SIZE - 1
+        g = nx.DiGraph()
+        root.nx_graph(g)
+        assert g.number_of_nodes() == self.SIZE
+        assert g.nodes[self.SIZE - 1]["index"] == self.SIZE - 1
+
+
+class TestPositionTracking:
+    """Test cases for LL-maintained node positions."""
+
+    @pytest.mark.parametrize("mode", ["lazy", "eager"])
+    def test_positions_follow_changes(self, mode):
+        """
+        Test that cached positions match the chain after random edits.
+
+        Parameters
+        ----------
+        mode : str
+            The position tracking mode under test.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Mixes appends, positional inserts and ``del node.nxt`` and
+        compares every idx with the node's actual position.
+        """
+        rng = random.Random(7)
+        ll = LL(0, positions=mode)
+        size = 1
+        for step in range(1, 1500):
+            choice = rng.random()
+            if choice < 0.4:
+                ll.append(step)
+                size += 1
+            elif choice < 0.7:
+                ll.insert_at(step, rng.randint(0, size))
+                size += 1
+            elif size > 2:
+                node = nth(ll.root, rng.randint(0, size - 2), "_nxt")
+                del node.nxt
+                size -= 1
+            if step % 50 == 0:
+                nodes = list(walk(ll.root, "_nxt"))
+                assert len(nodes) == size
+                assert [n.idx for n in nodes] == list(range(size))
+
+    def test_idx_reads_cache(self):
+        """
+        Test that idx does not walk back through prev once cached.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Cutting the prev pointer would change a walked idx to 0, so an
+        unchanged result shows the cached position was used.
+        """
+        ll = LL(0, positions="eager")
+        for i in range(1, 10):
+            ll.append(i)
+        node = ll.get(9)
+        node.__dict__["prev"] = None
+        assert node.idx == 9
+
+    def test_prebuilt_chain_and_mode_switch(self):
+        """
+        Test tracking positions of a chain built before the LL.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that positions can be turned on and off and that an
+        unknown mode is rejected.
+        """
+        root, tail = _long_chain(100)
+        ll = LL(root)
+        assert ll.positions is None
+        ll.track_positions("lazy")
+        assert tail.idx == 99
+        ll.insert_at("front", 0)
+        assert tail.idx == 100
+        ll.track_positions(None)
+        assert tail.idx == 100
+        with pytest.raises(ValueError):
+            ll.track_positions("always")
+
+
+class TestValueIndex:
+    """Test cases for LL-maintained value lookups."""
+
+    def test_index_follows_changes(self):
+        """
+        Test that get and membership track every kind of edit.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Covers append, insert_at, ``del node.nxt`` and cutting the chain
+        by setting ``nxt`` to None.
+        """
+        ll = LL(0, values=True)
+        for i in range(1, 6):
+            ll.append(i)
+        ll.insert_at("front", 0)
+        ll.insert_at("mid", 3)
+        assert "front" in ll and "mid" in ll
+        assert ll.get("mid").idx == 3
+
+        del ll.get(2).nxt
+        assert 3 not in ll
+        assert ll.get(3) is None
+
+        ll.get(1).nxt = None
+        assert 4 not in ll and 5 not in ll and "mid" not in ll
+        assert len(ll.value_index) == 3
+
+    @pytest.mark.parametrize("positions", [None, "lazy"])
+    def test_get_with_duplicates(self, positions):
+        """
+        Test lookups of values held by several nodes.
+
+        Parameters
+        ----------
+        positions : str or None
+            The position tracking mode used alongside the value index.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that the first node in chain order is returned even when
+        a later duplicate was added first, and that lookups from a node
+        skip matches before it.
+        """
+        ll = LL("a", positions=positions, values=True)
+        ll.append("x")
+        ll.append("b")
+        ll.insert_at("x", 1)
+        first = ll.get("x")
+        assert first.idx == 1
+        assert ll.get("b").get("x") is None
+        assert first.nxt.get("x").idx == 2
+        assert ll.get("missing", 0) == 0
+
+    def test_get_duplicates_single_walk(self):
+        """
+        Test the cost of a duplicate lookup without position tracking.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that the lookup follows at most one link per node,
+        instead of walking back to the root for every candidate.
+        """
+        values = [i % 10 for i in range(200)]
+        ll = LL.from_iterable(reversed(values), values=True)
+        start = nth(ll.root, 50, "_nxt")
+        with collect() as stats:
+            found = start.get(3)
+        assert found.value == 3 and found.idx == 56
+        assert stats["hop"] <= 200
+
+    def test_enable_on_prebuilt_chain(self):
+        """
+        Test enabling the index on an existing chain.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that nodes linked before the LL existed are indexed.
+        """
+        root, tail = _long_chain(50)
+        ll = LL(root)
+        ll.track_values(True)
+        assert ll.get(49) is tail
+        ll.track_values(False)
+        assert ll.value_index is None
+        assert 49 in ll
+
+
+class TestBulkConstruction:
+    """Test cases for LL.from_iterable and LL.extend."""
+
+    @pytest.mark.parametrize("positions", [None, "lazy", "eager"])
+    def test_from_iterable_and_extend(self, positions):
+        """
+        Test building and extending an LL in bulk.
+
+        Parameters
+        ----------
+        positions : str or None
+            The position tracking mode under test.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies order, prev pointers, positions and the value index.
+        """
+        ll = LL.from_iterable(range(5), positions=positions, values=True)
+        ll.extend(i for i in range(5, 10))
+        nodes = list(walk(ll.root, "_nxt"))
+        assert [n.value for n in nodes] == list(range(10))
+        assert all(b.prev is a for a, b in zip(nodes, nodes[1:]))
+        assert [n.idx for n in nodes] == list(range(10))
+        assert ll.get(9) is nodes[-1]
+        ll.append(10)
+        assert ll.get(10).idx == 10
+
+    def test_from_empty_iterable(self):
+        """
+        Test building an LL from nothing.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that an LL needs a root value.
+        """
+        with pytest.raises(ValueError):
+            LL.from_iterable([])
+
+    @pytest.mark.parametrize("positions", [None, "lazy"])
+    def test_extend_with_nodes(self, positions):
+        """
+        Test extending with Node objects.
+
+        Parameters
+        ----------
+        positions : str or None
+            The position tracking mode under test.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that detached nodes are linked as they are, and that
+        nodes already in a chain are rejected without leaving the nodes
+        linked before them unindexed.
+        """
+        ll = LL.from_iterable(range(3), positions=positions, values=True)
+        free = Node(3)
+        ll.extend([free, 4])
+        assert list(ll.values()) == [0, 1, 2, 3, 4]
+        assert free.idx == 3 and ll.get(3) is free
+        chain = LL.from_iterable([7, 8])
+        head = Node(5)
+        head.nxt = Node(6)
+        for linked in (ll.root, chain.root, chain.root.nxt, head, head.nxt):
+            with pytest.raises(ValueError):
+                ll.extend([linked])
+        with pytest.raises(ValueError):
+            ll.extend([9, chain.root, 10])
+        assert list(ll.values()) == [0, 1, 2, 3, 4, 9]
+        assert ll.get(9).idx == 5 and ll.get(7) is None
+        assert list(chain.values()) == [7, 8]
+
+
+class TestIteration:
+    """Test cases for LL and Node iteration."""
+
+    def test_ll_iterates_every_node(self):
+        """
+        Test forward iteration over an LL.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that every node is yielded once, in order, without
+        printing, for both the node and value variants.
+        """
+        ll = LL.from_iterable(range(5))
+        nodes = list(ll)
+        assert [node.value for node in nodes] == [0, 1, 2, 3, 4]
+        assert nodes[0] is ll.root
+        assert list(ll.nodes()) == nodes
+        assert list(ll.values()) == [0, 1, 2, 3, 4]
+
+    def test_single_node(self):
+        """
+        Test iteration over an LL holding only its root.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies forward and reversed iteration of one node.
+        """
+        ll = LL("only")
+        assert list(ll) == [ll.root]
+        assert list(reversed(ll)) == [ll.root]
+
+    def test_reversed(self):
+        """
+        Test reversed iteration along prev links.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies reversed order for the LL and from a middle node.
+        """
+        ll = LL.from_iterable("abcd")
+        assert [node.value for node in reversed(ll)] == ["d", "c", "b", "a"]
+        middle = ll.root.nxt.nxt
+        assert [node.value for node in reversed(middle)] == ["c", "b", "a"]
+        assert [node.value for node in middle] == ["c", "d"]
+        assert list(middle.values()) == ["c", "d"]
+
+    def test_long_chain(self):
+        """
+        Test iteration over a chain longer than the recursion limit.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies forward and reversed lengths.
+        """
+        root, _ = _long_chain(20000)
+        ll = LL(root)
+        assert sum(1 for _ in ll) == 20000
+        assert next(reversed(ll)).value == 19999
+        assert sum(1 for _ in reversed(ll)) == 20000
@@ -0,0 +1,338 @@
+"""Test suite for the asyncio queue and stack.
+
+This module contains tests for AsyncQueue and AsyncStack, covering waiter
+hand-off, bounded backpressure, cancellation, batch pops and draining.
+"""
+
+import asyncio
+
+import pytest
+from pythondatastructures.asyncqueue import AsyncQueue, AsyncStack
+
+
+class TestAsyncQueue:
+    """Test cases for AsyncQueue."""
+
+    def test_fifo_and_nowait(self):
+        """
+        Test FIFO order and the non-waiting variants.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies order, length and QueueEmpty on an empty queue.
+        """
+        async def scenario():
+            q = AsyncQueue()
+            await q.push(1)
+            q.push_nowait(2)
+            assert len(q) == 2
+            assert (await q.pop()).value == 1
+            assert q.pop_nowait().value == 2
+            assert q.root is None and q.tail is None
+            with pytest.raises(asyncio.QueueEmpty):
+                q.pop_nowait()
+
+        asyncio.run(scenario())
+
+    def test_waiting_consumer_gets_handoff(self):
+        """
+        Test that a push wakes a consumer waiting on an empty queue.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that waiting consumers are served in arrival order and
+        that handed-off nodes never enter the list.
+        """
+        async def scenario():
+            q = AsyncQueue()
+            first = asyncio.create_task(q.pop())
+            second = asyncio.create_task(q.pop())
+            await asyncio.sleep(0)
+            q.push_nowait("a")
+            await q.push("b")
+            assert len(q) == 0
+            assert (await first).value == "a"
+            assert (await second).value == "b"
+
+        asyncio.run(scenario())
+
+    def test_bounded_backpressure(self):
+        """
+        Test that a full bounded queue makes producers wait.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies QueueFull from push_nowait and that a pop lets a waiting
+        push complete.
+        """
+        async def scenario():
+            q = AsyncQueue(maxsize=1)
+            await q.push(0)
+            assert q.full()
+            with pytest.raises(asyncio.QueueFull):
+                q.push_nowait(1)
+            producer = asyncio.create_task(q.push(1))
+            await asyncio.sleep(0)
+            assert not producer.done()
+            assert (await q.pop()).value == 0
+            await asyncio.wait_for(producer, 1)
+            assert (await q.pop()).value == 1
+
+        asyncio.run(scenario())
+
+    def test_cancelled_pop_keeps_value(self):
+        """
+        Test cancelling a consumer after a node was handed to it.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that the undelivered node is put back at the front.
+        """
+        async def scenario():
+            q = AsyncQueue()
+            waiter = asyncio.create_task(q.pop())
+            await asyncio.sleep(0)
+            q.push_nowait("kept")
+            q.push_nowait("next")
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            assert [node.value async for node in q] == ["kept", "next"]
+
+        asyncio.run(scenario())
+
+    def test_pop_many(self):
+        """
+        Test batch pops.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that pop_many waits for one node, returns at most n and
+        rejects a non-positive n.
+        """
+        async def scenario():
+            q = AsyncQueue()
+            batch = asyncio.create_task(q.pop_many(3))
+            await asyncio.sleep(0)
+            q.push_nowait(0)
+            assert [node.value for node in await batch] == [0]
+            for value in range(1, 6):
+                q.push_nowait(value)
+            assert [n.value for n in await q.pop_many(3)] == [1, 2, 3]
+            assert [n.value for n in await q.pop_many(3)] == [4, 5]
+            with pytest.raises(ValueError):
+                await q.pop_many(0)
+
+        asyncio.run(scenario())
+
+    def test_producers_and_consumers(self):
+        """
+        Test concurrent producer and consumer tasks on a bounded queue.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that every value arrives once and that each consumer
+        sees every producer's values in order.
+        """
+        async def scenario():
+            q = AsyncQueue(maxsize=4)
+            results = [[] for _ in range(3)]
+
+            async def produce(pid):
+                for i in range(200):
+                    await q.push((pid, i))
+
+            async def consume(out):
+                for _ in range(200):
+                    out.append((await q.pop()).value)
+
+            await asyncio.gather(*(produce(p) for p in range(3)),
+                                 *(consume(out) for out in results))
+            received = [item for out in results for item in out]
+            assert sorted(received) == [(p, i) for p in range(3)
+                                        for i in range(200)]
+            for out in results:
+                for pid in range(3):
+                    seen = [i for p, i in out if p == pid]
+                    assert seen == sorted(seen)
+
+        asyncio.run(scenario())
+
+    def test_from_iterable_and_extend(self):
+        """
+        Test bulk filling through from_iterable and extend.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the size and tail after a bulk fill, that a later push
+        keeps the earlier items, that a waiting consumer is served first
+        and that maxsize is enforced.
+        """
+        async def scenario():
+            q = AsyncQueue.from_iterable([1, 2, 3])
+            assert len(q) == 3 and q.tail.value == 3
+            q.push_nowait(4)
+            assert [node.value async for node in q] == [1, 2, 3, 4]
+            consumer = asyncio.create_task(q.pop())
+            await asyncio.sleep(0)
+            q.extend("ab")
+            assert (await consumer).value == "a"
+            assert len(q) == 1 and q.root is q.tail
+            bounded = AsyncQueue(maxsize=2)
+            with pytest.raises(asyncio.QueueFull):
+                bounded.extend(range(3))
+            assert len(bounded) == 2
+            with pytest.raises(asyncio.QueueFull):
+                AsyncQueue.from_iterable(range(3), maxsize=2)
+
+        asyncio.run(scenario())
+
+
+class TestAsyncStack:
+    """Test cases for AsyncStack."""
+
+    def test_lifo_and_links(self):
+        """
+        Test LIFO order and left links.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies order, left pointers of the stored nodes and draining
+        with async for.
+        """
+        async def scenario():
+            s = AsyncStack()
+            for value in range(3):
+                await s.push(value)
+            assert s.root.value == 2
+            assert s.root.right.left is s.root
+            assert (await s.pop()).value == 2
+            assert s.root.left is None
+            assert [node.value async for node in s] == [1, 0]
+            assert len(s) == 0
+
+        asyncio.run(scenario())
+
+    def test_bounded_stack(self):
+        """
+        Test backpressure on a bounded stack.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that a waiting push completes after a pop.
+        """
+        async def scenario():
+            s = AsyncStack(maxsize=2)
+            await s.push("a")
+            await s.push("b")
+            producer = asyncio.create_task(s.push("c"))
+            await asyncio.sleep(0)
+            assert not producer.done()
+            assert (await s.pop()).value == "b"
+            await asyncio.wait_for(producer, 1)
+            assert [n.value for n in await s.pop_many(5)] == ["c", "a"]
+
+        asyncio.run(scenario())
+
+    def test_from_iterable_and_extend(self):
+        """
+        Test bulk filling through from_iterable and extend.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the size, that the last value ends up on top and that
+        maxsize is enforced.
+        """
+        async def scenario():
+            s = AsyncStack()
+            s.extend([1, 2])
+            assert len(s) == 2
+            s.push_nowait(3)
+            assert [node.value async for node in s] == [3, 2, 1]
+            s = AsyncStack.from_iterable("abc", maxsize=3)
+            assert len(s) == 3 and s.full()
+            with pytest.raises(asyncio.QueueFull):
+                s.extend("d")
+            assert [n.value for n in await s.pop_many(5)] == ["c", "b", "a"]
+
+        asyncio.run(scenario())
@@ -0,0 +1,199 @@
+"""Test suite for the two-lock concurrent queue.
+
+This module contains tests for ConcurrentQueue, covering FIFO order,
+timeouts, bounded capacity and concurrent producers and consumers.
+"""
+
+import queue
+import threading
+
+import pytest
+from pythondatastructures.concurrentqueue import ConcurrentQueue
+from pythondatastructures.old import llnode
+
+
+class TestConcurrentQueueBasics:
+    """Test cases for single-threaded behaviour."""
+
+    def test_fifo_order(self):
+        """
+        Test that values come out in insertion order.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that pop returns detached llnode objects in FIFO order
+        and that the length follows pushes and pops.
+        """
+        q = ConcurrentQueue()
+        q.push(1)
+        q.extend([2, 3])
+        assert len(q) == 3
+        nodes = [q.pop() for _ in range(3)]
+        assert [node.value for node in nodes] == [1, 2, 3]
+        assert all(isinstance(node, llnode) for node in nodes)
+        assert all(node.right is None for node in nodes)
+        assert len(q) == 0
+        assert q.root is q.tail
+
+    def test_empty_pop_times_out(self):
+        """
+        Test popping from an empty queue.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that queue.Empty is raised for get_nowait and for a
+        timed-out blocking pop.
+        """
+        q = ConcurrentQueue()
+        with pytest.raises(queue.Empty):
+            q.get_nowait()
+        with pytest.raises(queue.Empty):
+            q.pop(timeout=0.01)
+
+    def test_bounded_capacity(self):
+        """
+        Test that a bounded queue rejects pushes when full.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that queue.Full is raised and that a pop frees a slot.
+        """
+        q = ConcurrentQueue(maxsize=2)
+        q.put_nowait("a")
+        q.push("b")
+        with pytest.raises(queue.Full):
+            q.put_nowait("c")
+        with pytest.raises(queue.Full):
+            q.push("c", timeout=0.01)
+        assert q.get_nowait().value == "a"
+        q.put_nowait("c")
+        assert [q.pop().value, q.pop().value] == ["b", "c"]
+
+
+class TestConcurrentQueueThreads:
+    """Test cases for blocking and concurrent use."""
+
+    def test_blocking_pop_wakes_on_push(self):
+        """
+        Test that a blocked consumer receives a later push.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that pop waits for an item pushed by another thread.
+        """
+        q = ConcurrentQueue()
+        received = []
+        consumer = threading.Thread(target=lambda: received.append(q.pop()))
+        consumer.start()
+        q.push("late")
+        consumer.join(timeout=5)
+        assert not consumer.is_alive()
+        assert received[0].value == "late"
+
+    def test_backpressure_blocks_producer(self):
+        """
+        Test that a full bounded queue blocks the producer.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that a blocked push completes once a slot is freed.
+        """
+        q = ConcurrentQueue(maxsize=1)
+        q.push(0)
+        producer = threading.Thread(target=q.push, args=(1,))
+        producer.start()
+        producer.join(timeout=0.05)
+        assert producer.is_alive()
+        assert q.pop().value == 0
+        producer.join(timeout=5)
+        assert not producer.is_alive()
+        assert q.pop().value == 1
+
+    @pytest.mark.parametrize("maxsize", [0, 8])
+    def test_many_producers_and_consumers(self, maxsize):
+        """
+        Test concurrent producers and consumers.
+
+        Parameters
+        ----------
+        maxsize : int
+            Capacity of the queue under test.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that every pushed value is popped exactly once and that
+        each producer's values keep their relative order.
+        """
+        q = ConcurrentQueue(maxsize=maxsize)
+        producers, consumers, per_producer = 4, 4, 2000
+        results = [[] for _ in range(consumers)]
+
+        def produce(pid):
+            for i in range(per_producer):
+                q.push((pid, i))
+
+        def consume(out):
+            for _ in range(producers * per_producer // consumers):
+                out.append(q.pop(timeout=5).value)
+
+        threads = [threading.Thread(target=produce, args=(p,), daemon=True)
+                   for p in range(producers)]
+        threads += [threading.Thread(target=consume, args=(out,), daemon=True)
+                    for out in results]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+            assert not thread.is_alive()
+        popped = [item for out in results for item in out]
+        assert sorted(popped) == [(p, i) for p in range(producers)
+                                  for i in range(per_producer)]
+        for out in results:
+            for pid in range(producers):
+                seen = [i for p, i in out if p == pid]
+                assert seen == sorted(seen)
+        assert len(q) == 0
@@ -0,0 +1,249 @@
+"""Test suite for the sentinel-framed doubly-linked list.
+
+This module contains tests for DoublyLinkedList, covering the node
+contract, O(1) removal of known nodes, move_to_end and random edits
+checked against collections.deque.
+"""
+
+import random
+from collections import deque
+
+import pytest
+from pythondatastructures.doublylinked import DoublyLinkedList
+from pythondatastructures.nodes import DoublyLinkedNode, SinglyLinkedNode
+
+
+def _check_links(dl):
+    """Assert that the chain is consistent in both directions."""
+    forward = list(dl.nodes())
+    assert len(forward) == len(dl)
+    for prev, node in zip([dl._head] + forward, forward + [dl._tail]):
+        assert prev.next is node
+        assert node.prev is prev
+
+
+class TestDoublyLinkedList:
+    """Test cases for DoublyLinkedList."""
+
+    def test_construction_and_iteration(self):
+        """
+        Test building a list and iterating it both ways.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies len, both iteration orders, first, last and repr.
+        """
+        dl = DoublyLinkedList(range(5))
+        assert len(dl) == 5
+        assert list(dl) == [0, 1, 2, 3, 4]
+        assert list(reversed(dl)) == [4, 3, 2, 1, 0]
+        assert dl.first.value == 0 and dl.last.value == 4
+        assert repr(dl) == "DoublyLinkedList([0, 1, 2, 3, 4])"
+        empty = DoublyLinkedList()
+        assert empty.first is None and empty.last is None
+        assert list(reversed(empty)) == []
+        _check_links(dl)
+
+    def test_contract(self):
+        """
+        Test insert, pop, pop_value and dequeue.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies positions from both halves of the list, the None results
+        and bounds checks.
+        """
+        dl = DoublyLinkedList([1, 5])
+        dl.insert(0)
+        dl.insert(2, relative_index=2)
+        dl.insert(3, relative_index=3)
+        dl.insert(6, relative_index=5)
+        assert list(dl) == [0, 1, 2, 3, 5, 6]
+        assert dl.pop(4) == 5
+        assert dl.pop(len(dl)) is None
+        assert dl.pop() == 0
+        assert dl.pop_value(3) == 3
+        assert dl.pop_value(99) is None
+        assert dl.dequeue() == 6
+        assert dl.dequeue(direct=True) == 1
+        assert list(dl) == [2]
+        assert dl.dequeue() == 2
+        assert dl.dequeue() is None
+        with pytest.raises(ValueError):
+            dl.insert(1, relative_index=1)
+        with pytest.raises(ValueError):
+            dl.pop(-1)
+        with pytest.raises(TypeError):
+            dl.append(None)
+        _check_links(dl)
+
+    def test_nodes_as_values(self):
+        """
+        Test passing nodes to the insertion methods.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that a detached node is linked in as is, another node
+        type contributes its value, and a linked node is rejected.
+        """
+        dl = DoublyLinkedList()
+        node = DoublyLinkedNode("a")
+        assert dl.append(node) is node
+        copied = dl.append(SinglyLinkedNode("b"))
+        assert isinstance(copied, DoublyLinkedNode)
+        with pytest.raises(ValueError):
+            dl.append(node)
+        assert list(dl) == ["a", "b"]
+
+    def test_remove_and_move_to_end(self):
+        """
+        Test the O(1) operations on nodes held by the caller.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies moving to either end, moving the current last node, and
+        that removed nodes cannot be removed again.
+        """
+        dl = DoublyLinkedList()
+        nodes = [dl.append(value) for value in range(4)]
+        dl.move_to_end(nodes[1])
+        assert list(dl) == [0, 2, 3, 1]
+        dl.move_to_end(nodes[1])
+        assert list(dl) == [0, 2, 3, 1]
+        dl.move_to_end(nodes[3], last=False)
+        assert list(dl) == [3, 0, 2, 1]
+        dl.move_to_end(nodes[3], last=False)
+        assert list(dl) == [3, 0, 2, 1]
+        assert dl.remove(nodes[0]) == 0
+        assert list(dl) == [3, 2, 1]
+        assert len(dl) == 3
+        with pytest.raises(ValueError):
+            dl.remove(nodes[0])
+        with pytest.raises(ValueError):
+            dl.move_to_end(nodes[0])
+        _check_links(dl)
+
+    def test_extend_error_keeps_list_intact(self):
+        """
+        Test that a bad value part-way through extend leaves a valid list.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that the values before the bad one stay linked.
+        """
+        dl = DoublyLinkedList([0])
+        with pytest.raises(TypeError):
+            dl.extend([1, 2, None, 4])
+        assert list(dl) == [0, 1, 2]
+        assert list(reversed(dl)) == [2, 1, 0]
+        _check_links(dl)
+
+    def test_clear(self):
+        """
+        Test clearing the list.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that the list is empty and its nodes are detached.
+        """
+        dl = DoublyLinkedList()
+        node = dl.append(1)
+        dl.append(2)
+        dl.clear()
+        assert len(dl) == 0 and list(dl) == []
+        assert node.prev is None and node.next is None
+        dl.append(node)
+        assert list(dl) == [1]
+
+    def test_random_operations_match_deque(self):
+        """
+        Test random operations against collections.deque.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies contents after every step of a seeded random run.
+        """
+        rng = random.Random(7)
+        dl = DoublyLinkedList()
+        model = deque()
+        for step in range(2000):
+            choice = rng.random()
+            if choice < 0.3:
+                dl.append(step)
+                model.append(step)
+            elif choice < 0.5:
+                dl.insert(step)
+                model.appendleft(step)
+            elif choice < 0.65:
+                index = rng.randint(0, len(model))
+                dl.insert(step, relative_index=index)
+                model.insert(index, step)
+            elif choice < 0.8:
+                expected = model.pop() if model else None
+                assert dl.dequeue() == expected
+            elif choice < 0.9:
+                expected = model.popleft() if model else None
+                assert dl.dequeue(direct=True) == expected
+            elif model:
+                index = rng.randrange(len(model))
+                assert dl.pop(index) == model[index]
+                del model[index]
+            assert len(dl) == len(model)
+        assert list(dl) == list(model)
+        _check_links(dl)
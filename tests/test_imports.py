@@ -0,0 +1,162 @@
+"""
+Test suite for the package import cost.
+
+This module runs fresh interpreters with ``-X importtime`` to check that
+importing the package loads no optional or unrelated heavy modules and
+stays within a time budget.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import pythondatastructures
+
+SRC = str(Path(pythondatastructures.__file__).resolve().parents[1])
+
+# Self time of the package's own modules, in microseconds. Generous, so
+# the test catches an accidental heavy import rather than machine noise.
+BUDGET_US = 150_000
+
+HEAVY = ("networkx", "numpy", "asyncio", "multiprocessing", "mmap")
+
+
+def _importtime(statement):
+    """
+    Run ``statement`` in a fresh interpreter under ``-X importtime``.
+
+    Parameters
+    ----------
+    statement : str
+        Python source to execute.
+
+    Returns
+    -------
+    dict
+        Maps each imported module name to its self time in microseconds.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [SRC, env.get("PYTHONPATH")])
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(self_us)
+    return modules
+
+
+class TestImportCost:
+    """Test cases for what importing the package pulls in."""
+
+    @pytest.mark.parametrize("statement", [
+        "import pythondatastructures",
+        "import pythondatastructures.old.Actual",
+        "from pythondatastructures.old.Actual import LL, Node",
+        "from pythondatastructures import LinkedList, UnrolledLinkedList",
+    ])
+    def test_no_heavy_modules(self, statement):
+        """
+        Test that common imports load no heavy modules.
+
+        Parameters
+        ----------
+        statement : str
+            The import statement to run.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that networkx and the other heavy modules stay unloaded
+        and that the package's own modules fit in the time budget.
+        """
+        modules = _importtime(statement)
+        loaded = [name for name in modules
+                  if name.split(".")[0] in HEAVY]
+        assert loaded == []
+        own = sum(us for name, us in modules.items()
+                  if name.startswith("pythondatastructures"))
+        assert own < BUDGET_US
+
+    def test_package_import_is_lazy(self):
+        """
+        Test that importing the package runs no implementation modules.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that only the package and its lazy-loading helper load.
+        """
+        modules = _importtime("import pythondatastructures")
+        own = {name for name in modules
+               if name.startswith("pythondatastructures")}
+        assert own == {"pythondatastructures", "pythondatastructures._lazy"}
+
+    def test_lazy_attributes(self):
+        """
+        Test that lazily exported names and submodules resolve.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies attribute access, dir() and the AttributeError for
+        unknown names.
+        """
+        import pythondatastructures.old.Actual as actual
+        from pythondatastructures.nodes import DirectedNode
+
+        assert pythondatastructures.DirectedNode is DirectedNode
+        assert actual.LL is actual.linked_list.LL
+        assert pythondatastructures.old.Actual is actual
+        assert "UnrolledLinkedList" in dir(pythondatastructures)
+        assert "sharedqueue" in dir(pythondatastructures)
+        with pytest.raises(AttributeError):
+            pythondatastructures.missing
+
+    def test_graph_export_imports_networkx(self):
+        """
+        Test that networkx is loaded only once a graph is exported.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that LL.nx_graph imports networkx on demand.
+        """
+        pytest.importorskip("networkx")
+        modules = _importtime(
+            "from pythondatastructures.old.Actual import LL\n"
+            "LL.from_iterable([1, 2]).nx_graph()"
+        )
+        assert "networkx" in modules
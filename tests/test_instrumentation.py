@@ -0,0 +1,273 @@
+"""
+Test suite for the instrumentation probe.
+
+This module contains tests for Probe, the collect context manager and the
+events raised by the traversal primitives and old.Actual.
+"""
+
+import pytest
+from pythondatastructures.instrumentation import EVENTS, Probe, collect, probe
+from pythondatastructures.old.Actual import LL, Node
+from pythondatastructures.traversal import find, last, nth, walk
+
+
+@pytest.fixture(autouse=True)
+def quiet_probe():
+    """
+    Leave the shared probe disabled and reset around every test.
+
+    Returns
+    -------
+    None
+    """
+    probe.enabled = False
+    probe.reset()
+    yield
+    probe.enabled = False
+    probe.reset()
+
+
+class TestProbe:
+    """Test cases for Probe counters and callbacks."""
+
+    def test_callbacks_and_counts(self):
+        """
+        Test that emit counts events and calls the subscribed callbacks.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies callback arguments, totals, unsubscribe and reset.
+        """
+        p = Probe()
+        seen = []
+
+        def callback(event, subject, count):
+            seen.append((event, subject, count))
+
+        p.subscribe("hop", callback)
+        p.emit("hop", "next", 3)
+        p.emit("alloc", "node")
+        assert seen == [("hop", "next", 3)]
+        assert p.counts == {"hop": 3, "alloc": 1}
+        p.unsubscribe("hop", callback)
+        p.emit("hop", "next")
+        assert len(seen) == 1
+        p.reset()
+        assert not p.counts
+
+    def test_unknown_event(self):
+        """
+        Test subscribing to an event that does not exist.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that ValueError is raised.
+        """
+        with pytest.raises(ValueError):
+            Probe().subscribe("jump", print)
+        assert "jump" not in EVENTS
+
+    def test_disabled_probe_reports_nothing(self):
+        """
+        Test that call sites stay silent while the probe is disabled.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that list operations leave the totals empty.
+        """
+        ll = LL.from_iterable(range(10))
+        list(ll)
+        ll.get(5)
+        assert not probe.counts
+
+
+class TestCollect:
+    """Test cases for the collect context manager."""
+
+    def test_nested_blocks(self):
+        """
+        Test that nested blocks count their own events.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies per-block counts and that the probe state is restored.
+        """
+        with collect() as outer:
+            Node(1)
+            with collect() as inner:
+                Node(2)
+            Node(3)
+        assert inner["alloc"] == 1
+        assert outer["alloc"] == 3
+        assert probe.enabled is False
+
+    def test_equal_counts_do_not_confuse_blocks(self):
+        """
+        Test leaving a block while another holds identical counts.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that the inner block is the one detached.
+        """
+        with collect() as outer:
+            with collect() as inner:
+                pass
+            Node(1)
+        assert outer["alloc"] == 1
+        assert inner["alloc"] == 0
+
+
+class TestEvents:
+    """Test cases for the events raised by the linked structures."""
+
+    def test_traversal_hops(self):
+        """
+        Test the hop counts reported by the traversal primitives.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies one event per call carrying the number of links read.
+        """
+        root = LL.from_iterable(range(5)).root
+        with collect() as stats:
+            list(walk(root, "_nxt"))
+        assert stats["hop"] == 5
+        with collect() as stats:
+            find(root, 3, "_nxt")
+            nth(root, 2, "_nxt")
+            last(root, "_nxt")
+        assert stats["hop"] == 3 + 2 + 5
+
+    def test_node_iteration_hops(self):
+        """
+        Test that node iterators report hops only while enabled.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies forward, value and reversed iteration.
+        """
+        ll = LL.from_iterable(range(4))
+        with collect() as stats:
+            assert [node.value for node in ll] == [0, 1, 2, 3]
+            assert list(ll.values()) == [0, 1, 2, 3]
+            tail = ll.root.nxt.nxt.nxt
+            assert [node.value for node in reversed(tail)] == [3, 2, 1, 0]
+        assert stats["hop"] == 12
+
+    def test_pointer_writes_unlinks_and_allocs(self):
+        """
+        Test the events raised by linking and unlinking nodes.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies allocation, insertion, deletion and truncation events.
+        """
+        unlinked = []
+        probe.subscribe("unlink", lambda e, node, c: unlinked.append(node.value))
+        try:
+            with collect() as stats:
+                ll = LL.from_iterable([0, 1])
+                ll.root.insert(5)
+            assert stats["alloc"] == 3
+            assert stats["pointer_write"] == 2 + 2 + 2
+            with collect() as stats:
+                del ll.root.nxt
+                ll.root.nxt = None
+            assert unlinked == [5, 1]
+            assert stats["unlink"] == 2
+            assert stats["pointer_write"] == 2 + 1
+        finally:
+            probe._callbacks["unlink"].clear()
+
+    def test_diagnostic_replaces_print(self, capsys):
+        """
+        Test that deleting a missing link raises a diagnostic, not output.
+
+        Parameters
+        ----------
+        capsys : pytest.CaptureFixture
+            Captures the printed output.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that nothing is printed whether or not the probe is on.
+        """
+        del Node(0).nxt
+        messages = []
+        probe.subscribe("diagnostic", lambda e, msg, c: messages.append(msg))
+        try:
+            with collect():
+                del Node(1).nxt
+        finally:
+            probe._callbacks["diagnostic"].clear()
+        assert len(messages) == 1
+        assert "no next node" in messages[0]
+        assert capsys.readouterr().out == ""
@@ -0,0 +1,264 @@
+"""Test suite for the array-backed LinkedList.
+
+This module contains tests for the struct-of-arrays LinkedList, covering the
+DirectedNode method contract and slot recycling through the free-list.
+"""
+
+import pytest
+from pythondatastructures.linkedlist import NIL, LinkedList
+from pythondatastructures.nodes import SinglyLinkedNode
+
+
+class TestLinkedListConstruction:
+    """Test cases for LinkedList construction."""
+
+    def test_empty_list(self):
+        """
+        Test creation of an empty list.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that a new list is empty and iterates over nothing.
+        """
+        ll = LinkedList()
+        assert len(ll) == 0
+        assert list(ll) == []
+
+    def test_from_iterable(self):
+        """
+        Test creation from an iterable.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that values are appended in iteration order.
+        """
+        ll = LinkedList(range(5))
+        assert len(ll) == 5
+        assert list(ll) == [0, 1, 2, 3, 4]
+
+    def test_none_value_raises(self):
+        """
+        Test that None values are rejected.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the same None rule that DirectedNode enforces.
+        """
+        ll = LinkedList()
+        with pytest.raises(TypeError, match="cannot be None"):
+            ll.append(None)
+
+
+class TestLinkedListContract:
+    """Test cases for the DirectedNode method contract."""
+
+    def test_insert_positions(self):
+        """
+        Test inserting at the front, middle and end.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that relative_index counts the preceding elements.
+        """
+        ll = LinkedList([2, 4])
+        ll.insert(1)
+        ll.insert(3, relative_index=2)
+        ll.insert(5, relative_index=4)
+        assert list(ll) == [1, 2, 3, 4, 5]
+        ll.append(6)
+        assert list(ll) == [1, 2, 3, 4, 5, 6]
+
+    def test_insert_out_of_bounds(self):
+        """
+        Test that invalid relative indexes raise ValueError.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies negative indexes and indexes past the end.
+        """
+        ll = LinkedList([1])
+        with pytest.raises(ValueError):
+            ll.insert(0, relative_index=-1)
+        with pytest.raises(ValueError):
+            ll.insert(0, relative_index=2)
+
+    def test_insert_accepts_nodes(self):
+        """
+        Test that nodes contribute their value.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that DirectedNode instances are unwrapped on insert.
+        """
+        ll = LinkedList()
+        ll.append(SinglyLinkedNode(7))
+        assert list(ll) == [7]
+
+    def test_pop(self):
+        """
+        Test popping by relative index.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies front, middle and tail removal and the past-the-end case.
+        """
+        ll = LinkedList([1, 2, 3, 4])
+        assert ll.pop(1) == 2
+        assert ll.pop() == 1
+        assert ll.pop(1) == 4
+        assert ll.pop(1) is None
+        assert list(ll) == [3]
+        ll.append(5)
+        assert list(ll) == [3, 5]
+
+    def test_pop_value(self):
+        """
+        Test removing by value.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that only the first match is removed.
+        """
+        ll = LinkedList([1, 2, 3, 2])
+        assert ll.pop_value(2) == 2
+        assert list(ll) == [1, 3, 2]
+        assert ll.pop_value(9) is None
+
+    def test_dequeue(self):
+        """
+        Test dequeueing from both ends.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that the tail is kept consistent after removing the last
+        element.
+        """
+        ll = LinkedList([1, 2, 3])
+        assert ll.dequeue() == 3
+        assert ll.dequeue(direct=True) == 1
+        ll.append(4)
+        assert list(ll) == [2, 4]
+        assert ll.dequeue() == 4
+        assert ll.dequeue() == 2
+        assert ll.dequeue() is None
+
+
+class TestLinkedListStorage:
+    """Test cases for the struct-of-arrays storage."""
+
+    def test_slots_are_recycled(self):
+        """
+        Test that released slots are reused.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that the backing arrays do not grow under churn.
+        """
+        ll = LinkedList(range(4))
+        for i in range(100):
+            ll.pop()
+            ll.append(i)
+        assert len(ll._values) == 4
+        assert len(ll._next) == 4
+        assert list(ll) == [96, 97, 98, 99]
+
+    def test_released_slot_drops_reference(self):
+        """
+        Test that removed values are not kept alive.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that a released slot no longer references its value.
+        """
+        ll = LinkedList(["a", "b"])
+        ll.pop()
+        assert ll._free != NIL
+        assert ll._values[ll._free] is None
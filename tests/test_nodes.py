@@ -5,7 +5,12 @@ Tests cover initialization, representation, equality, and interface methods.
 """
 
 import pytest
-from pythondatastructures.nodes import DirectedNode
+from pythondatastructures.nodes import (
+    DirectedNode,
+    DoublyLinkedNode,
+    SinglyLinkedNode,
+)
+from pythondatastructures.traversal import detect_cycle
 
 
 class TestDirectedNodeInitialization:
@@ -619,7 +624,8 @@ class TestDirectedNodeLinking:
         Notes
         -----
         Verifies that nodes can point to previous nodes (though this
-        would create infinite loops in traversal).
+        would create infinite loops in a plain traversal) and that
+        detect_cycle measures the loop.
         """
         node1 = DirectedNode(1)
         node2 = DirectedNode(2)
@@ -629,6 +635,7 @@ class TestDirectedNodeLinking:
 
         assert node1.next is node2
         assert node2.next is node1
+        assert detect_cycle(node1) == (node1, 0, 2)
 
 
 class TestDirectedNodeInterfaceMethods:
@@ -948,3 +955,367 @@ class TestDirectedNodeEdgeCases:
             current = current.next
 
         assert count == 100
+
+
+class TestDirectedNodeSlots:
+    """Test cases for the slotted DirectedNode layout."""
+
+    def test_node_has_no_instance_dict(self):
+        """Test that nodes do not allocate a per-instance __dict__.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that value and next live in slots and arbitrary
+        attributes cannot be attached.
+        """
+        node = SinglyLinkedNode(1)
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.extra = 1
+
+    def test_subclass_without_slots_still_works(self):
+        """Test that subclasses may opt out of the slotted layout.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that a subclass without __slots__ regains a __dict__
+        while keeping the slotted value and next attributes.
+        """
+        class TaggedNode(DirectedNode):
+            pass
+
+        node = TaggedNode(1)
+        node.tag = "a"
+        assert node.tag == "a"
+        assert node.value == 1
+        assert node.next is None
+
+
+
+class TestDirectedNodeIteration:
+    """Test cases for iterating over DirectedNode chains."""
+
+    def test_iter_yields_nodes(self):
+        """Test node iteration from any starting node.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that iteration starts at the node itself and yields the
+        node objects in chain order.
+        """
+        nodes = [SinglyLinkedNode(v) for v in "abc"]
+        nodes[0].next, nodes[1].next = nodes[1], nodes[2]
+        assert [n for n in nodes[0]] == nodes
+        assert all(a is b for a, b in zip(nodes[0], nodes))
+        assert list(nodes[2]) == [nodes[2]]
+
+    def test_values(self):
+        """Test value iteration.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies values in order and a chain longer than the recursion
+        limit.
+        """
+        head = tail = SinglyLinkedNode(0)
+        for value in range(1, 5000):
+            tail.next = SinglyLinkedNode(value)
+            tail = tail.next
+        assert list(head.values()) == list(range(5000))
+
+
+class TestSinglyLinkedNode:
+    """Test cases for the SinglyLinkedNode implementation."""
+
+    @staticmethod
+    def _chain(*values):
+        head = SinglyLinkedNode(values[0])
+        for value in values[1:]:
+            head.append(SinglyLinkedNode(value))
+        return head
+
+    @staticmethod
+    def _values(head):
+        values = []
+        while head is not None:
+            values.append(head.value)
+            head = head.next
+        return values
+
+    def test_append(self):
+        """Test appending nodes to the end of the chain.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that append links nodes in order.
+        """
+        head = self._chain(1, 2, 3)
+        assert self._values(head) == [1, 2, 3]
+
+    def test_insert_relative_index(self):
+        """Test inserting nodes at relative positions.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that relative index 0 inserts right after the node and
+        larger indexes hop forward first.
+        """
+        head = self._chain(1, 3)
+        head.insert(SinglyLinkedNode(2))
+        head.insert(SinglyLinkedNode(4), relative_index=2)
+        assert self._values(head) == [1, 2, 3, 4]
+
+    def test_insert_out_of_bounds(self):
+        """Test that invalid relative indexes raise ValueError.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies both negative indexes and indexes past the chain end.
+        """
+        head = self._chain(1, 2)
+        with pytest.raises(ValueError):
+            head.insert(SinglyLinkedNode(3), relative_index=-1)
+        with pytest.raises(ValueError):
+            head.insert(SinglyLinkedNode(3), relative_index=5)
+
+    def test_insert_non_node_raises(self):
+        """Test that inserting a non-node raises TypeError.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that insert and append only accept DirectedNode
+        instances.
+        """
+        head = self._chain(1)
+        with pytest.raises(TypeError):
+            head.insert(2)
+        with pytest.raises(TypeError):
+            head.append(2)
+
+    def test_pop(self):
+        """Test popping nodes at relative positions.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that the removed node is detached and None is returned
+        when there is no node to remove.
+        """
+        head = self._chain(1, 2, 3, 4)
+        removed = head.pop(1)
+        assert removed.value == 3
+        assert removed.next is None
+        assert self._values(head) == [1, 2, 4]
+        assert head.pop(2) is None
+
+    def test_pop_value(self):
+        """Test removing the first following node with a value.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that only the first match is removed and that a
+        missing value returns None.
+        """
+        head = self._chain(1, 2, 3, 2)
+        assert head.pop_value(2).value == 2
+        assert self._values(head) == [1, 3, 2]
+        assert head.pop_value(99) is None
+
+    def test_dequeue(self):
+        """Test dequeueing from the front and the back.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies direct and indirect dequeue and the empty case.
+        """
+        head = self._chain(1, 2, 3, 4)
+        assert head.dequeue().value == 4
+        assert head.dequeue(direct=True).value == 2
+        assert self._values(head) == [1, 3]
+        assert head.dequeue().value == 3
+        assert head.dequeue() is None
+
+
+class TestDoublyLinkedNode:
+    """Test cases for the DoublyLinkedNode implementation."""
+
+    @staticmethod
+    def _chain(*values):
+        head = DoublyLinkedNode(values[0])
+        for value in values[1:]:
+            head.append(DoublyLinkedNode(value))
+        return head
+
+    @staticmethod
+    def _check_links(head):
+        """Assert that every prev link mirrors a next link."""
+        assert head.prev is None
+        node = head
+        while node.next is not None:
+            assert node.next.prev is node
+            node = node.next
+
+    def test_insert_and_append(self):
+        """Test that insertion keeps both link directions consistent.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the order and every prev link after inserts and appends.
+        """
+        head = self._chain(1, 4)
+        head.insert(DoublyLinkedNode(2))
+        head.insert(DoublyLinkedNode(3), relative_index=1)
+        head.append(DoublyLinkedNode(5))
+        assert list(head.values()) == [1, 2, 3, 4, 5]
+        self._check_links(head)
+        with pytest.raises(ValueError):
+            head.insert(DoublyLinkedNode(9), relative_index=9)
+        with pytest.raises(TypeError):
+            head.insert(SinglyLinkedNode(9))
+
+    def test_unlink(self):
+        """Test removing a node through its own links.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies unlinking a middle and a last node, and that the removed
+        node is detached.
+        """
+        head = self._chain(1, 2, 3)
+        middle = head.next
+        assert middle.unlink() is middle
+        assert middle.prev is None and middle.next is None
+        assert list(head.values()) == [1, 3]
+        head.next.unlink()
+        assert head.next is None
+        self._check_links(head)
+
+    def test_pop_pop_value_and_dequeue(self):
+        """Test the removal methods of the node contract.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies removed values, the None results and the remaining links.
+        """
+        head = self._chain(1, 2, 3, 4, 5, 3)
+        assert head.pop(1).value == 3
+        assert head.pop_value(3).value == 3
+        assert head.pop_value(99) is None
+        assert head.dequeue().value == 5
+        assert head.dequeue(direct=True).value == 2
+        assert list(head.values()) == [1, 4]
+        self._check_links(head)
+        assert head.pop(1) is None
+        head.dequeue()
+        assert head.dequeue() is None
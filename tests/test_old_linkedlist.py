@@ -6,6 +6,7 @@ and advLinkedList implementations from linkedlist.py.
 """
 
 import pytest
+from pythondatastructures.instrumentation import collect
 from pythondatastructures.old import (
     llnode,
     linkedlist,
@@ -13,6 +14,7 @@ from pythondatastructures.old import (
     queue,
     advLinkedList,
 )
+from pythondatastructures.pool import NodePool
 
 
 class TestLLNode:
@@ -152,6 +154,36 @@ class TestLinkedList:
         assert ll.root is node
         assert ll.root.value == 100
 
+    def test_from_iterable_and_extend(self):
+        """
+        Test bulk construction of the base class.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies order and left pointers, extending a non-empty list and
+        an empty iterable.
+        """
+        ll = linkedlist.from_iterable(range(3))
+        ll.extend([3, 4])
+        ll.extend([])
+        nodes = []
+        node = ll.root
+        while node:
+            nodes.append(node)
+            node = node.right
+        assert [n.value for n in nodes] == [0, 1, 2, 3, 4]
+        assert ll.root.left is None
+        assert all(b.left is a for a, b in zip(nodes, nodes[1:]))
+        assert linkedlist.from_iterable([]).root is None
+
 
 class TestStack:
     """Test cases for the stack implementation."""
@@ -283,6 +315,31 @@ class TestStack:
 
         assert s.root is None
 
+    def test_pop_clears_links(self):
+        """
+        Test that popping leaves consistent left and right links.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that the new top has no left link and that the popped
+        node is detached from the stack.
+        """
+        s = stack()
+        s.push(1)
+        s.push(2)
+        popped = s.pop()
+        assert popped.right is None
+        assert s.root.value == 1
+        assert s.root.left is None
+
     def test_pop_empty_stack(self):
         """
         Test popping from an empty stack.
@@ -516,6 +573,77 @@ class TestQueue:
 
         assert q.root is None
 
+    def test_tail_and_size_tracking(self):
+        """
+        Test that the tail reference and size counter stay current.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies tail and size across pushes, pops, and pushing again
+        after the queue has been emptied.
+        """
+        q = queue()
+        assert len(q) == 0
+        assert q.tail is None
+
+        q.push(1)
+        q.push(2)
+        assert len(q) == 2
+        assert q.tail.value == 2
+
+        q.pop()
+        q.pop()
+        assert len(q) == 0
+        assert q.tail is None
+        assert q.pop() is None
+        assert len(q) == 0
+
+        q.push(3)
+        assert q.root is q.tail
+        assert q.root.value == 3
+
+    def test_push_does_not_walk(self):
+        """
+        Test that push appends through the tail pointer.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Cuts the chain behind the root, so that any push walking from the
+        root would stop at the wrong node, and checks that pushes still
+        land after the tail and report no traversal hops.
+        """
+        q = queue.from_iterable(range(3))
+        middle = q.root.right
+        q.root.right = None
+        with collect() as stats:
+            for value in range(3, 6):
+                q.push(value)
+                assert q.tail.value == value
+        assert stats["hop"] == 0
+        values = []
+        node = middle
+        while node:
+            values.append(node.value)
+            node = node.right
+        assert values == [1, 2, 3, 4, 5]
+        assert len(q) == 6
+
 
 class TestAdvLinkedList:
     """Test cases for the advLinkedList class."""
@@ -926,3 +1054,372 @@ class TestAdvLinkedList:
         assert ll.indexOfVal("hello") == 1
         assert ll.indexOfVal(3.14) == 2
         assert ll.indexOfVal([1, 2, 3]) == 3
+
+
+class TestLongChains:
+    """Test cases for lists longer than the recursion limit."""
+
+    SIZE = 20_000
+
+    def test_print_long_chain(self, capsys):
+        """
+        Test printing a list longer than the recursion limit.
+
+        Parameters
+        ----------
+        capsys : pytest.CaptureFixture
+            Captures the printed output.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that llnode.print walks the chain iteratively.
+        """
+        q = queue()
+        for i in range(self.SIZE):
+            q.push(i)
+        q.print()
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == self.SIZE + 1
+        assert lines[-1] == f"{self.SIZE} ). {self.SIZE - 1}"
+
+    def test_index_of_value_long_chain(self):
+        """
+        Test searching a list longer than the recursion limit.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies indexOfVal, valAtIndex and append at the end of a long
+        list.
+        """
+        ll = advLinkedList()
+        ll.root = tail = llnode(0)
+        for i in range(1, self.SIZE):
+            tail.right = llnode(i)
+            tail = tail.right
+        ll.append(self.SIZE)
+        assert ll.root.right.value == 1
+        assert ll.valAtIndex(self.SIZE) == self.SIZE
+        assert ll.indexOfVal(self.SIZE - 1) == self.SIZE - 1
+        assert ll.indexOfVal(-5) == -1
+        assert ll.valAtIndex(self.SIZE - 1) == self.SIZE - 1
+        assert ll.valAtIndex(-1) is None
+
+
+class TestAdvLinkedListSkipIndex:
+    """Test cases for advLinkedList with the skip-list index enabled."""
+
+    def test_append_and_value_at_index(self):
+        """
+        Test positional reads through the express lanes.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies valAtIndex for every position and out of range, and that
+        appended nodes get left pointers.
+        """
+        ll = advLinkedList(skipindex=True)
+        for i in range(500):
+            ll.append(i * 10)
+        assert [ll.valAtIndex(i) for i in range(500)] == [
+            i * 10 for i in range(500)
+        ]
+        assert ll.valAtIndex(500) is None
+        assert ll.valAtIndex(-1) is None
+        assert ll.root.right.left is ll.root
+
+    def test_remove_keeps_index_consistent(self):
+        """
+        Test removals from the front, middle and end.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies returned nodes, missing values, an empty list, and that
+        positional reads stay correct afterwards.
+        """
+        ll = advLinkedList(skipindex=True)
+        assert ll.removeVal(1) is None
+        values = list(range(100))
+        for value in values:
+            ll.append(value)
+        for value in (0, 50, 99, 51, 1):
+            removed = ll.removeVal(value)
+            assert removed.value == value
+            assert removed.left is None and removed.right is None
+            values.remove(value)
+        assert ll.removeVal(1000) is None
+        assert len(ll.skip) == len(values)
+        assert [ll.valAtIndex(i) for i in range(len(values))] == values
+        ll.append(7)
+        assert ll.valAtIndex(len(values)) == 7
+
+
+class TestAdvLinkedListValueIndex:
+    """Test cases for advLinkedList with the value index enabled."""
+
+    @pytest.mark.parametrize("skipindex", [False, True])
+    def test_lookup_and_remove(self, skipindex):
+        """
+        Test lookups and removals through the value index.
+
+        Parameters
+        ----------
+        skipindex : bool
+            Whether the skip-list index is enabled as well.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies membership, indexOfVal and removeVal with duplicate and
+        unhashable values.
+        """
+        ll = advLinkedList(skipindex=skipindex, valueindex=True)
+        for value in [1, 2, 3, 2, [4]]:
+            ll.append(value)
+        assert 2 in ll
+        assert 9 not in ll
+        assert ll.indexOfVal(2) == 1
+        assert ll.indexOfVal([4]) == 4
+        assert ll.indexOfVal(9) == -1
+
+        assert ll.removeVal(2).value == 2
+        assert ll.indexOfVal(2) == 2
+        assert ll.removeVal(1).value == 1
+        assert ll.root.value == 3
+        assert ll.removeVal([4]).value == [4]
+        assert ll.removeVal(9) is None
+        assert [ll.valAtIndex(i) for i in range(2)] == [3, 2]
+        assert ll.valAtIndex(2) is None
+        assert ll.value_index.first(3) is ll.root
+        assert advLinkedList().value_index is None
+
+
+class TestBulkConstruction:
+    """Test cases for from_iterable, extend and push_many."""
+
+    def test_stack_push_many(self):
+        """
+        Test pushing many values onto a stack.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that the result matches pushing one by one, including
+        left pointers, on empty and non-empty stacks.
+        """
+        s = stack.from_iterable(range(3))
+        s.push_many(iter([3, 4]))
+        assert s.root.value == 4
+        assert s.root.right.left is s.root
+        assert [s.pop().value for _ in range(5)] == [4, 3, 2, 1, 0]
+        assert s.pop() is None
+
+    def test_queue_push_many(self):
+        """
+        Test pushing many values onto a queue.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies FIFO order, tail and size, including an empty batch and
+        a generator.
+        """
+        q = queue.from_iterable([0, 1])
+        q.push_many(i for i in range(2, 5))
+        q.extend([])
+        assert len(q) == 5
+        assert q.tail.value == 4
+        q.push(5)
+        assert [q.pop().value for _ in range(6)] == [0, 1, 2, 3, 4, 5]
+        assert q.tail is None
+        q.push_many([])
+        assert q.root is None
+
+    @pytest.mark.parametrize(
+        "options",
+        [{}, {"skipindex": True}, {"valueindex": True},
+         {"skipindex": True, "valueindex": True}],
+    )
+    def test_adv_linked_list_extend(self, options):
+        """
+        Test extending an advLinkedList.
+
+        Parameters
+        ----------
+        options : dict
+            Index options passed to the constructor.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies order, left pointers and that the enabled indexes cover
+        the new nodes.
+        """
+        ll = advLinkedList.from_iterable(range(50), **options)
+        ll.extend(range(50, 100))
+        assert ll.root.left is None
+        assert ll.root.right.left is ll.root
+        assert [ll.valAtIndex(i) for i in range(100)] == list(range(100))
+        assert ll.indexOfVal(75) == 75
+        assert ll.removeVal(75).value == 75
+        assert ll.valAtIndex(75) == 76
+        ll.append(100)
+        assert ll.indexOfVal(100) == 99
+
+
+class TestNodePooling:
+    """Test cases for stack and queue with a NodePool."""
+
+    @pytest.mark.parametrize("kind", [stack, queue])
+    def test_popval_without_pool(self, kind):
+        """
+        Test popval on structures without a pool.
+
+        Parameters
+        ----------
+        kind : type
+            The structure under test.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the values and the None result when empty.
+        """
+        structure = kind.from_iterable([1, 2])
+        assert structure.pool is None
+        assert sorted([structure.popval(), structure.popval()]) == [1, 2]
+        assert structure.popval() is None
+
+    def test_stack_recycles_nodes(self):
+        """
+        Test steady push/popval churn on a pooled stack.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies LIFO order, the links of recycled nodes and that only the
+        first pushes allocate.
+        """
+        pool = NodePool(llnode, cap=8)
+        s = stack(pool=pool)
+        s.push_many(range(3))
+        for round_ in range(50):
+            s.push(round_)
+            s.push(round_ + 100)
+            assert s.popval() == round_ + 100
+            assert s.popval() == round_
+        assert pool.misses == 5 and pool.hits == 98
+        assert s.root.left is None
+        assert [s.popval() for _ in range(3)] == [2, 1, 0]
+        assert s.root is None and len(pool) == 5
+        s.push("x")
+        assert s.root.left is None and s.root.right is None
+
+    def test_queue_recycles_nodes(self):
+        """
+        Test steady push/popval churn on a pooled queue.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies FIFO order, size, tail and that a recycled node never
+        carries a stale link.
+        """
+        pool = NodePool(llnode)
+        q = queue.from_iterable(range(3), pool=pool)
+        for value in range(3, 200):
+            q.push(value)
+            assert q.popval() == value - 3
+            assert q.tail.right is None
+        assert len(q) == 3 and pool.misses == 4 and pool.hits == 196
+        q.push_many([200, 201])
+        assert [q.popval() for _ in range(5)] == [197, 198, 199, 200, 201]
+        assert q.popval() is None and q.root is None and q.tail is None
+
+    def test_pop_keeps_node(self):
+        """
+        Test that pop still hands the node to the caller.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that a node returned by pop is not recycled behind the
+        caller's back.
+        """
+        pool = NodePool(llnode)
+        s = stack(pool=pool)
+        s.push(1)
+        node = s.pop()
+        s.push(2)
+        assert node.value == 1 and len(pool) == 0 and pool.hits == 0
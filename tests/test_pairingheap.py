@@ -0,0 +1,292 @@
+"""Test suite for the pairing-heap priority queue.
+
+This module contains tests for PairingHeap, covering ordering against
+heapq, melding, bulk heapify and the handle operations decrease_key and
+remove.
+"""
+
+import heapq
+import random
+
+import pytest
+from pythondatastructures.nodes import DirectedNode
+from pythondatastructures.pairingheap import HeapNode, PairingHeap
+
+
+def _check_tree(heap):
+    """Return the number of nodes after asserting heap order and back links."""
+    root = heap.peek_node()
+    if root is None:
+        return 0
+    assert root.prev is None and root.next is None
+    count = 0
+    stack = [root]
+    while stack:
+        parent = stack.pop()
+        count += 1
+        previous = parent
+        child = parent.child
+        while child is not None:
+            assert child.prev is previous
+            assert not child.priority < parent.priority
+            stack.append(child)
+            previous = child
+            child = child.next
+    return count
+
+
+class TestPairingHeap:
+    """Test cases for PairingHeap."""
+
+    def test_push_pop_order(self):
+        """
+        Test that values come out in priority order.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies pop, peek, len, the None results when empty and that
+        handles are HeapNode instances.
+        """
+        heap = PairingHeap()
+        assert heap.pop() is None and heap.peek() is None
+        node = heap.push(3)
+        assert isinstance(node, HeapNode) and isinstance(node, DirectedNode)
+        for value in (5, 1, 4, 1, 2):
+            heap.push(value)
+        assert len(heap) == 6 and heap.peek() == 1
+        assert [heap.pop() for _ in range(6)] == [1, 1, 2, 3, 4, 5]
+        assert heap.pop() is None and len(heap) == 0
+        with pytest.raises(TypeError):
+            heap.push(None)
+
+    def test_priorities_and_key(self):
+        """
+        Test explicit priorities and the key function.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that an explicit priority overrides the key.
+        """
+        heap = PairingHeap(["ccc", "a", "bb"], key=len)
+        heap.push("zzzz", priority=0)
+        assert [heap.pop() for _ in range(4)] == ["zzzz", "a", "bb", "ccc"]
+
+    def test_random_against_heapq(self):
+        """
+        Test a random mix of pushes and pops against heapq.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies every popped value and the tree invariants along the way.
+        """
+        rng = random.Random(23)
+        heap = PairingHeap()
+        reference = []
+        for step in range(3000):
+            if reference and rng.random() < 0.45:
+                assert heap.pop() == heapq.heappop(reference)
+            else:
+                value = rng.randrange(500)
+                heap.push(value)
+                heapq.heappush(reference, value)
+            if step % 500 == 0:
+                assert _check_tree(heap) == len(reference)
+        assert [heap.pop() for _ in range(len(heap))] == sorted(reference)
+
+    def test_heapify(self):
+        """
+        Test bulk loading, into empty and non-empty heaps.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the size, the invariants and that the root does not end
+        up with one child per value.
+        """
+        values = list(range(1000))
+        random.Random(1).shuffle(values)
+        heap = PairingHeap(values)
+        assert _check_tree(heap) == 1000
+        children = 0
+        child = heap.peek_node().child
+        while child is not None:
+            children += 1
+            child = child.next
+        assert children <= 11
+        heap.heapify([-1, 2000])
+        heap.heapify([])
+        assert len(heap) == 1002 and heap.peek() == -1
+        assert [heap.pop() for _ in range(1002)] == [-1] + list(range(1000)) + [2000]
+
+    def test_meld(self):
+        """
+        Test melding two heaps.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that the other heap is emptied, that its handles keep
+        working and that melding empty heaps or self is a no-op.
+        """
+        left = PairingHeap([4, 8])
+        right = PairingHeap([6, 2])
+        handle = right.push(10)
+        left.meld(right)
+        assert len(left) == 5 and len(right) == 0 and right.pop() is None
+        left.decrease_key(handle, 0)
+        left.meld(PairingHeap())
+        left.meld(left)
+        empty = PairingHeap()
+        empty.meld(left)
+        assert len(left) == 0
+        assert [empty.pop() for _ in range(5)] == [10, 2, 4, 6, 8]
+
+
+class TestPairingHeapHandles:
+    """Test cases for decrease_key and remove."""
+
+    def test_decrease_key(self):
+        """
+        Test lowering priorities of root, first-child and sibling nodes.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the new order and the rejected increases.
+        """
+        heap = PairingHeap()
+        handles = {name: heap.push(name, priority)
+                   for name, priority in zip("abcdef", (5, 3, 8, 1, 9, 7))}
+        heap.pop()  # "d", so the rest form a tree of siblings and children
+        heap.decrease_key(handles["e"], 2)
+        heap.decrease_key(handles["c"], 0)
+        heap.decrease_key(handles["c"], -1)  # the root
+        heap.decrease_key(handles["a"], 5)  # unchanged
+        assert _check_tree(heap) == 5
+        with pytest.raises(ValueError):
+            heap.decrease_key(handles["b"], 4)
+        assert [heap.pop() for _ in range(5)] == ["c", "e", "b", "a", "f"]
+
+    def test_remove(self):
+        """
+        Test removing arbitrary entries through their handles.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies removal of the root and inner nodes, and that removed or
+        popped handles are rejected.
+        """
+        rng = random.Random(5)
+        values = rng.sample(range(10000), 400)
+        heap = PairingHeap()
+        handles = [heap.push(value) for value in values]
+        for _ in range(50):
+            heap.pop()
+        remaining = sorted(values)[50:]
+        live = [node for node in handles if node.value in remaining]
+        for node in rng.sample(live, 150):
+            assert heap.remove(node) == node.value
+            remaining.remove(node.value)
+            with pytest.raises(ValueError):
+                heap.remove(node)
+        root = heap.peek_node()
+        assert heap.remove(root) == remaining.pop(0)
+        assert _check_tree(heap) == len(remaining) == len(heap)
+        with pytest.raises(ValueError):
+            heap.decrease_key(root, -5)
+        with pytest.raises(ValueError):
+            heap.remove(HeapNode(1, 1))
+        assert [heap.pop() for _ in range(len(heap))] == remaining
+
+    def test_random_handles_against_reference(self):
+        """
+        Test a random mix of every operation against a sorted reference.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the minimum after every step.
+        """
+        rng = random.Random(11)
+        heap = PairingHeap()
+        live = {}
+        for serial in range(2000):
+            roll = rng.random()
+            if live and roll < 0.2:
+                node = live.pop(rng.choice(list(live)))
+                heap.remove(node)
+            elif live and roll < 0.4:
+                node = live[rng.choice(list(live))]
+                heap.decrease_key(node, node.priority - rng.randrange(100))
+            elif live and roll < 0.55:
+                priority = heap.peek_node().priority
+                value = heap.pop()
+                assert priority == min(n.priority for n in live.values())
+                del live[value]
+            else:
+                live[serial] = heap.push(serial, rng.randrange(1000))
+            assert len(heap) == len(live)
+            if live:
+                assert heap.peek_node().priority == min(
+                    n.priority for n in live.values())
+        assert _check_tree(heap) == len(live)
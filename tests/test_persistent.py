@@ -0,0 +1,255 @@
+"""Test suite for the memory-mapped persistent linked list.
+
+This module contains tests for MappedLinkedList, covering the on-disk
+header, reopening, the free-list, growth and the value-based contract.
+"""
+
+import random
+import struct
+
+import pytest
+from pythondatastructures.persistent import (
+    HEADER_SIZE,
+    MAGIC,
+    MappedLinkedList,
+)
+
+
+@pytest.fixture
+def path(tmp_path):
+    """
+    Provide a path for a list file.
+
+    Returns
+    -------
+    pathlib.Path
+        A path inside a temporary directory.
+    """
+    return tmp_path / "list.pds"
+
+
+class TestMappedLinkedList:
+    """Test cases for MappedLinkedList."""
+
+    def test_create_and_reopen(self, path):
+        """
+        Test that values survive closing and reopening the file.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Fixture path for the list file.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the header magic, the stored format and the contents.
+        """
+        with MappedLinkedList(path) as ml:
+            for value in range(5):
+                ml.append(value)
+        assert path.read_bytes()[:8] == MAGIC
+        with MappedLinkedList(path, fmt="<q") as ml:
+            assert len(ml) == 5
+            assert list(ml) == [0, 1, 2, 3, 4]
+            assert ml.fmt == "<q"
+
+    def test_contract(self, path):
+        """
+        Test insert, append, pop and valAtIndex.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Fixture path for the list file.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies positions, the None sentinels and bounds checks.
+        """
+        with MappedLinkedList(path) as ml:
+            ml.append(2)
+            ml.insert(0)
+            ml.insert(1, relative_index=1)
+            ml.append(3)
+            assert list(ml) == [0, 1, 2, 3]
+            assert ml.valAtIndex(2) == 2
+            assert ml.valAtIndex(-1) is None
+            assert ml.valAtIndex(4) is None
+            assert ml.pop(3) == 3
+            assert ml.pop(len(ml)) is None
+            assert ml.pop() == 0
+            assert list(ml) == [1, 2]
+            with pytest.raises(ValueError):
+                ml.pop(3)
+            with pytest.raises(ValueError):
+                ml.insert(9, relative_index=-1)
+
+    def test_tuple_records(self, path):
+        """
+        Test multi-field record formats.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Fixture path for the list file.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies tuple values and the record size written to the header.
+        """
+        with MappedLinkedList(path, fmt="<id") as ml:
+            ml.append((1, 0.5))
+            ml.append((2, 1.5))
+            assert list(ml) == [(1, 0.5), (2, 1.5)]
+            assert ml._record_size == 8 + 12
+
+    def test_free_list_reuses_records(self, path):
+        """
+        Test that removed records are reused before the file grows.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Fixture path for the list file.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that the file size stays fixed while popped records are
+        recycled, including across reopening.
+        """
+        with MappedLinkedList(path, capacity=4) as ml:
+            for value in range(4):
+                ml.append(value)
+            size = path.stat().st_size
+            ml.pop()
+            ml.pop()
+        with MappedLinkedList(path) as ml:
+            ml.append(4)
+            ml.append(5)
+            assert path.stat().st_size == size
+            assert list(ml) == [2, 3, 4, 5]
+
+    def test_growth(self, path):
+        """
+        Test that the file doubles when it runs out of records.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Fixture path for the list file.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the file size and contents after several remaps.
+        """
+        with MappedLinkedList(path, capacity=2) as ml:
+            for value in range(9):
+                ml.append(value)
+            assert list(ml) == list(range(9))
+            record_size = ml._record_size
+        assert path.stat().st_size == HEADER_SIZE + 16 * record_size
+
+    def test_rejects_foreign_files(self, path):
+        """
+        Test opening files that are not lists or use another format.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Fixture path for the list file.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that ValueError is raised.
+        """
+        with MappedLinkedList(path, fmt="<d"):
+            pass
+        with pytest.raises(ValueError):
+            MappedLinkedList(path, fmt="<q")
+        path.write_bytes(b"not a list" * 20)
+        with pytest.raises(ValueError):
+            MappedLinkedList(path)
+
+    def test_random_edits_match_list(self, path):
+        """
+        Test random edits against a Python list, reopening midway.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Fixture path for the list file.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies contents after every phase.
+        """
+        rng = random.Random(3)
+        model = []
+        for _ in range(3):
+            with MappedLinkedList(path, capacity=8) as ml:
+                assert list(ml) == model
+                for step in range(300):
+                    if model and rng.random() < 0.45:
+                        index = rng.randrange(len(model))
+                        assert ml.pop(index) == model.pop(index)
+                    else:
+                        index = rng.randint(0, len(model))
+                        ml.insert(step, relative_index=index)
+                        model.insert(index, step)
+                assert list(ml) == model
+                assert len(ml) == len(model)
+
+    def test_bad_value_leaves_list_intact(self, path):
+        """
+        Test that a value not matching the format is rejected cleanly.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Fixture path for the list file.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that struct.error is raised and the free-list survives.
+        """
+        with MappedLinkedList(path) as ml:
+            ml.append(1)
+            ml.append(2)
+            ml.pop()
+            with pytest.raises(struct.error):
+                ml.append("x")
+            ml.append(3)
+            assert list(ml) == [2, 3]
+            assert ml._used == 2
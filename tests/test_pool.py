@@ -0,0 +1,97 @@
+"""Test suite for the node free-list pool.
+
+This module contains tests for NodePool, covering reuse, the cap, shrink
+and the hit and miss counters.
+"""
+
+import pytest
+from pythondatastructures.old import llnode
+from pythondatastructures.pool import NodePool
+
+
+class TestNodePool:
+    """Test cases for NodePool."""
+
+    def test_acquire_and_release(self):
+        """
+        Test that released nodes are handed out again.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies reuse order, cleared values, the counters and the repr.
+        """
+        pool = NodePool(llnode)
+        first, second = pool.acquire(1), pool.acquire(2)
+        assert isinstance(first, llnode) and first.value == 1
+        assert pool.misses == 2 and pool.hits == 0 and len(pool) == 0
+        assert pool.release(first) and pool.release(second)
+        assert first.value is None and len(pool) == 2
+        assert pool.acquire(3) is second and second.value == 3
+        assert pool.acquire(4) is first
+        assert pool.hits == 2 and pool.misses == 2
+        assert repr(pool) == "NodePool(free=0, cap=1024, hits=2, misses=2)"
+        pool.reset_stats()
+        assert pool.hits == pool.misses == 0
+
+    def test_cap(self):
+        """
+        Test the bound on free nodes.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that releases beyond the cap are refused, that lowering
+        the cap drops the surplus and that negative caps are rejected.
+        """
+        pool = NodePool(llnode, cap=2)
+        nodes = [pool.acquire(i) for i in range(3)]
+        assert [pool.release(node) for node in nodes] == [True, True, False]
+        assert nodes[2].value == 2 and len(pool) == 2
+        pool.cap = 1
+        assert pool.cap == 1 and len(pool) == 1
+        assert not NodePool(llnode, cap=0).release(nodes[2])
+        with pytest.raises(ValueError):
+            NodePool(llnode, cap=-1)
+        with pytest.raises(ValueError):
+            pool.cap = -1
+
+    def test_shrink(self):
+        """
+        Test returning free nodes to the allocator.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the number dropped, keeping some nodes and the error for
+        a negative keep.
+        """
+        pool = NodePool(llnode)
+        for value in range(10):
+            pool.release(llnode(value))
+        assert pool.shrink(4) == 6 and len(pool) == 4
+        assert pool.shrink(8) == 0 and len(pool) == 4
+        assert pool.shrink() == 4 and len(pool) == 0
+        with pytest.raises(ValueError):
+            pool.shrink(-1)
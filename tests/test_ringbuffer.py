@@ -0,0 +1,214 @@
+"""Test suite for the bounded ring-buffer queue.
+
+This module contains tests for RingBuffer, covering FIFO order across the
+wrap-around point, the three overflow policies and bulk draining.
+"""
+
+import queue
+import random
+from collections import deque
+
+import pytest
+from pythondatastructures.ringbuffer import OVERFLOW_POLICIES, RingBuffer
+
+
+class TestRingBuffer:
+    """Test cases for RingBuffer."""
+
+    def test_fifo_across_wrap(self):
+        """
+        Test FIFO order while the head and tail wrap around.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies pop, peek, len and that popped slots are cleared.
+        """
+        rb = RingBuffer(3)
+        for round_ in range(5):
+            rb.push(round_)
+            rb.push(round_ + 10)
+            assert rb.peek() == round_
+            assert rb.pop() == round_
+            assert rb.pop() == round_ + 10
+        assert len(rb) == 0
+        assert rb.pop() is None and rb.peek() is None
+        assert rb._slots == [None, None, None]
+
+    def test_invalid_arguments(self):
+        """
+        Test rejected capacities and policies.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that ValueError is raised.
+        """
+        with pytest.raises(ValueError):
+            RingBuffer(0)
+        with pytest.raises(ValueError):
+            RingBuffer(2, overflow="grow")
+        with pytest.raises(ValueError):
+            RingBuffer(2).drain(-1)
+
+    def test_overflow_raise(self):
+        """
+        Test that a full buffer raises and stays unchanged.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies queue.Full, the contents and the dropped counter.
+        """
+        rb = RingBuffer(2)
+        rb.extend([1, 2])
+        assert rb.full()
+        with pytest.raises(queue.Full):
+            rb.push(3)
+        assert list(rb) == [1, 2]
+        assert rb.dropped == 0
+
+    def test_overflow_drop_oldest(self):
+        """
+        Test evicting the oldest item on overflow.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the returned evicted items and the surviving order.
+        """
+        rb = RingBuffer(3, overflow="drop_oldest")
+        assert [rb.push(value) for value in range(6)] == [
+            None, None, None, 0, 1, 2]
+        assert list(rb) == [3, 4, 5]
+        assert rb.pop() == 3
+        assert rb.push(6) is None
+        assert rb.push(7) == 4
+        assert list(rb) == [5, 6, 7]
+        assert rb.dropped == 4
+
+    def test_overflow_drop_newest(self):
+        """
+        Test discarding the pushed item on overflow.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that the pushed item is returned and the buffer kept.
+        """
+        rb = RingBuffer(2, overflow="drop_newest")
+        rb.extend([1, 2, 3, 4])
+        assert list(rb) == [1, 2]
+        assert rb.push(5) == 5
+        assert rb.dropped == 3
+        assert repr(rb) == "RingBuffer([1, 2], capacity=2, overflow='drop_newest')"
+
+    def test_drain(self):
+        """
+        Test bulk removal, including across the wrap-around point.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies partial and full drains and the cleared slots.
+        """
+        rb = RingBuffer(5)
+        rb.extend(range(4))
+        rb.drain(3)
+        rb.extend([4, 5, 6, 7])
+        assert list(rb) == [3, 4, 5, 6, 7]
+        assert rb.drain(0) == []
+        assert rb.drain(4) == [3, 4, 5, 6]
+        assert rb.drain(10) == [7]
+        assert rb.drain() == []
+        assert rb._slots == [None] * 5
+        rb.extend([8, 9])
+        rb.clear()
+        assert len(rb) == 0 and rb._head == 0
+
+    @pytest.mark.parametrize("overflow", OVERFLOW_POLICIES)
+    def test_random_operations_match_deque(self, overflow):
+        """
+        Test random operations against a model deque.
+
+        Parameters
+        ----------
+        overflow : str
+            The overflow policy under test.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies contents after every step of a seeded random run.
+        """
+        rng = random.Random(11)
+        capacity = 7
+        rb = RingBuffer(capacity, overflow=overflow)
+        model = deque()
+        for step in range(3000):
+            choice = rng.random()
+            if choice < 0.55:
+                if len(model) < capacity:
+                    model.append(step)
+                    assert rb.push(step) is None
+                elif overflow == "drop_oldest":
+                    assert rb.push(step) == model.popleft()
+                    model.append(step)
+                elif overflow == "drop_newest":
+                    assert rb.push(step) == step
+                else:
+                    with pytest.raises(queue.Full):
+                        rb.push(step)
+            elif choice < 0.85:
+                assert rb.pop() == (model.popleft() if model else None)
+            else:
+                n = rng.randint(0, capacity + 1)
+                expected = [model.popleft() for _ in range(min(n, len(model)))]
+                assert rb.drain(n) == expected
+            assert list(rb) == list(model)
+            assert len(rb) == len(model)
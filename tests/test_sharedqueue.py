@@ -0,0 +1,279 @@
+"""Test suite for the shared-memory ring-buffer queue.
+
+This module contains tests for SharedRingQueue, covering both record modes,
+wrap-around, attaching by name and exchanging items between processes.
+"""
+
+import multiprocessing
+import os
+import pickle
+import queue
+import subprocess
+import sys
+import textwrap
+
+import pytest
+from pythondatastructures.sharedqueue import SharedRingQueue
+
+
+@pytest.fixture
+def make_queue():
+    """
+    Provide a factory for queues that are unlinked after the test.
+
+    Returns
+    -------
+    callable
+        Creates a SharedRingQueue from the given keyword arguments.
+    """
+    created = []
+
+    def make(**kwargs):
+        q = SharedRingQueue(**kwargs)
+        created.append(q)
+        return q
+
+    yield make
+    for q in created:
+        q.close()
+        q.unlink()
+
+
+_SPAWN_SCRIPT = textwrap.dedent("""
+    import multiprocessing
+
+    from pythondatastructures.sharedqueue import SharedRingQueue
+
+
+    def consume(q):
+        assert q.pop() == 1
+        q.close()
+
+
+    if __name__ == "__main__":
+        q = SharedRingQueue(slots=4, fmt="<i")
+        q.push(1)
+        q.push(2)
+        child = multiprocessing.get_context("spawn").Process(
+            target=consume, args=(q,)
+        )
+        child.start()
+        child.join()
+        assert child.exitcode == 0
+        with SharedRingQueue.attach(q.name) as other:
+            assert other.pop() == 2
+        q.close()
+        q.unlink()
+""")
+
+
+def _produce(q, count):
+    for i in range(count):
+        while True:
+            try:
+                q.push(i.to_bytes(4, "little") * 2)
+                break
+            except queue.Full:
+                pass
+    q.close()
+
+
+class TestSharedRingQueue:
+    """Test cases for SharedRingQueue."""
+
+    def test_bytes_records(self, make_queue):
+        """
+        Test length-prefixed bytes records.
+
+        Parameters
+        ----------
+        make_queue : callable
+            Fixture creating queues.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies FIFO order, empty payloads, the None sentinel and the
+        size check.
+        """
+        q = make_queue(slots=4, slot_size=16)
+        q.push(b"abc")
+        q.push(bytearray(b""))
+        q.push(memoryview(b"x" * 12))
+        assert len(q) == 3
+        assert [q.pop(), q.pop(), q.pop()] == [b"abc", b"", b"x" * 12]
+        assert q.pop() is None
+        with pytest.raises(ValueError):
+            q.push(b"x" * 13)
+
+    def test_struct_records(self, make_queue):
+        """
+        Test fixed-width struct records.
+
+        Parameters
+        ----------
+        make_queue : callable
+            Fixture creating queues.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies tuple records and scalar records for one-field formats.
+        """
+        pairs = make_queue(slots=2, fmt="<qd")
+        pairs.push((-1, 2.5))
+        assert pairs.pop() == (-1, 2.5)
+        scalars = make_queue(slots=2, fmt="<I")
+        scalars.push(7)
+        assert scalars.pop() == 7
+        assert scalars.slot_size == 4
+
+    def test_full_and_wraparound(self, make_queue):
+        """
+        Test the capacity limit and reuse of slots.
+
+        Parameters
+        ----------
+        make_queue : callable
+            Fixture creating queues.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies queue.Full and correct order after many wrap-arounds.
+        """
+        q = make_queue(slots=3, fmt="<q", lock=True)
+        for value in range(3):
+            q.push(value)
+        with pytest.raises(queue.Full):
+            q.push(3)
+        popped = []
+        for value in range(3, 50):
+            popped.append(q.pop())
+            q.push(value)
+        popped += [q.pop() for _ in range(3)]
+        assert popped == list(range(50))
+
+    def test_attach_and_pickle(self, make_queue):
+        """
+        Test opening the same queue by name and through pickling.
+
+        Parameters
+        ----------
+        make_queue : callable
+            Fixture creating queues.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that attached queues share the geometry and contents.
+        """
+        q = make_queue(slots=4, fmt="<i")
+        q.push(1)
+        q.push(2)
+        with SharedRingQueue.attach(q.name) as other:
+            assert (other.slots, other.fmt) == (4, "<i")
+            assert other.pop() == 1
+        with pickle.loads(pickle.dumps(q)) as copy:
+            assert copy.pop() == 2
+        assert len(q) == 0
+
+    def test_attach_keeps_creator_registration(self, tmp_path):
+        """
+        Test that attaching leaves the creator's tracker registration.
+
+        Parameters
+        ----------
+        tmp_path : pathlib.Path
+            Fixture providing a directory for the script.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Runs a script in a fresh interpreter in which a spawned child and
+        the creator itself attach to the queue before the creator unlinks
+        it. The resource tracker shares the script's stderr, which must not
+        show a tracker error such as a KeyError for the segment.
+        """
+        script = tmp_path / "spawn_attach.py"
+        script.write_text(_SPAWN_SCRIPT)
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run(
+            [sys.executable, str(script)],
+            capture_output=True, text=True, env=env, timeout=60,
+        )
+        assert result.returncode == 0, result.stderr
+        assert "resource_tracker" not in result.stderr
+        assert "KeyError" not in result.stderr
+
+    def test_invalid_geometry(self):
+        """
+        Test rejected constructor arguments.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that ValueError is raised before a segment is created.
+        """
+        with pytest.raises(ValueError):
+            SharedRingQueue(slots=0)
+        with pytest.raises(ValueError):
+            SharedRingQueue(slot_size=4)
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(),
+        reason="needs the fork start method",
+    )
+    def test_cross_process(self, make_queue):
+        """
+        Test a producer process feeding the parent.
+
+        Parameters
+        ----------
+        make_queue : callable
+            Fixture creating queues.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that every item arrives in order through a queue smaller
+        than the number of items.
+        """
+        q = make_queue(slots=8, slot_size=12)
+        count = 500
+        ctx = multiprocessing.get_context("fork")
+        producer = ctx.Process(target=_produce, args=(q, count))
+        producer.start()
+        received = []
+        while len(received) < count:
+            item = q.pop()
+            if item is not None:
+                received.append(item)
+        producer.join(timeout=10)
+        assert producer.exitcode == 0
+        assert received == [i.to_bytes(4, "little") * 2 for i in range(count)]
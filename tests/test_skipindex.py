@@ -0,0 +1,195 @@
+"""Test suite for the positional skip-list index.
+
+This module contains tests for SkipIndex, checking locate and rank against
+the actual chain after random insertions and removals.
+"""
+
+import random
+
+import pytest
+from pythondatastructures.nodes import SinglyLinkedNode
+from pythondatastructures.skipindex import SkipIndex
+from pythondatastructures.traversal import walk
+
+
+def _indexed_chain(size, **kwargs):
+    sentinel = SinglyLinkedNode("head")
+    index = SkipIndex(**kwargs)
+    for i in range(size):
+        node = SinglyLinkedNode(i)
+        sentinel.insert(node, i)
+        index.insert(i, node)
+    return sentinel, index
+
+
+class TestSkipIndex:
+    """Test cases for SkipIndex."""
+
+    def test_locate_and_rank(self):
+        """
+        Test positional lookup and rank on an appended chain.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies every position in both directions.
+        """
+        sentinel, index = _indexed_chain(300, seed=1)
+        assert len(index) == 300
+        for i, node in enumerate(walk(sentinel.next)):
+            assert index.locate(sentinel.next, i) is node
+            assert index.rank(node) == i
+
+    def test_locate_out_of_range(self):
+        """
+        Test lookups outside the chain.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that negative and too-large positions return None.
+        """
+        sentinel, index = _indexed_chain(5)
+        assert index.locate(sentinel.next, -1) is None
+        assert index.locate(sentinel.next, 5) is None
+
+    @pytest.mark.parametrize("p", [0.25, 0.5])
+    def test_random_edits(self, p):
+        """
+        Test that widths stay correct under random edits.
+
+        Parameters
+        ----------
+        p : float
+            Promotion probability of the index under test.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Inserts and removes at random positions and compares the index
+        with the chain at intervals.
+        """
+        rng = random.Random(3)
+        sentinel, index = _indexed_chain(0, p=p, seed=3)
+        size = 0
+        for step in range(1500):
+            if size and rng.random() < 0.4:
+                i = rng.randrange(size)
+                index.remove(i)
+                sentinel.pop(i)
+                size -= 1
+            else:
+                i = rng.randint(0, size)
+                node = SinglyLinkedNode(step)
+                index.insert(i, node)
+                sentinel.insert(node, i)
+                size += 1
+            if step % 100 == 0:
+                nodes = list(walk(sentinel.next))
+                assert len(index) == len(nodes) == size
+                for j, node in enumerate(nodes):
+                    assert index.locate(sentinel.next, j) is node
+                    assert index.rank(node) == j
+
+    def test_invalid_arguments(self):
+        """
+        Test argument validation.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the promotion probability and position range checks.
+        """
+        with pytest.raises(ValueError):
+            SkipIndex(p=1.0)
+        index = SkipIndex()
+        with pytest.raises(IndexError):
+            index.insert(1, SinglyLinkedNode(1))
+        with pytest.raises(IndexError):
+            index.remove(0)
+
+    def test_clear(self):
+        """
+        Test clearing the index.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that a cleared index covers an empty chain.
+        """
+        sentinel, index = _indexed_chain(10)
+        index.clear()
+        assert len(index) == 0
+        assert index.locate(sentinel.next, 0) is None
+
+
+class TestSkipIndexExtend:
+    """Test cases for SkipIndex.extend."""
+
+    def test_extend_matches_chain(self):
+        """
+        Test bulk appends followed by single edits.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies locate and rank after extending a non-empty index and
+        then inserting and removing in the middle.
+        """
+        sentinel, index = _indexed_chain(20, seed=5)
+        tail = sentinel
+        while tail.next is not None:
+            tail = tail.next
+        new = [SinglyLinkedNode(i) for i in range(20, 400)]
+        for node in new:
+            tail.next = node
+            tail = node
+        index.extend(new)
+        node = SinglyLinkedNode("x")
+        sentinel.insert(node, 100)
+        index.insert(100, node)
+        sentinel.pop(7)
+        index.remove(7)
+        nodes = list(walk(sentinel.next))
+        assert len(index) == len(nodes) == 400
+        for j, node in enumerate(nodes):
+            assert index.locate(sentinel.next, j) is node
+            assert index.rank(node) == j
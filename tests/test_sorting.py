@@ -0,0 +1,353 @@
+"""Test suite for the in-place linked-list merge sort.
+
+This module contains tests for the sorting module and for the ``sort``
+methods it backs, checking every list type against :func:`sorted`.
+"""
+
+import random
+from array import array
+
+import pytest
+from pythondatastructures.doublylinked import DoublyLinkedList
+from pythondatastructures.linkedlist import LinkedList
+from pythondatastructures.nodes import DoublyLinkedNode, SinglyLinkedNode
+from pythondatastructures.old import advLinkedList
+from pythondatastructures.old.Actual import LL
+from pythondatastructures.sorting import merge_sort, sort_chain
+
+CASES = [
+    [],
+    [1],
+    [2, 1],
+    list(range(50)),
+    list(range(50, 0, -1)),
+    [3, 1, 2] * 20,
+    [random.Random(seed).randrange(30) for seed in range(300)],
+]
+
+
+def _chain(values):
+    head = tail = None
+    for value in values:
+        node = SinglyLinkedNode(value)
+        if tail is None:
+            head = node
+        else:
+            tail.next = node
+        tail = node
+    return head
+
+
+def _records(size, seed=0):
+    """Return (key, serial) pairs with many repeated keys."""
+    rng = random.Random(seed)
+    return [(rng.randrange(5), serial) for serial in range(size)]
+
+
+class TestSortChain:
+    """Test cases for sort_chain on bare node chains."""
+
+    @pytest.mark.parametrize("values", CASES)
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_matches_sorted(self, values, reverse):
+        """
+        Test that the sorted chain matches sorted().
+
+        Parameters
+        ----------
+        values : list
+            Values to sort.
+        reverse : bool
+            Whether to sort in descending order.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the order and the returned tail.
+        """
+        head, tail = sort_chain(_chain(values), reverse=reverse)
+        expected = sorted(values, reverse=reverse)
+        if not values:
+            assert (head, tail) == (None, None)
+            return
+        assert list(head.values()) == expected
+        assert tail.next is None
+        assert tail.value == expected[-1]
+
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_stable(self, reverse):
+        """
+        Test that equal keys keep their original order.
+
+        Parameters
+        ----------
+        reverse : bool
+            Whether to sort in descending order.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the result against sorted() with the same key, which is
+        stable in both directions.
+        """
+        records = _records(500)
+        head, _ = sort_chain(_chain(records), key=lambda r: r[0],
+                             reverse=reverse)
+        assert list(head.values()) == sorted(records, key=lambda r: r[0],
+                                             reverse=reverse)
+
+    def test_key_called_once_per_node(self):
+        """
+        Test that the key function runs once per node.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that, as with sorted(), the number of key calls equals the
+        number of nodes rather than the number of comparisons.
+        """
+        calls = []
+
+        def key(record):
+            calls.append(record)
+            return record[0]
+
+        records = _records(500, seed=2)
+        head, _ = sort_chain(_chain(records), key=key)
+        assert list(head.values()) == sorted(records, key=lambda r: r[0])
+        assert sorted(calls) == sorted(records)
+
+    def test_relinks_existing_nodes(self):
+        """
+        Test that the sort moves nodes rather than values.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that each node keeps its value and the node set is
+        unchanged.
+        """
+        head = _chain([3, 1, 2])
+        nodes = {node.value: node for node in head}
+        head, _ = sort_chain(head)
+        assert [node for node in head] == [nodes[1], nodes[2], nodes[3]]
+
+    def test_long_chain(self):
+        """
+        Test sorting a chain far longer than the recursion limit.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that no RecursionError is raised.
+        """
+        rng = random.Random(5)
+        values = [rng.random() for _ in range(50_000)]
+        head, _ = sort_chain(_chain(values))
+        assert list(head.values()) == sorted(values)
+
+    def test_large_int_sentinel(self):
+        """
+        Test index links ended by an int outside the small-int cache.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that the end marker is recognised by equality, since
+        links read back from an array are fresh int objects.
+        """
+        values = [5, 3, 9, 1, 7, 2]
+        nil = int("1000000")
+        nxt = array("q", list(range(1, len(values))) + [nil])
+        head, tail = merge_sort(0, nil, nxt.__getitem__, nxt.__setitem__,
+                                values.__getitem__, is_nil=nil.__eq__)
+        order = []
+        while head != nil:
+            order.append(values[head])
+            head = nxt[head]
+        assert order == sorted(values) and values[tail] == 9
+
+
+class TestSortMethods:
+    """Test cases for the sort methods of each list type."""
+
+    def test_singly_and_doubly_linked_nodes(self):
+        """
+        Test sorting the nodes after a head node.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that the head stays first and that prev links are
+        rebuilt for doubly-linked nodes.
+        """
+        for cls in (SinglyLinkedNode, DoublyLinkedNode):
+            head = cls("head")
+            for value in (3, 1, 2):
+                head.append(cls(value))
+            head.sort(reverse=True)
+            assert list(head.values()) == ["head", 3, 2, 1]
+        node = head
+        while node.next is not None:
+            assert node.next.prev is node
+            node = node.next
+
+    def test_linked_list(self):
+        """
+        Test sorting the array-backed LinkedList.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies stability, that head, tail and the free-list remain
+        usable afterwards, and that the key runs once per element.
+        """
+        records = _records(200, seed=1)
+        ll = LinkedList(records)
+        ll.pop_value(records[10])
+        del records[10]
+        ll.sort(key=lambda r: r[0])
+        assert list(ll) == sorted(records, key=lambda r: r[0])
+        ll.append((9, -1))
+        ll.insert((-1, -1))
+        assert list(ll)[0] == (-1, -1) and list(ll)[-1] == (9, -1)
+        assert ll.dequeue() == (9, -1)
+        calls = []
+        ll.sort(key=lambda r: calls.append(r) or r[1])
+        assert len(calls) == len(ll)
+
+    def test_doubly_linked_list(self):
+        """
+        Test sorting DoublyLinkedList.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies both iteration orders and that held nodes stay valid.
+        """
+        dl = DoublyLinkedList()
+        nodes = [dl.append(value) for value in (5, 3, 4, 1, 2)]
+        dl.sort()
+        assert list(dl) == [1, 2, 3, 4, 5]
+        assert list(reversed(dl)) == [5, 4, 3, 2, 1]
+        dl.move_to_end(nodes[3])
+        assert dl.remove(nodes[0]) == 5
+        assert list(dl) == [2, 3, 4, 1]
+        DoublyLinkedList([1]).sort()
+
+    @pytest.mark.parametrize("indexed", [False, True])
+    def test_adv_linked_list(self, indexed):
+        """
+        Test sorting advLinkedList with and without its indexes.
+
+        Parameters
+        ----------
+        indexed : bool
+            Whether the skip and value indexes are enabled.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the order, left links and lookups through the indexes.
+        """
+        values = [random.Random(seed).randrange(100) for seed in range(200)]
+        adv = advLinkedList(skipindex=indexed, valueindex=indexed)
+        adv.extend(values)
+        adv.sort()
+        expected = sorted(values)
+        assert [adv.valAtIndex(i) for i in range(len(values))] == expected
+        assert adv.root.left is None
+        node = adv.root
+        while node.right is not None:
+            assert node.right.left is node
+            node = node.right
+        assert adv.indexOfVal(expected[50]) == expected.index(expected[50])
+        advLinkedList().sort()
+
+    @pytest.mark.parametrize("positions", [None, "lazy", "eager"])
+    def test_actual_ll(self, positions):
+        """
+        Test sorting old.Actual.LL with each position mode.
+
+        Parameters
+        ----------
+        positions : str or None
+            The position tracking mode.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the order, the new root, prev links, idx and the value
+        index.
+        """
+        values = [9, 4, 7, 1, 8, 2]
+        ll = LL.from_iterable(values, positions=positions, values=True)
+        ll.sort()
+        assert list(ll.values()) == sorted(values)
+        assert ll.root.value == 1 and ll.root.prev is None
+        assert [node.value for node in reversed(ll)] == sorted(values)[::-1]
+        assert [node.idx for node in ll] == list(range(len(values)))
+        assert ll.get(7).idx == 3
+        ll.append(0)
+        assert list(ll.values())[-1] == 0
@@ -0,0 +1,378 @@
+"""Test suite for the shared iterative traversal primitives.
+
+This module contains tests for walk, find, nth and last over chains linked
+through different attribute names, including chains far longer than the
+interpreter recursion limit, and for cycle detection and the cycle-safe
+traversal modes.
+"""
+
+import sys
+
+import pytest
+from pythondatastructures.instrumentation import collect
+from pythondatastructures.nodes import SinglyLinkedNode
+from pythondatastructures.old import llnode
+from pythondatastructures.traversal import (
+    CycleInfo,
+    detect_cycle,
+    find,
+    last,
+    length,
+    nth,
+    walk,
+)
+
+LONG_CHAIN = sys.getrecursionlimit() * 20
+
+
+def _chain(size):
+    head = tail = SinglyLinkedNode(0)
+    for value in range(1, size):
+        tail.next = SinglyLinkedNode(value)
+        tail = tail.next
+    return head
+
+
+def _rho(tail, cycle):
+    """Return a chain of ``tail`` nodes leading into a loop of ``cycle``."""
+    head = _chain(tail + cycle)
+    if cycle:
+        end, _ = last(head)
+        end.next = nth(head, tail)
+    return head
+
+
+class TestWalk:
+    """Test cases for walk."""
+
+    def test_walk_yields_every_node(self):
+        """
+        Test that walk visits the chain in order.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that the start node is included.
+        """
+        assert [n.value for n in walk(_chain(4))] == [0, 1, 2, 3]
+
+    def test_walk_none(self):
+        """
+        Test walking from None.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that nothing is yielded for an empty chain.
+        """
+        assert list(walk(None)) == []
+
+    def test_walk_custom_link(self):
+        """
+        Test walking through a differently named link.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that llnode chains are walked through ``right``.
+        """
+        a, b = llnode("a"), llnode("b")
+        a.right = b
+        assert [n.value for n in walk(a, "right")] == ["a", "b"]
+
+
+class TestFind:
+    """Test cases for find."""
+
+    def test_find_returns_node_and_hops(self):
+        """
+        Test finding a value in the chain.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the returned node and its distance from the start.
+        """
+        node, hops = find(_chain(5), 3)
+        assert node.value == 3
+        assert hops == 3
+
+    def test_find_missing_value(self):
+        """
+        Test searching for a value that is not present.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the ``(None, -1)`` sentinel result.
+        """
+        assert find(_chain(3), 10) == (None, -1)
+        assert find(None, 10) == (None, -1)
+
+
+class TestNthAndLast:
+    """Test cases for nth and last."""
+
+    def test_nth(self):
+        """
+        Test positional access.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies zero hops, in-range hops and hops past the end.
+        """
+        head = _chain(3)
+        assert nth(head, 0) is head
+        assert nth(head, 2).value == 2
+        assert nth(head, 3) is None
+        assert nth(head, 10) is None
+
+    def test_nth_negative_raises(self):
+        """
+        Test that negative hop counts are rejected.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that a ValueError is raised.
+        """
+        with pytest.raises(ValueError):
+            nth(_chain(1), -1)
+
+    def test_last(self):
+        """
+        Test locating the tail.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the tail and its distance, including a single node and
+        an empty chain.
+        """
+        tail, hops = last(_chain(4))
+        assert tail.value == 3
+        assert hops == 3
+        single = SinglyLinkedNode(1)
+        assert last(single) == (single, 0)
+        assert last(None) == (None, -1)
+
+    def test_long_chain(self):
+        """
+        Test chains much longer than the recursion limit.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that every primitive completes without RecursionError.
+        """
+        head = _chain(LONG_CHAIN)
+        assert sum(1 for _ in walk(head)) == LONG_CHAIN
+        assert find(head, LONG_CHAIN - 1)[1] == LONG_CHAIN - 1
+        assert nth(head, LONG_CHAIN - 1).value == LONG_CHAIN - 1
+        assert last(head)[1] == LONG_CHAIN - 1
+
+
+class TestCycles:
+    """Test cases for detect_cycle, length and the safe modes."""
+
+    @pytest.mark.parametrize("tail", [0, 1, 2, 7, 64])
+    @pytest.mark.parametrize("cycle", [0, 1, 2, 3, 63, 64, 65])
+    def test_detect_cycle_shapes(self, tail, cycle):
+        """
+        Test measuring chains of every small shape.
+
+        Parameters
+        ----------
+        tail : int
+            Number of nodes before the cycle.
+        cycle : int
+            Number of nodes on the cycle (0 for an acyclic chain).
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the entry, both lengths and length().
+        """
+        if tail + cycle == 0:
+            assert detect_cycle(None) == CycleInfo(None, 0, 0)
+            assert length(None) == 0
+            return
+        head = _rho(tail, cycle)
+        info = detect_cycle(head)
+        assert info.tail_length == tail and info.cycle_length == cycle
+        if cycle:
+            assert info.entry is nth(head, tail)
+        else:
+            assert info.entry is None
+        assert length(head) == info.total == tail + cycle
+
+    def test_safe_walk_and_last(self):
+        """
+        Test that the safe modes stop at the cycle entry.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies each node is yielded once and that last returns the node
+        linking back to the entry. Acyclic chains behave as before.
+        """
+        head = _rho(3, 4)
+        assert [node.value for node in walk(head, safe=True)] == list(range(7))
+        tail, hops = last(head, safe=True)
+        assert tail.value == 6 and tail.next.value == 3 and hops == 6
+        straight = _chain(5)
+        assert list(walk(straight, safe=True)) == list(walk(straight))
+        assert last(straight, safe=True) == last(straight)
+        assert list(walk(None, safe=True)) == []
+        assert last(None, safe=True) == (None, -1)
+
+    def test_safe_find(self):
+        """
+        Test searching cyclic chains.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that every node is found at its distance and that a
+        missing value ends the search.
+        """
+        for tail, cycle in ((0, 1), (2, 5), (5, 2), (10, 33)):
+            head = _rho(tail, cycle)
+            for value in range(tail + cycle):
+                match, hops = find(head, value, safe=True)
+                assert match.value == value and hops == value
+            assert find(head, -1, safe=True) == (None, -1)
+        assert find(None, 0, safe=True) == (None, -1)
+        assert find(_chain(4), 9, safe=True) == (None, -1)
+
+    def test_custom_link_and_long_cycle(self):
+        """
+        Test cycles through other link names and longer than the
+        recursion limit.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the two-node loop that old.llnode chains can form and a
+        loop of LONG_CHAIN nodes.
+        """
+        first, second = llnode(1), llnode(2)
+        first.right, second.right = second, first
+        assert detect_cycle(first, "right") == CycleInfo(first, 0, 2)
+        assert find(first, 3, "right", safe=True) == (None, -1)
+        head = _rho(5, LONG_CHAIN)
+        assert length(head) == LONG_CHAIN + 5
+        assert find(head, LONG_CHAIN + 4, safe=True)[1] == LONG_CHAIN + 4
+
+    def test_hops_reported(self):
+        """
+        Test the hop events of the cycle checks.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that an acyclic chain is read once and that a cyclic one
+        costs a bounded number of reads.
+        """
+        straight, cyclic = _chain(100), _rho(30, 70)
+        with collect() as stats:
+            detect_cycle(straight)
+        assert stats["hop"] == 100
+        with collect() as stats:
+            detect_cycle(cyclic)
+        assert 100 < stats["hop"] <= 4 * 100
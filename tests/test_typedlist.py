@@ -0,0 +1,202 @@
+"""Test suite for the array-backed typed numeric list.
+
+This module contains tests for TypedList, covering the value-based list
+contract, the aggregate helpers and the NumPy round trip.
+"""
+
+import random
+
+import pytest
+from pythondatastructures.nodes import SinglyLinkedNode
+from pythondatastructures.typedlist import TYPECODES, TypedList
+
+
+class TestTypedList:
+    """Test cases for TypedList storage and the list contract."""
+
+    def test_construction(self):
+        """
+        Test building lists of several typecodes.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies values, typecode, itemsize, repr and rejected typecodes.
+        """
+        tl = TypedList("i", range(3))
+        assert list(tl) == [0, 1, 2]
+        assert tl.typecode == "i" and tl.itemsize == 4
+        assert repr(tl) == "TypedList('i', [0, 1, 2])"
+        assert list(TypedList()) == []
+        for typecode in ("u", "x", "qd", ""):
+            with pytest.raises(ValueError):
+                TypedList(typecode)
+
+    def test_contract(self):
+        """
+        Test insert, append, pop, pop_value and dequeue.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies positions, node values, the None results and bounds
+        checks.
+        """
+        tl = TypedList("q", [1, 3])
+        tl.insert(0)
+        tl.insert(2, relative_index=2)
+        tl.append(SinglyLinkedNode(4))
+        assert list(tl) == [0, 1, 2, 3, 4]
+        assert tl[-1] == 4 and 3 in tl and 9 not in tl
+        assert tl.pop(2) == 2
+        assert tl.pop(len(tl)) is None
+        assert tl.pop_value(3) == 3
+        assert tl.pop_value(9) is None
+        assert tl.dequeue() == 4
+        assert tl.dequeue(direct=True) == 0
+        assert list(tl) == [1]
+        with pytest.raises(ValueError):
+            tl.insert(5, relative_index=3)
+        with pytest.raises(ValueError):
+            tl.pop(-1)
+        with pytest.raises(IndexError):
+            tl[5]
+        with pytest.raises(TypeError):
+            tl.append(1.5)
+        with pytest.raises(OverflowError):
+            TypedList("b").append(1000)
+        tl.clear()
+        assert tl.dequeue() is None
+
+    def test_extend_and_sort(self):
+        """
+        Test block extension and sorting.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies extending from another TypedList and from a generator,
+        and sorting with key and reverse.
+        """
+        tl = TypedList("d", [2.0, 1.0])
+        tl.extend(TypedList("d", [3.0]))
+        tl.extend(x / 2 for x in range(2))
+        assert list(tl) == [2.0, 1.0, 3.0, 0.0, 0.5]
+        tl.sort(reverse=True)
+        assert list(tl) == [3.0, 2.0, 1.0, 0.5, 0.0]
+        tl.sort(key=lambda v: abs(v - 1))
+        assert list(tl)[0] == 1.0
+
+    def test_aggregates(self):
+        """
+        Test sum, min, max and index against the list equivalents.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies results on random data and the errors on missing values
+        and empty lists.
+        """
+        rng = random.Random(4)
+        values = [rng.randrange(-1000, 1000) for _ in range(500)]
+        tl = TypedList("l", values)
+        assert tl.sum() == sum(values)
+        assert tl.min() == min(values) and tl.max() == max(values)
+        target = values[123]
+        assert tl.index(target) == values.index(target)
+        later = values[300]
+        assert tl.index(later, 200) == values.index(later, 200)
+        with pytest.raises(ValueError):
+            tl.index(5000)
+        with pytest.raises(ValueError):
+            TypedList().min()
+
+
+class TestTypedListNumpy:
+    """Test cases for the NumPy round trip."""
+
+    @pytest.mark.parametrize("typecode", list(TYPECODES))
+    def test_round_trip(self, typecode):
+        """
+        Test converting to NumPy and back for every typecode.
+
+        Parameters
+        ----------
+        typecode : str
+            The array typecode under test.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the dtype, the values and that the arrays do not share
+        memory with the list.
+        """
+        np = pytest.importorskip("numpy")
+        tl = TypedList(typecode, range(10))
+        arr = tl.to_numpy()
+        assert arr.dtype == np.dtype(typecode)
+        assert arr.tolist() == list(range(10))
+        tl.append(10)
+        assert len(arr) == 10
+        back = TypedList.from_numpy(arr)
+        assert back.typecode == np.dtype(typecode).char
+        assert list(back) == list(range(10))
+
+    def test_from_numpy_conversions(self):
+        """
+        Test building from arrays that need conversion.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies strided input, an explicit typecode, and the errors for
+        unsupported dtypes and shapes.
+        """
+        np = pytest.importorskip("numpy")
+        strided = np.arange(10, dtype=np.int64)[::3]
+        assert list(TypedList.from_numpy(strided)) == [0, 3, 6, 9]
+        floats = TypedList.from_numpy(np.array([1, 2]), typecode="d")
+        assert list(floats) == [1.0, 2.0]
+        assert len(TypedList.from_numpy(np.array([], dtype="d"))) == 0
+        with pytest.raises(TypeError):
+            TypedList.from_numpy(np.array([True, False]))
+        with pytest.raises(ValueError):
+            TypedList.from_numpy(np.zeros((2, 2)))
@@ -0,0 +1,305 @@
+"""Test suite for the unrolled linked list.
+
+This module contains tests for UnrolledLinkedList, covering the DirectedNode
+method contract, positional access and block splitting and merging.
+"""
+
+import random
+
+import pytest
+from pythondatastructures.nodes import SinglyLinkedNode
+from pythondatastructures.unrolled import UnrolledLinkedList
+
+
+def _blocks(ul):
+    """Return the block contents of ``ul`` as a list of lists."""
+    blocks = []
+    block = ul._head
+    while block is not None:
+        blocks.append(list(block.value))
+        block = block.next
+    return blocks
+
+
+class TestUnrolledConstruction:
+    """Test cases for UnrolledLinkedList construction."""
+
+    def test_empty_list(self):
+        """
+        Test creation of an empty list.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that a new list is empty and holds no blocks.
+        """
+        ul = UnrolledLinkedList()
+        assert len(ul) == 0
+        assert list(ul) == []
+        assert ul.block_count == 0
+
+    def test_appends_fill_blocks(self):
+        """
+        Test that appending packs values into full blocks.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that n appended values use ceil(n / block_size) blocks.
+        """
+        ul = UnrolledLinkedList(range(10), block_size=4)
+        assert _blocks(ul) == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+        assert repr(ul) == f"UnrolledLinkedList({list(range(10))!r})"
+
+    def test_invalid_block_size(self):
+        """
+        Test that a block size below two is rejected.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that ValueError is raised.
+        """
+        with pytest.raises(ValueError):
+            UnrolledLinkedList(block_size=1)
+
+    def test_none_value_raises(self):
+        """
+        Test that None values are rejected.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that TypeError is raised and node values are unwrapped.
+        """
+        ul = UnrolledLinkedList()
+        with pytest.raises(TypeError):
+            ul.append(None)
+        ul.append(SinglyLinkedNode("a"))
+        assert list(ul) == ["a"]
+
+
+class TestUnrolledContract:
+    """Test cases for the DirectedNode method contract."""
+
+    def test_insert_positions(self):
+        """
+        Test insertion at relative indexes.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies front, middle and end insertion and the bounds check.
+        """
+        ul = UnrolledLinkedList([1, 3], block_size=2)
+        ul.insert(0)
+        ul.insert(2, relative_index=2)
+        ul.insert(4, relative_index=4)
+        assert list(ul) == [0, 1, 2, 3, 4]
+        with pytest.raises(ValueError):
+            ul.insert(5, relative_index=6)
+        with pytest.raises(ValueError):
+            ul.insert(5, relative_index=-1)
+
+    def test_insert_splits_full_block(self):
+        """
+        Test that overflowing a block splits it in half.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies the block layout after a split.
+        """
+        ul = UnrolledLinkedList([0, 1, 2, 3], block_size=4)
+        ul.insert("x", relative_index=2)
+        assert _blocks(ul) == [[0, 1], ["x", 2, 3]]
+
+    def test_pop_and_dequeue(self):
+        """
+        Test removal by position and from either end.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies returned values, the None sentinel and empty dequeue.
+        """
+        ul = UnrolledLinkedList(range(6), block_size=2)
+        assert ul.pop() == 0
+        assert ul.pop(2) == 3
+        assert ul.pop(len(ul)) is None
+        assert ul.dequeue() == 5
+        assert ul.dequeue(direct=True) == 1
+        assert list(ul) == [2, 4]
+        ul.clear()
+        assert ul.dequeue() is None
+        with pytest.raises(ValueError):
+            ul.pop(1)
+
+    def test_pop_value(self):
+        """
+        Test removal by value.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that the first match is removed and misses return None.
+        """
+        ul = UnrolledLinkedList([1, 2, 1, 3], block_size=2)
+        assert ul.pop_value(1) == 1
+        assert list(ul) == [2, 1, 3]
+        assert ul.pop_value(9) is None
+
+    def test_underflow_merges_blocks(self):
+        """
+        Test that removals merge sparse neighbouring blocks.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies borrowing from a fuller successor, merging into one
+        block and unlinking blocks that become empty.
+        """
+        ul = UnrolledLinkedList(range(8), block_size=4)
+        for _ in range(3):
+            ul.pop(0)
+        assert _blocks(ul) == [[3, 4], [5, 6, 7]]
+        ul.pop(0)
+        assert _blocks(ul) == [[4, 5, 6, 7]]
+        ul.dequeue()
+        ul.dequeue()
+        ul.dequeue()
+        ul.dequeue()
+        assert _blocks(ul) == []
+        assert ul.dequeue() is None
+
+
+class TestUnrolledAccess:
+    """Test cases for positional access and randomized edits."""
+
+    def test_getitem(self):
+        """
+        Test positional access.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies positive and negative indexes and IndexError.
+        """
+        ul = UnrolledLinkedList(range(100), block_size=8)
+        assert ul[0] == 0
+        assert ul[57] == 57
+        assert ul[-1] == 99
+        with pytest.raises(IndexError):
+            ul[100]
+        with pytest.raises(IndexError):
+            ul[-101]
+
+    def test_random_edits_match_list(self):
+        """
+        Test random insertions and removals against a Python list.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies contents, length and that no block is empty or over
+        capacity after every edit.
+        """
+        rng = random.Random(7)
+        ul = UnrolledLinkedList(block_size=5)
+        model = []
+        for step in range(2000):
+            choice = rng.random()
+            if choice < 0.5 or not model:
+                index = rng.randint(0, len(model))
+                ul.insert(step, relative_index=index)
+                model.insert(index, step)
+            elif choice < 0.8:
+                index = rng.randrange(len(model))
+                assert ul.pop(index) == model.pop(index)
+            elif choice < 0.9:
+                value = rng.choice(model)
+                assert ul.pop_value(value) == value
+                model.remove(value)
+            else:
+                assert ul.dequeue() == model.pop()
+            assert len(ul) == len(model)
+            assert all(0 < len(b) <= 5 for b in _blocks(ul))
+        assert list(ul) == model
+        assert [ul[i] for i in range(len(model))] == model
@@ -0,0 +1,116 @@
+"""Test suite for the value-to-node hash index.
+
+This module contains tests for ValueIndex, including duplicate values and
+values that cannot be hashed.
+"""
+
+from pythondatastructures.nodes import SinglyLinkedNode
+from pythondatastructures.valueindex import ValueIndex
+
+
+class TestValueIndex:
+    """Test cases for ValueIndex."""
+
+    def test_lookup_and_membership(self):
+        """
+        Test basic lookups.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies first, nodes and membership for present and missing
+        values.
+        """
+        a, b = SinglyLinkedNode("a"), SinglyLinkedNode("b")
+        index = ValueIndex([a, b])
+        assert len(index) == 2
+        assert index.first("a") is a
+        assert index.nodes("b") == [b]
+        assert "c" not in index
+        assert index.first("c") is None
+        assert index.nodes("c") == []
+
+    def test_duplicates_keep_insertion_order(self):
+        """
+        Test buckets holding several nodes with equal values.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies bucket order and that discarding one duplicate leaves
+        the others indexed.
+        """
+        first, second, third = (SinglyLinkedNode(1) for _ in range(3))
+        index = ValueIndex([first, second, third])
+        assert index.nodes(1) == [first, second, third]
+        index.discard(first)
+        assert index.first(1) is second
+        index.discard(second)
+        index.discard(third)
+        assert 1 not in index
+        assert len(index) == 0
+
+    def test_add_and_discard_are_idempotent(self):
+        """
+        Test repeated add and discard calls.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that the size only counts distinct nodes.
+        """
+        node = SinglyLinkedNode(5)
+        index = ValueIndex()
+        index.add(node)
+        index.add(node)
+        assert len(index) == 1
+        index.discard(node)
+        index.discard(node)
+        assert len(index) == 0
+
+    def test_unhashable_values(self):
+        """
+        Test nodes holding unhashable values.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Verifies that unhashable values are indexed and found by
+        equality.
+        """
+        node = SinglyLinkedNode([1, 2])
+        index = ValueIndex([node])
+        assert [1, 2] in index
+        assert index.nodes([1, 2]) == [node]
+        assert [3] not in index
+        index.discard(node)
+        assert [1, 2] not in index
+        assert len(index) == 0